@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import re
+from functools import lru_cache
 from typing import cast, List, Set, Tuple
 
 from utils.exceptions import ApplicationException
@@ -109,7 +110,12 @@ def current_configuration_manager() -> ConfigurationManager:
 
 
 def p4studio_arg_to_config_option(arg: str) -> ConfigOption:
-    return current_configuration_manager().p4studio_arg_to_config_option(arg)
+    return _p4studio_arg_to_config_option(current_configuration_manager(), arg)
+
+
+@lru_cache(maxsize=None)
+def _p4studio_arg_to_config_option(config_manager: ConfigurationManager, arg: str) -> ConfigOption:
+    return config_manager.p4studio_arg_to_config_option(arg)
 
 
 def config_option(name: str, value: bool) -> ConfigOption:
@@ -18,6 +18,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from functools import lru_cache
 from typing import List, Tuple
 
 import click
@@ -29,13 +30,18 @@ from utils.log import logging_options
 from utils.terminal import print_green
 from workspace import current_workspace, in_workspace
 from .cmake import cmake, BUILD_TYPES
-from .configuration_manager import current_configuration_manager
+from .configuration_manager import ConfigurationManager, current_configuration_manager
 
 
 def _allowed_options() -> List[str]:
     if not in_workspace():
         return []
-    options = current_configuration_manager().known_p4studio_options_including_negated()
+    return _allowed_options_of(current_configuration_manager())
+
+
+@lru_cache(maxsize=1)
+def _allowed_options_of(config_manager: ConfigurationManager) -> List[str]:
+    options = config_manager.known_p4studio_options_including_negated()
     return sorted(options, key=lambda x: x.replace("^", "z"))
 
 
@@ -15,8 +15,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
+import platform
+import time
 from os.path import join, exists
 from pathlib import Path
+from shutil import which
 
 from dependencies.source.source_dependency_config import SourceDependencyConfig
 from utils.processes import execute
@@ -26,22 +30,97 @@ def download_libcli(config: SourceDependencyConfig) -> None:
     version = config.dependency_manager().source_dependency_attributes("libcli")['version']
     repo_dir = config.download_dir(ensure_exists=False)
     if not repo_dir.exists():
-        execute("git clone https://github.com/dparrish/libcli {}".format(repo_dir))
-        execute("git -c advice.detachedHead=false checkout V{}".format(version), repo_dir)
+        execute("git -c advice.detachedHead=false clone --depth 1 --single-branch --branch V{} "
+                "https://github.com/dparrish/libcli {}".format(version, repo_dir))
 
 
 def install_libcli(config: SourceDependencyConfig) -> None:
     version = config.dependency_manager().source_dependency_attributes("libcli")['version']
 
-    if not config.force and _is_libcli_installed(config.install_dir, version):
+    download_dir = config.download_dir(ensure_exists=False)
+    if not config.force and _is_libcli_installed(config.install_dir, version, download_dir):
         return
 
     download_libcli(config)
-    build_dir = config.build_dir(copy_download_dir=True)
-    execute("make -j{}".format(config.jobs), build_dir)
-    execute('make PREFIX={} install -j{}'.format(config.install_dir, config.jobs), build_dir)
-    execute("sudo ldconfig")
+    cache_dir = _artifact_cache_dir(version, download_dir)
+    if config.force or not cache_dir.exists():
+        build_dir = config.build_dir(copy_download_dir=True)
+        # install to a temporary prefix first, so interrupted install is never taken from cache
+        partial_cache_dir = cache_dir.with_name(cache_dir.name + ".partial")
+        execute("rm -rf {} {}".format(partial_cache_dir, cache_dir))
+        # install target of libcli depends on the libraries, so it builds them as well
+        execute('make PREFIX={} install -j{}'.format(partial_cache_dir, config.jobs), build_dir)
+        execute("mv {} {}".format(partial_cache_dir, cache_dir))
+    execute("mkdir -p {}".format(config.install_dir))
+    # cp -a keeps the mtimes of the cache, so the ld.so.cache is compared with the copy time
+    copy_time = time.time()
+    execute("cp -a {}/. {}".format(cache_dir, config.install_dir))
+    if _is_ldconfig_cache_stale(copy_time):
+        execute("sudo ldconfig")
+    _stamp_file(config.install_dir).write_text(_stamp(version, download_dir))
 
 
-def _is_libcli_installed(path: Path, version: str) -> bool:
-    return (path / "lib/libcli.so.{}".format(version)).exists()
+def _is_libcli_installed(path: Path, version: str, download_dir: Path) -> bool:
+    if not (path / "lib/libcli.so.{}".format(version)).exists():
+        return False
+    stamp_file = _stamp_file(path)
+    if not stamp_file.exists():
+        return False
+    installed_version, _, installed_sources = stamp_file.read_text().strip().partition(' ')
+    if installed_version != version:
+        return False
+    # sources may be already cleaned up, compare them only when still present
+    if not download_dir.exists():
+        return True
+    installed_sources, _, sources_mtime = installed_sources.partition(' ')
+    # sources are hashed only when the download dir was modified since the install
+    if sources_mtime == str(download_dir.stat().st_mtime_ns):
+        return True
+    return installed_sources == _sources_hash(download_dir)
+
+
+def _artifact_cache_dir(version: str, download_dir: Path) -> Path:
+    """
+    Build artifacts are keyed by libcli sources and toolchain,
+    so they can be reused between workspaces and install dirs.
+    """
+    key = "{}-{}-{}-{}-{}".format(
+        version,
+        platform.system(),
+        platform.machine(),
+        _sources_hash(download_dir)[:8],
+        _toolchain_hash()[:8]
+    )
+    return Path.home() / ".cache/p4studio/libcli" / key
+
+
+def _toolchain_hash() -> str:
+    gcc = which("gcc")
+    if gcc is None:
+        return "none"
+    return hashlib.sha256(Path(gcc).resolve().read_bytes()).hexdigest()
+
+
+def _is_ldconfig_cache_stale(install_time: float) -> bool:
+    ld_cache = Path('/etc/ld.so.cache')
+    if not ld_cache.exists():
+        return True
+    return ld_cache.stat().st_mtime < install_time
+
+
+def _stamp_file(install_dir: Path) -> Path:
+    return install_dir / '.libcli.stamp'
+
+
+def _stamp(version: str, download_dir: Path) -> str:
+    return "{} {} {}\n".format(version, _sources_hash(download_dir), download_dir.stat().st_mtime_ns)
+
+
+def _sources_hash(download_dir: Path) -> str:
+    sha = hashlib.sha256()
+    for file in sorted(download_dir.rglob('*')):
+        relative_path = file.relative_to(download_dir)
+        if file.is_file() and '.git' not in relative_path.parts:
+            sha.update(str(relative_path).encode())
+            sha.update(file.read_bytes())
+    return sha.hexdigest()
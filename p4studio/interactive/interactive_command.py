@@ -21,14 +21,13 @@ import os
 from typing import List, Tuple
 
 import click
-import yaml
 from click import Context
 from inquirer.errors import ValidationError
 
 from build.targets import get_switch_profiles_by_arch, all_switch_profiles
 from config.configuration_manager import current_configuration_manager
 from interactive.input_validation import validate_path_to_write, validate_kernel_headers_input, validate_file_to_read
-from profile.profile import Profile
+from profile.profile import Profile, dump_profile
 from profile.profile_command import execute_plan
 from profile.profile_execution_plan import ProfileExecutionPlan
 from system.check_system_utils import print_multiple_checks
@@ -133,7 +132,7 @@ def interactive_command(context: Context) -> None:
             profile.disable(option)
 
     click.echo("Based on your selections the following SDE configuration profile was created: \n\n{}".format(
-        yaml.dump(profile.raw))
+        dump_profile(profile.raw))
     )
 
     if list_confirm('Do you want to write it to a file for future use?', default=False):
@@ -145,7 +144,7 @@ def interactive_command(context: Context) -> None:
         else:
             path_to_write = ensure_path_is_absolute(path_to_write)
         with open(path_to_write, "w") as file:
-            file.write(yaml.dump(profile.raw))
+            dump_profile(profile.raw, file)
         echo_separator()
         click.echo('Profile saved in {}'.format(path_to_write))
         print_profile_command(filename_or_path)
@@ -23,6 +23,7 @@ from typing import Union, BinaryIO, TextIO, Optional, Dict, List, Set, cast
 import yaml
 from jsonschema import validate, ValidationError
 from yaml.parser import ParserError
+from yaml.representer import SafeRepresenter
 
 from config.config_option_utils import is_parent_option
 from config.configuration_manager import current_configuration_manager, ConfigurationManager, config_option
@@ -32,6 +33,12 @@ from profile.profile_schema import create_profile_schema
 from utils.collections import nested_get, nested_set
 from utils.exceptions import ApplicationException
 
+# PyYAML built without libyaml has no C dumper
+try:
+    from yaml import CSafeDumper as _ProfileDumper
+except ImportError:
+    from yaml import SafeDumper as _ProfileDumper  # type: ignore
+
 
 def load_profile_from_file(file: Union[bytes, str, BinaryIO, TextIO]) -> 'Profile':
     try:
@@ -46,6 +53,10 @@ def load_profile_from_file(file: Union[bytes, str, BinaryIO, TextIO]) -> 'Profil
     return Profile(current_configuration_manager(), yaml_content)
 
 
+def dump_profile(raw: OrderedDict, stream: Optional[TextIO] = None) -> Optional[str]:
+    return yaml.dump(raw, stream, Dumper=_ProfileDumper, default_flow_style=False)
+
+
 class Profile:
     def __init__(self, configuration_manager: ConfigurationManager, raw: Optional[OrderedDict] = None):
         self._configuration_manager = configuration_manager
@@ -67,6 +78,10 @@ class Profile:
     def disable(self, name: str) -> None:
         self.set_option(name, False)
 
+    def apply_options(self, settings: Dict[str, bool]) -> None:
+        for name, value in settings.items():
+            self.set_option(name, value)
+
     def is_option_modifiable(self, option: str) -> bool:
         if is_parent_option(option):
             return True
@@ -255,3 +270,6 @@ class Profile:
         except ValidationError as e:
             message = "[{}]: {}".format('/'.join(str(s) for s in e.path), e.message)
             raise ApplicationException(message) from e
+
+
+_ProfileDumper.add_representer(OrderedDict, lambda self, data: SafeRepresenter.represent_dict(self, data.items()))
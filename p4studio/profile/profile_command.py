@@ -17,28 +17,27 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import os
-from collections import OrderedDict
+import re
 import sys
-from typing import Optional, List, Sequence
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Sequence, Tuple
 
 import click
-import yaml
 from click import Choice
 from click import Context
 from click.utils import LazyFile
-from yaml.representer import SafeRepresenter
 
-from build import build_command
 from config.config_option_utils import sorted_by_parenthood
-from config.configuration_manager import current_configuration_manager, p4studio_arg_to_config_option
-from config.configure_command import _allowed_options, configure_command
-from dependencies.dependencies_command import install_command
-from system.check_system_command import check_system_command
+from config.configuration_manager import ConfigurationManager, current_configuration_manager, \
+    p4studio_arg_to_config_option
+from config.configure_command import _allowed_options
 from utils.default_directory_file import DefaultDirectoryFile
+from utils.exceptions import ApplicationException
 from utils.log import logging_options, default_log_file_name
 from utils.terminal import print_green, print_separator, print_warning
 from workspace import current_workspace
-from .profile import Profile, load_profile_from_file
+from .profile import Profile, load_profile_from_file, dump_profile
 from .profile_execution_plan import ProfileExecutionPlan
 
 
@@ -56,9 +55,14 @@ def profile_command() -> None:
 
 
 def _default_options() -> str:
+    return _default_options_of(current_configuration_manager())
+
+
+@lru_cache(maxsize=1)
+def _default_options_of(config_manager: ConfigurationManager) -> str:
     options = {
         o.p4studio_name: o.default
-        for o in current_configuration_manager().definitions
+        for o in config_manager.definitions
     }
     options['switch'] = True
     options['bf-diags'] = True
@@ -103,7 +107,7 @@ def profile_create_command(file: LazyFile,
         for program in p4_examples.split(','):
             profile.add_p4_program(program)
 
-    file.write(yaml.dump(profile.raw))
+    dump_profile(profile.raw, file)
 
 
 @click.command('describe')
@@ -120,22 +124,37 @@ def profile_describe_command(file: LazyFile, bsp_path: Optional[str]) -> None:
 
 
 def profile_file_autocompletion(ctx: Context, args: List[str], incomplete: str) -> List[str]:
-    files_in_profile_dir = current_workspace().p4studio_profiles_dir.iterdir()
-    yaml_file_names = [f.stem for f in files_in_profile_dir if f.suffix == ".yaml" or f.suffix == ".yml"]
+    with os.scandir(current_workspace().p4studio_profiles_dir) as files_in_profile_dir:
+        yaml_file_names = [f.name.rsplit('.', 1)[0] for f in files_in_profile_dir if f.name.endswith(('.yaml', '.yml'))]
     return [fn for fn in yaml_file_names if incomplete in fn]
 
 
-# Example first line of /proc/meminfo file on Linux:
-# MemTotal:        8108300 kB
+# Example line of /proc/meminfo file on Linux:
+# MemAvailable:    6543210 kB
+# Kernels older than 3.14 do not report MemAvailable, MemFree is used instead.
+_MEM_AVAILABLE_RE = re.compile(rb'MemAvailable:\s+(\d+)')
+_MEM_FREE_RE = re.compile(rb'MemFree:\s+(\d+)')
+
+
 def available_mem_MBytes() -> int:
-    firstline = None
-    with open('/proc/meminfo', 'r') as f:
-        firstline = f.readline()
-    mem_KBytes = int(firstline.split()[1])
+    fd = os.open('/proc/meminfo', os.O_RDONLY)
+    try:
+        meminfo = os.read(fd, 512)
+    finally:
+        os.close(fd)
+    match = _MEM_AVAILABLE_RE.search(meminfo) or _MEM_FREE_RE.search(meminfo)
+    if match is None:
+        raise ApplicationException("Cannot read available memory from /proc/meminfo")
+    mem_KBytes = int(match.group(1))
     mem_MBytes = mem_KBytes // 1024
     return mem_MBytes
 
 
+@lru_cache(maxsize=1)
+def _system_caps() -> Tuple[int, int]:
+    return os.cpu_count() or 1, available_mem_MBytes()
+
+
 # When p4c is built with the unity option, at least one individual
 # process uses 4.5 GBytes of RAM, and there are others that use
 # 2-3 GBytes of RAM that might run in parallel with that one.
@@ -149,28 +168,37 @@ def available_mem_MBytes() -> int:
 # we could use this formula instead, but I have not tested this:
 #
 # expected_max_mem_usage(N) = 2 GBytes + N * (2 GBytes)
-def expected_max_mem_usage_MBytes(num_jobs) -> int:
-    return 2048 + num_jobs * 4096
-
-
-def max_parallel_jobs(avail_mem_MBytes) -> int:
-    cpu_count = os.cpu_count()
-    num_jobs = 0
-    while True:
-        required_mem_MBytes = expected_max_mem_usage_MBytes(num_jobs + 1)
-        if required_mem_MBytes > avail_mem_MBytes:
-            break
-        num_jobs += 1
-    if num_jobs > cpu_count:
-        num_jobs = cpu_count
-    return num_jobs
+BASE_MEM_USAGE_MBYTES = 2048
+PER_JOB_MEM_USAGE_MBYTES = 4096
+
 
+PER_JOB_MEMORY_MODE = 'per_job'
+FIXED_TOTAL_MEMORY_MODE = 'fixed_total'
 
-def calculate_jobs_from_available_cpus_and_memory() -> int:
-    cpu_count = os.cpu_count()
-    avail_mem_MBytes = available_mem_MBytes()
+
+def expected_max_mem_usage_MBytes(num_jobs, per_job_mem_MBytes=PER_JOB_MEM_USAGE_MBYTES) -> int:
+    return BASE_MEM_USAGE_MBYTES + num_jobs * per_job_mem_MBytes
+
+
+def max_parallel_jobs(avail_mem_MBytes, cpu_count, per_job_mem_MBytes=PER_JOB_MEM_USAGE_MBYTES) -> int:
+    num_jobs = max(0, (avail_mem_MBytes - BASE_MEM_USAGE_MBYTES) // per_job_mem_MBytes)
+    return min(num_jobs, cpu_count)
+
+
+# In per_job mode memory usage grows with number of parallel jobs, as
+# described above.  In fixed_total mode whole build is expected to fit
+# in total_mem_MBytes regardless of number of jobs, so all CPUs are used.
+def calculate_jobs_from_available_cpus_and_memory(memory_mode=PER_JOB_MEMORY_MODE,
+                                                  per_job_mem_MBytes=PER_JOB_MEM_USAGE_MBYTES,
+                                                  total_mem_MBytes=None) -> int:
+    cpu_count, avail_mem_MBytes = _system_caps()
     mem_comment = ""
-    num_jobs = max_parallel_jobs(avail_mem_MBytes)
+    if memory_mode == FIXED_TOTAL_MEMORY_MODE:
+        min_required_mem_MBytes = total_mem_MBytes or expected_max_mem_usage_MBytes(1)
+        num_jobs = cpu_count if min_required_mem_MBytes <= avail_mem_MBytes else 0
+    else:
+        min_required_mem_MBytes = expected_max_mem_usage_MBytes(1, per_job_mem_MBytes)
+        num_jobs = max_parallel_jobs(avail_mem_MBytes, cpu_count, per_job_mem_MBytes)
     abort = False
     if num_jobs < 1:
         mem_comment = "too low"
@@ -178,8 +206,8 @@ def calculate_jobs_from_available_cpus_and_memory() -> int:
     else:
         mem_comment = "enough for %s parallel jobs" % (num_jobs)
     print_green("Minimum recommended memory to run this script:"
-                " {} MBytes", expected_max_mem_usage_MBytes(1))
-    print_green("Memory on this system from /proc/meminfo:      "
+                " {} MBytes", min_required_mem_MBytes)
+    print_green("Available memory from /proc/meminfo:           "
                 "{} MBytes -> {}", avail_mem_MBytes, mem_comment)
     if abort:
         print_warning("Aborting because system has too little RAM.")
@@ -196,6 +224,14 @@ def calculate_jobs_from_available_cpus_and_memory() -> int:
 @click.option("--override-option", "override_options", type=Choice(_allowed_options()), multiple=True,
               metavar="[CONFIG|^CONFIG]", help="Override any option in a profile")
 @click.option("--jobs", default=None, help="Allow specific number of jobs to be used")
+@click.option("--memory-mode", type=Choice([PER_JOB_MEMORY_MODE, FIXED_TOTAL_MEMORY_MODE]),
+              default=PER_JOB_MEMORY_MODE, show_default=True,
+              help="How memory usage of the build is estimated when --jobs is not given")
+@click.option("--per-job-mem-MB", "per_job_mem_MBytes", type=click.IntRange(min=1), default=None,
+              help="Memory needed by each parallel job in per_job memory mode [default: {}]".format(
+                  PER_JOB_MEM_USAGE_MBYTES))
+@click.option("--total-mem-MB", "total_mem_MBytes", type=click.IntRange(min=1), default=None,
+              help="Memory needed by the whole build in fixed_total memory mode")
 @click.option("--bsp-path", type=click.Path(exists=True), help="BSP to be used and installed")
 @click.option('--skip-dependencies', default=False, is_flag=True, help="Do not install dependencies")
 @click.option('--skip-system-check', default=False, is_flag=True, help="Do not check system")
@@ -203,6 +239,9 @@ def calculate_jobs_from_available_cpus_and_memory() -> int:
 def profile_apply_command(context: Context,
                           file: LazyFile,
                           jobs: Optional[int],
+                          memory_mode: str,
+                          per_job_mem_MBytes: Optional[int],
+                          total_mem_MBytes: Optional[int],
                           bsp_path: Optional[str],
                           skip_dependencies: bool,
                           skip_system_check: bool,
@@ -211,8 +250,18 @@ def profile_apply_command(context: Context,
     """
     Build and install SDE using existing profile
     """
+    if memory_mode == PER_JOB_MEMORY_MODE and total_mem_MBytes is not None:
+        raise click.BadOptionUsage("total_mem_MBytes",
+                                   "--total-mem-MB can be used only with --memory-mode {}".format(
+                                       FIXED_TOTAL_MEMORY_MODE))
+    if memory_mode == FIXED_TOTAL_MEMORY_MODE and per_job_mem_MBytes is not None:
+        raise click.BadOptionUsage("per_job_mem_MBytes",
+                                   "--per-job-mem-MB can be used only with --memory-mode {}".format(
+                                       PER_JOB_MEMORY_MODE))
     if jobs is None:
-        jobs = calculate_jobs_from_available_cpus_and_memory()
+        jobs = calculate_jobs_from_available_cpus_and_memory(memory_mode,
+                                                             per_job_mem_MBytes or PER_JOB_MEM_USAGE_MBYTES,
+                                                             total_mem_MBytes)
     plan = create_plan(file, bsp_path, jobs, override_options)
 
     if not skip_system_check:
@@ -222,12 +271,19 @@ def profile_apply_command(context: Context,
 
 
 def check_system(context: Context, plan: ProfileExecutionPlan) -> None:
+    from system.check_system_command import check_system_command
+
     asic = 'asic' in plan.profile.config_args()
     kdir = plan.profile.kdir
     context.invoke(check_system_command, asic=asic, kdir=kdir)
 
 
 def execute_plan(context: Context, plan: ProfileExecutionPlan, skip_dependencies: bool = False) -> None:
+    # imported here, so that profile subcommands and shell completion do not load them
+    from build import build_command
+    from config.configure_command import configure_command
+    from dependencies.dependencies_command import install_command
+
     print_separator()
     plan.describe_profile()
     print_separator()
@@ -246,11 +302,12 @@ def create_plan(file: LazyFile, bsp_path: Optional[str] = None, jobs: Optional[i
     print_green("Loading profile from {} file...", file.name)
     profile = load_profile_from_file(file)
 
-    for option in sorted_by_parenthood([p4studio_arg_to_config_option(o) for o in overriden_options]):
-        if option.enabled:
-            profile.enable(option.p4studio_name)
-        elif option.can_be_disabled():
-            profile.disable(option.p4studio_name)
+    config_options = [p4studio_arg_to_config_option(o) for o in overriden_options]
+    profile.apply_options(OrderedDict(
+        (option.p4studio_name, option.enabled)
+        for option in sorted_by_parenthood(config_options)
+        if option.enabled or option.can_be_disabled()
+    ))
 
     if bsp_path:
         profile.enable("bsp")
@@ -264,5 +321,3 @@ def create_plan(file: LazyFile, bsp_path: Optional[str] = None, jobs: Optional[i
 profile_command.add_command(profile_create_command)
 profile_command.add_command(profile_apply_command)
 profile_command.add_command(profile_describe_command)
-
-yaml.add_representer(OrderedDict, lambda self, data: SafeRepresenter.represent_dict(self, data.items()))
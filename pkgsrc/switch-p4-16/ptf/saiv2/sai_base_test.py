@@ -24,9 +24,12 @@ Tests will usually inherit from one of these classes to have the controller
 and/or dataplane automatically set up.
 """
 
+import atexit
 import os
+import re
+import socket
 
-from collections import OrderedDict
+from functools import lru_cache, partial
 
 import ptf
 from ptf import config
@@ -36,6 +39,7 @@ from ptf.packet import *
 from thrift.transport import TSocket
 from thrift.transport import TTransport
 from thrift.protocol import TBinaryProtocol
+from thrift.protocol import TCompactProtocol
 
 import sai_thrift.sai_rpc as sai_rpc
 
@@ -51,6 +55,25 @@ from sai_utils import *
 
 ROUTER_MAC = '00:77:66:55:44:00'
 
+# thrift connections shared by all tests, SAI RPC server handles
+# a single connection at a time, so there is no point in reconnecting
+_rpc_clients = {}
+
+# parsed port config files, keyed by path and modification time
+_port_configs = {}
+
+
+def _close_rpc_clients():
+    """
+    Close thrift connections shared by tests
+    """
+    for transport, _, _ in _rpc_clients.values():
+        transport.close()
+    _rpc_clients.clear()
+
+
+atexit.register(_close_rpc_clients)
+
 
 class ThriftInterface(BaseTest):
     """
@@ -96,6 +119,15 @@ class ThriftInterface(BaseTest):
     def createRpcClient(self):
         """
         Set up thrift client and contact server
+
+        Uses the following test parameters:
+            thrift_server - RPC server address, localhost by default
+            thrift_transport - 'framed' for TFramedTransport, buffered
+            transport is used by default
+            thrift_protocol - 'compact' for TCompactProtocol, binary
+            protocol is used by default
+        Transport and protocol have to match the ones of the SAI RPC
+        server, which uses the defaults unless built otherwise.
         """
 
         if "thrift_server" in self.test_params:
@@ -103,12 +135,43 @@ class ThriftInterface(BaseTest):
         else:
             server = 'localhost'
 
-        self.transport = TSocket.TSocket(server, 9092)
-        self.transport = TTransport.TBufferedTransport(self.transport)
-        self.protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
+        rpc_client_key = (server,
+                          self.test_params.get('thrift_transport'),
+                          self.test_params.get('thrift_protocol'))
+        if rpc_client_key in _rpc_clients:
+            self.transport, self.protocol, self.client = \
+                _rpc_clients[rpc_client_key]
+            if self.transport.isOpen():
+                return
+
+        # framed transport and compact protocol have to be enabled
+        # on the server side as well, so they are used only on request
+        thrift_socket = TSocket.TSocket(server, 9092)
+        self.transport = thrift_socket
+        if self.test_params.get('thrift_transport') == 'framed':
+            self.transport = TTransport.TFramedTransport(self.transport)
+        else:
+            self.transport = TTransport.TBufferedTransport(self.transport)
+        if self.test_params.get('thrift_protocol') == 'compact':
+            self.protocol = TCompactProtocol.TCompactProtocolAccelerated(
+                self.transport)
+        else:
+            # falls back to pure Python encoding when fastbinary
+            # is not available
+            self.protocol = TBinaryProtocol.TBinaryProtocolAccelerated(
+                self.transport)
 
         self.client = sai_rpc.Client(self.protocol)
         self.transport.open()
+        # pipelined requests are small writes sent back to back, without
+        # TCP_NODELAY they would wait for ACKs of the previous ones
+        thrift_socket.handle.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # connection stays open for the whole test run
+        thrift_socket.handle.setsockopt(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        _rpc_clients[rpc_client_key] = (
+            self.transport, self.protocol, self.client)
 
     def setUp(self):
         self.interface_to_front_mapping = {}
@@ -120,7 +183,26 @@ class ThriftInterface(BaseTest):
 
     def tearDown(self):
         BaseTest.tearDown(self)
-        self.transport.close()
+
+
+def cpu_and_skipped_ports(arch):
+    """
+    Returns CPU ports and ports which are neither CPU nor front panel ports
+
+    Args:
+        arch (string): chip architecture
+
+    Returns:
+        tuple: set of CPU port numbers and set of skipped port numbers
+    """
+    if arch == "tofino2":
+        return {2}, {320}
+    return {64, 320}, set()
+
+
+# dataplane and port map are shared by all tests in the process,
+# so CPU ports have to be removed only once
+_cpu_ports_removed = False
 
 
 class ThriftInterfaceDataPlane(ThriftInterface):
@@ -132,20 +214,15 @@ class ThriftInterfaceDataPlane(ThriftInterface):
         """
         Remove CPU port from port map
         """
-        test_params = test_params_get()
+        global _cpu_ports_removed
+        if _cpu_ports_removed:
+            return
+        cpu_ports, _ = cpu_and_skipped_ports(test_params_get()['arch'])
         for _, port, _ in config["interfaces"]:
-            if test_params['arch'] == "tofino2":
-                if port == 320:
-                    continue
-                if port == 2:
-                    self.dataplane.port_remove(0, port)
-                    ptf.config["port_map"].pop((0, port), None)
-                    continue
-            else:
-                if port in (64, 320):
-                    self.dataplane.port_remove(0, port)
-                    ptf.config["port_map"].pop((0, port), None)
-                    continue
+            if port in cpu_ports:
+                self.dataplane.port_remove(0, port)
+                ptf.config["port_map"].pop((0, port), None)
+        _cpu_ports_removed = True
 
     def setUp(self):
         ThriftInterface.setUp(self)
@@ -186,38 +263,82 @@ def parse_port_config(port_config_file):
     Args:
         port_config_file (string): path to port config file
 
+    Parsed configuration is cached in memory and reused as long as
+    port config file is not modified.
+
     Returns:
         dict: port configuation from file
 
     Raises:
         e: exit if file not found
     '''
-    ports = OrderedDict()
+    cache_key = (os.path.abspath(port_config_file),
+                 os.path.getmtime(port_config_file))
+    if cache_key in _port_configs:
+        return _port_configs[cache_key]
+
+    ports = {}
     try:
         with open(port_config_file) as conf:
-            for line in conf:
-                if line.startswith('#'):
-                    if "name" in line:
-                        titles = line.strip('#').split()
-                    continue
-                tokens = line.split()
-                if len(tokens) < 2:
-                    continue
-                name_index = titles.index('name')
-                name = tokens[name_index]
-                data = {}
-                for i, item in enumerate(tokens):
-                    if i == name_index:
-                        continue
-                    data[titles[i]] = item
-                data['lanes'] = [int(lane)
-                                 for lane in data['lanes'].split(',')]
-                data['speed'] = int(data['speed'])
-                ports[name] = data
-        return ports
+            lines = conf.read().splitlines()
+        for line in lines:
+            if line.startswith('#'):
+                if "name" in line:
+                    titles = line.strip('#').split()
+                continue
+            tokens = line.split()
+            if len(tokens) < 2:
+                continue
+            data = dict(zip(titles, tokens))
+            name = data.pop('name')
+            data['lanes'] = [int(lane)
+                             for lane in data['lanes'].split(',')]
+            data['speed'] = int(data['speed'])
+            ports[name] = data
     except Exception as e:
         raise e
 
+    _port_configs[cache_key] = ports
+    return ports
+
+
+# switch attributes verified in tearDown to detect leaked objects
+AVAILABLE_RESOURCES = [
+    'available_next_hop_group_entry',
+    'available_next_hop_group_member_entry',
+    'available_ipv4_nexthop_entry',
+    'available_ipv6_nexthop_entry',
+    'available_fdb_entry',
+    'available_ipv6_route_entry',
+    'available_ipv4_route_entry']
+
+_INDEXED_PORT_ATTR_RE = re.compile(r'^(port|dev_port|cpu_port)(\d+)$')
+
+# tuples backing the indexed port attributes, the names are private,
+# so tests setting their own self.ports lists do not shadow them
+_INDEXED_PORT_TUPLES = {
+    'port': '_port_oids',
+    'dev_port': '_dev_port_nums',
+    'cpu_port': '_cpu_port_nums'}
+
+
+@lru_cache(maxsize=None)
+def indexed_port_attr(name):
+    """
+    Split legacy indexed port attribute name into tuple name and index
+
+    Args:
+        name (string): attribute name, e.g. port3 or dev_port12
+
+    Returns:
+        tuple: tuple attribute name and index or None if name is not
+               an indexed port attribute
+    """
+    match = _INDEXED_PORT_ATTR_RE.match(name)
+    if match is None:
+        return None
+    return _INDEXED_PORT_TUPLES[match.group(1)], int(match.group(2))
+
 
 class SaiHelperBase(ThriftInterfaceDataPlane):
     '''
@@ -234,14 +355,39 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         self.default_trap_group
         self.active_ports - number of active ports
         self.port_list - list of all active port objects
-        self.portX objects for all active ports
+        self._port_oids - tuple of all active port objects
+        self._dev_port_nums - tuple of device port numbers
+        self._cpu_port_nums - tuple of CPU port numbers
+        self.portX, self.dev_portX and self.cpu_portX are resolved
+        from the tuples above
+        self.undo_log - calls reverting setUp configuration, see addUndo
     '''
 
+    def __getattr__(self, name):
+        parsed = indexed_port_attr(name)
+        if parsed is not None:
+            ports, index = parsed
+            try:
+                return self.__dict__[ports][index]
+            except (KeyError, IndexError):
+                pass
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (type(self).__name__, name))
+
     def setUp(self):
         ThriftInterfaceDataPlane.setUp(self)
+        self.undo_log = []
         self.getSwitchPorts()
 
-        if 'switch_id' in self.test_params:
+        switch_id_file = self.test_params.get('switch_id_file')
+        if 'switch_id' not in self.test_params and switch_id_file:
+            # Get switch id initialized by a previous test run
+            switch_id = self.loadSwitchId(switch_id_file)
+            if switch_id is not None:
+                self.test_params['switch_id'] = switch_id
+
+        switch_preinitialized = 'switch_id' in self.test_params
+        if switch_preinitialized:
             # Get switch id initialized before
             self.switch_id = self.test_params['switch_id']
         else:
@@ -250,19 +396,12 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
                 self.client, init_switch=True, src_mac_address=ROUTER_MAC)
             self.assertEqual(self.status(), SAI_STATUS_SUCCESS)
             self.test_params['switch_id'] = self.switch_id
+            if switch_id_file:
+                with open(switch_id_file, 'w') as id_file:
+                    id_file.write(str(self.switch_id))
 
         self.saveNumberOfAvaiableResources()
 
-        # get default vlan
-        attr = sai_thrift_get_switch_attribute(
-            self.client, default_vlan_id=True)
-        self.default_vlan_id = attr['default_vlan_id']
-
-        # get default stp
-        attr = sai_thrift_get_switch_attribute(
-            self.client, default_stp_inst_id=True)
-        self.default_stp = attr['default_stp_inst_id']
-
         if 'port_config_ini' in self.test_params:
             if 'createPorts_has_been_called' not in config:
                 self.createPorts()
@@ -270,38 +409,89 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
                 # self.checkPortsUp()
                 config['createPorts_has_been_called'] = 1
 
-        # get number of active ports
+        # attributes below do not change for the lifetime of a switch
+        # initialized before, so they are fetched only by the first test
+        switch_cache = config.get('sai_switch_cache')
+        if switch_preinitialized and switch_cache is not None:
+            for name, value in switch_cache.items():
+                # tests may modify lists, so each one gets its own copy
+                if isinstance(value, list):
+                    value = list(value)
+                setattr(self, name, value)
+            attr = sai_thrift_get_switch_attribute(
+                self.client, number_of_active_ports=True)
+            self.active_ports = attr['number_of_active_ports']
+        else:
+            self.getSwitchDefaults()
+            if switch_preinitialized:
+                cached_attrs = ['default_vlan_id', 'default_stp',
+                                'default_vrf', 'default_1q_bridge',
+                                'cpu_port_hdl', 'acl_stage_ingress',
+                                'acl_stage_egress', 'default_trap_group']
+                config['sai_switch_cache'] = {
+                    name: getattr(self, name) for name in cached_attrs}
+
+        # tests may remove or create ports and queues,
+        # so they are read by every test
+        self.getPortListAndCpuQueues()
+
+    def getSwitchDefaults(self):
+        """
+        Get default switch objects, number of active ports
+        and ACL capabilities
+        """
+        # get all scalar switch attributes at once
         attr = sai_thrift_get_switch_attribute(
-            self.client, number_of_active_ports=True)
+            self.client,
+            default_vlan_id=True,
+            default_stp_inst_id=True,
+            number_of_active_ports=True,
+            default_virtual_router_id=True,
+            default_1q_bridge_id=True,
+            cpu_port=True,
+            max_acl_action_count=True,
+            default_trap_group=True)
+        self.default_vlan_id = attr['default_vlan_id']
+        self.default_stp = attr['default_stp_inst_id']
         self.active_ports = attr['number_of_active_ports']
+        self.default_vrf = attr['default_virtual_router_id']
+        self.assertTrue(self.default_vrf != 0)
+        self.default_1q_bridge = attr['default_1q_bridge_id']
+        self.assertTrue(self.default_1q_bridge != 0)
+        self.cpu_port_hdl = attr['cpu_port']
+        self.assertTrue(self.cpu_port_hdl != 0)
+        max_acl_action_count = attr['max_acl_action_count']
+        self.default_trap_group = attr['default_trap_group']
+        self.assertTrue(self.default_trap_group != 0)
+
+        # get ACL capability
+        ingress_cap = sai_thrift_acl_capability_t(
+            action_list=sai_thrift_s32_list_t(
+                int32list=[], count=max_acl_action_count))
+        egress_cap = sai_thrift_acl_capability_t(
+            action_list=sai_thrift_s32_list_t(
+                int32list=[], count=max_acl_action_count))
+        attr = sai_thrift_get_switch_attribute(
+            self.client, acl_stage_ingress=ingress_cap,
+            acl_stage_egress=egress_cap)
+        self.acl_stage_ingress = \
+            attr['acl_stage_ingress'].action_list.int32list
+        self.assertTrue(len(self.acl_stage_ingress) != 0)
+        self.acl_stage_egress = attr['acl_stage_egress'].action_list.int32list
+        self.assertTrue(len(self.acl_stage_egress) != 0)
 
-        # get port list
+    def getPortListAndCpuQueues(self):
+        """
+        Get active port objects and CPU port queue objects
+        """
+        # get port list, its size depends on number of active ports
         attr = sai_thrift_get_switch_attribute(
             self.client, port_list=sai_thrift_object_list_t(
                 idlist=[], count=self.active_ports))
 
         self.assertEqual(self.active_ports, attr['port_list'].count)
         self.port_list = attr['port_list'].idlist
-
-        for index in range(0, self.active_ports):
-            setattr(self, 'port%s' % index, self.port_list[index])
-
-        # get default vrf
-        attr = sai_thrift_get_switch_attribute(
-            self.client, default_virtual_router_id=True)
-        self.default_vrf = attr['default_virtual_router_id']
-        self.assertTrue(self.default_vrf != 0)
-
-        # get default 1Q bridge OID
-        attr = sai_thrift_get_switch_attribute(
-            self.client, default_1q_bridge_id=True)
-        self.default_1q_bridge = attr['default_1q_bridge_id']
-        self.assertTrue(self.default_1q_bridge != 0)
-
-        # get cpu port
-        attr = sai_thrift_get_switch_attribute(self.client, cpu_port=True)
-        self.cpu_port_hdl = attr['cpu_port']
-        self.assertTrue(self.cpu_port_hdl != 0)
+        self._port_oids = tuple(self.port_list[:self.active_ports])
 
         # get cpu port queue handles
         attr = sai_thrift_get_port_attribute(self.client,
@@ -312,9 +502,16 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         attr = sai_thrift_get_port_attribute(self.client,
                                              self.cpu_port_hdl,
                                              qos_queue_list=q_list)
-        for queue in range(0, num_queues):
-            queue_id = attr["qos_queue_list"].idlist[queue]
+        cpu_queues = (self.cpu_port_hdl,
+                      tuple(attr["qos_queue_list"].idlist[:num_queues]))
+        # queue list is ordered by queue index, verifying it costs
+        # one RPC per queue, so the same list is verified only once
+        verify_cpu_queues = \
+            config.get('sai_verified_cpu_queues') != cpu_queues
+        for queue, queue_id in enumerate(cpu_queues[1]):
             setattr(self, 'cpu_queue%s' % queue, queue_id)
+            if not verify_cpu_queues:
+                continue
             q_attr = sai_thrift_get_queue_attribute(
                 self.client,
                 queue_id,
@@ -323,26 +520,34 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
                 parent_scheduler_node=True)
             self.assertTrue(queue == q_attr["index"])
             self.assertTrue(self.cpu_port_hdl == q_attr["port"])
+        config['sai_verified_cpu_queues'] = cpu_queues
 
-        # get ACL capability
-        attr = sai_thrift_get_switch_attribute(
-            self.client, max_acl_action_count=True)
-        max_acl_action_count = attr['max_acl_action_count']
-        s32 = sai_thrift_s32_list_t(int32list=[], count=max_acl_action_count)
-        cap = sai_thrift_acl_capability_t(action_list=s32)
-        attr = sai_thrift_get_switch_attribute(
-            self.client, acl_stage_ingress=cap)
-        self.acl_stage_ingress = \
-            attr['acl_stage_ingress'].action_list.int32list
-        self.assertTrue(len(self.acl_stage_ingress) != 0)
-        attr = sai_thrift_get_switch_attribute(
-            self.client, acl_stage_egress=cap)
-        self.acl_stage_egress = attr['acl_stage_egress'].action_list.int32list
-        self.assertTrue(len(self.acl_stage_egress) != 0)
-        attr = sai_thrift_get_switch_attribute(
-            self.client, default_trap_group=True)
-        self.default_trap_group = attr['default_trap_group']
-        self.assertTrue(self.default_trap_group != 0)
+    def loadSwitchId(self, switch_id_file):
+        """
+        Read id of a switch initialized by a previous test run
+
+        Args:
+            switch_id_file (string): path to file with switch id
+
+        Returns:
+            int: switch id or None if there is no initialized switch
+                 with this id
+        """
+        try:
+            with open(switch_id_file) as id_file:
+                switch_id = int(id_file.read())
+        except (IOError, ValueError):
+            return None
+
+        # file may be left over after the switch has been restarted,
+        # so the id is compared with the switch owning the CPU port
+        attr = sai_thrift_get_switch_attribute(self.client, cpu_port=True)
+        if self.status() != SAI_STATUS_SUCCESS:
+            return None
+        if self.client.sai_thrift_switch_id_query(
+                attr['cpu_port']) != switch_id:
+            return None
+        return switch_id
 
     def createPorts(self):
         """
@@ -380,8 +585,7 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         # add new ports from port config file
         self.ports_config = parse_port_config(
             self.test_params['port_config_ini'])
-        for name, port in self.ports_config.items():
-            print("Creating port: %s" % name)
+        for port in self.ports_config.values():
             fec_mode = fec_str_to_int(port.get('fec', None))
             auto_neg_mode = port.get('autoneg', "").lower() == "on"
             sai_list = sai_thrift_u32_list_t(
@@ -393,31 +597,58 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
                 auto_neg_mode=auto_neg_mode,
                 speed=port['speed'],
                 admin_state=True)
+        print("Created ports: %s" % ", ".join(self.ports_config))
 
     def checkPortsUp(self):
         '''
         Wait for all ports to be UP
         '''
 
-        for _ in range(1, 5):
-            allup = True
-            for port in self.port_list:
-                attr = sai_thrift_get_port_attribute(
-                    self.client, port, oper_status=True)
-                if attr['oper_status'] != SAI_SWITCH_OPER_STATUS_UP:
-                    allup = False
-                    break
-            if allup:
+        # poll often but keep the overall timeout, ports which came UP
+        # are not queried again
+        down_ports = list(self.port_list)
+        for _ in range(0, 30):
+            down_ports = [
+                port for port in down_ports
+                if sai_thrift_get_port_attribute(
+                    self.client, port, oper_status=True)['oper_status']
+                != SAI_SWITCH_OPER_STATUS_UP]
+            if not down_ports:
                 break
-            time.sleep(10)
-        self.assertTrue(allup)
+            time.sleep(1)
+        self.assertTrue(not down_ports)
+
+    def addUndo(self, func, *objs, **kwargs):
+        """
+        Register calls reverting setUp configuration, tearDown makes them
+        in reverse order of registration
+
+        Args:
+            func (function): sai_adapter function, e.g. remove or set one
+            objs (list): objects to call func for, strings are names of
+                         attributes read in tearDown, so tests may
+                         replace the objects
+            kwargs (dict): additional func arguments
+        """
+        for obj in objs:
+            self.undo_log.append((func, obj, kwargs))
 
     def tearDown(self):
         try:
-            for port in self.port_list:
-                sai_thrift_clear_port_stats(self.client, port)
-                sai_thrift_set_port_attribute(
-                    self.client, port, port_vlan_id=0)
+            # ports reverted by the undo log are not reset again
+            with SaiPipeline(self.client, dedup=True) as pipeline:
+                # requests are handled in order, so dependent objects are
+                # removed before the objects they refer to
+                while self.undo_log:
+                    func, obj, kwargs = self.undo_log.pop()
+                    if isinstance(obj, str):
+                        obj = getattr(self, obj)
+                    func(pipeline, obj, **kwargs)
+
+                for port in self.port_list:
+                    sai_thrift_clear_port_stats(pipeline, port)
+                    sai_thrift_set_port_attribute(
+                        pipeline, port, port_vlan_id=0)
 
             self.assertEqual(True, self.verifyNumberOfAvaiableResources(
                 debug=False))
@@ -429,25 +660,20 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         """
         Gets device port numbers
         """
-        test_params = test_params_get()
-        dev_no = 0
-        cpu_no = 0
+        cpu_ports, skipped_ports = cpu_and_skipped_ports(
+            test_params_get()['arch'])
+        dev_ports = []
+        switch_cpu_ports = []
         for _, port, _ in config["interfaces"]:
-            if test_params['arch'] == "tofino2":
-                if port == 320:
-                    continue
-                if port == 2:
-                    setattr(self, 'cpu_port%d' % cpu_no, port)
-                    cpu_no += 1
-                    continue
-            else:
-                if port in (64, 320):
-                    setattr(self, 'cpu_port%d' % cpu_no, port)
-                    cpu_no += 1
-                    continue
+            if port in skipped_ports:
+                continue
+            if port in cpu_ports:
+                switch_cpu_ports.append(port)
+                continue
 
-            setattr(self, 'dev_port%d' % dev_no, port)
-            dev_no += 1
+            dev_ports.append(port)
+        self._dev_port_nums = tuple(dev_ports)
+        self._cpu_port_nums = tuple(switch_cpu_ports)
 
     def printNumberOfAvaiableResources(self):
         """
@@ -471,6 +697,17 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         finally:
             pass
 
+    def getNumberOfAvaiableResources(self):
+        """
+        Gets numbers of available resources
+
+        Returns:
+            dict: numbers of available resources by attribute name
+        """
+        attr_list = sai_thrift_get_switch_attribute(
+            self.client, **{name: True for name in AVAILABLE_RESOURCES})
+        return {name: attr_list[name] for name in AVAILABLE_RESOURCES}
+
     def saveNumberOfAvaiableResources(self, debug=False):
         """
         Saves numbers of available resources
@@ -478,38 +715,14 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         Args:
             debug (boolean): enables debug option
         """
+        if self.test_params.get('skip_resource_check', False):
+            return
         if debug:
             print("saveNumberOfAvaiableResources")
-        try:
-            attr_list = sai_thrift_get_switch_attribute(
-                self.client,
-                number_of_ecmp_groups=True,
-                ecmp_members=True,
-                available_next_hop_group_entry=True,
-                available_next_hop_group_member_entry=True,
-                available_ipv6_nexthop_entry=True,
-                available_ipv4_nexthop_entry=True,
-                available_fdb_entry=True,
-                available_ipv6_route_entry=True,
-                available_ipv4_route_entry=True)
-            self.available_next_hop_group_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_NEXT_HOP_GROUP_ENTRY"]
-            self.available_next_hop_group_member_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_NEXT_HOP_GROUP_MEMBER_ENTRY"]
-            self.available_ipv4_nexthop_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV4_NEXTHOP_ENTRY"]
-            self.available_ipv6_nexthop_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV6_NEXTHOP_ENTRY"]
-            self.available_fdb_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_FDB_ENTRY"]
-            self.available_ipv6_route_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV6_ROUTE_ENTRY"]
-            self.available_ipv4_route_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV4_ROUTE_ENTRY"]
-            if debug:
-                self.printNumberOfAvaiableResources()
-        finally:
-            pass
+        for name, value in self.getNumberOfAvaiableResources().items():
+            setattr(self, name, value)
+        if debug:
+            self.printNumberOfAvaiableResources()
 
     def verifyNumberOfAvaiableResources(self, debug=False):
         """
@@ -521,72 +734,22 @@ class SaiHelperBase(ThriftInterfaceDataPlane):
         Returns:
             boolean: verification result
         """
-        result = True
-        try:
-            attr_list = sai_thrift_get_switch_attribute(
-                self.client,
-                number_of_ecmp_groups=True,
-                ecmp_members=True,
-                available_next_hop_group_entry=True,
-                available_next_hop_group_member_entry=True,
-                available_ipv6_nexthop_entry=True,
-                available_ipv4_nexthop_entry=True,
-                available_fdb_entry=True,
-                available_ipv6_route_entry=True,
-                available_ipv4_route_entry=True)
-            available_next_hop_group_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_NEXT_HOP_GROUP_ENTRY"]
-            available_next_hop_group_member_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_NEXT_HOP_GROUP_MEMBER_ENTRY"]
-            available_ipv4_nexthop_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV4_NEXTHOP_ENTRY"]
-            available_ipv6_nexthop_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV6_NEXTHOP_ENTRY"]
-            available_fdb_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_FDB_ENTRY"]
-            available_ipv6_route_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV6_ROUTE_ENTRY"]
-            available_ipv4_route_entry = attr_list[
-                "SAI_SWITCH_ATTR_AVAILABLE_IPV4_ROUTE_ENTRY"]
-
-            resources_dict = {
-                "available_next_hop_group_entry": [
-                    available_next_hop_group_entry,
-                    self.available_next_hop_group_entry],
-                "available_next_hop_group_member_entry": [
-                    available_next_hop_group_member_entry,
-                    self.available_next_hop_group_member_entry],
-                "available_ipv4_nexthop_entry": [
-                    available_ipv4_nexthop_entry,
-                    self.available_ipv4_nexthop_entry],
-                "available_ipv6_nexthop_entry": [
-                    available_ipv6_nexthop_entry,
-                    self.available_ipv6_nexthop_entry],
-                "available_fdb_entry": [
-                    available_fdb_entry,
-                    self.available_fdb_entry],
-                "available_ipv6_route_entry": [
-                    available_ipv6_route_entry,
-                    self.available_ipv6_route_entry],
-                "available_ipv4_route_entry": [
-                    available_ipv4_route_entry,
-                    self.available_ipv4_route_entry]}
-
-            for key in resources_dict:
-                if (resources_dict[key][0] !=
-                        resources_dict[key][1]):
-                    print(key, " != ", resources_dict[key][0])
-                    result = False
-                    break
-
-            if debug:
-                if result:
-                    print("Number of resources OK")
-                else:
-                    print("Number of resources NOT OK")
+        if self.test_params.get('skip_resource_check', False):
+            return True
+        resources = self.getNumberOfAvaiableResources()
+        saved_resources = {name: getattr(self, name)
+                           for name in AVAILABLE_RESOURCES}
+        result = resources == saved_resources
+        if not result:
+            key = next(name for name in AVAILABLE_RESOURCES
+                       if resources[name] != saved_resources[name])
+            print(key, " != ", resources[key])
 
-        finally:
-            pass
+        if debug:
+            if result:
+                print("Number of resources OK")
+            else:
+                print("Number of resources NOT OK")
 
         return result
 
@@ -662,318 +825,203 @@ class SaiHelper(SaiHelperBase):
     def setUp(self):
         SaiHelperBase.setUp(self)
 
-        # create bridge ports
-        self.port0_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port0,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.port0_bp != 0)
-        self.port1_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port1,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.port1_bp != 0)
-        self.port2_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port2,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.port2_bp != 0)
-        self.port3_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port3,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.port3_bp != 0)
-        self.port20_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port20,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.port20_bp != 0)
-        self.port21_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port21,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.port21_bp != 0)
-
-        # create LAGs
-        self.lag1 = sai_thrift_create_lag(self.client)
-        self.assertTrue(self.lag1 != 0)
-        self.lag1_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.lag1,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.lag1_bp != 0)
-        self.lag1_member4 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag1, port_id=self.port4)
-        self.lag1_member5 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag1, port_id=self.port5)
-        self.lag1_member6 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag1, port_id=self.port6)
-
-        self.lag2 = sai_thrift_create_lag(self.client)
-        self.assertTrue(self.lag2 != 0)
-        self.lag2_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.lag2,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.lag2_bp != 0)
-        self.lag2_member7 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag2, port_id=self.port7)
-        self.lag2_member8 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag2, port_id=self.port8)
-        self.lag2_member9 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag2, port_id=self.port9)
-
-        # L3 lags
-        self.lag3 = sai_thrift_create_lag(self.client)
-        self.assertTrue(self.lag3 != 0)
-        self.lag3_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.lag3,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.lag3_bp != 0)
-        self.lag3_member14 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag3, port_id=self.port14)
-        self.lag3_member15 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag3, port_id=self.port15)
-        self.lag3_member16 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag3, port_id=self.port16)
-
-        self.lag4 = sai_thrift_create_lag(self.client)
-        self.assertTrue(self.lag4 != 0)
-        self.lag4_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.lag4,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.lag4_bp != 0)
-        self.lag4_member17 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag4, port_id=self.port17)
-        self.lag4_member18 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag4, port_id=self.port18)
-        self.lag4_member19 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag4, port_id=self.port19)
-
-        self.lag5 = sai_thrift_create_lag(self.client)
-        self.assertTrue(self.lag5 != 0)
-        self.lag5_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.lag5,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-        self.assertTrue(self.lag5_bp != 0)
-        self.lag5_member22 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag5, port_id=self.port22)
-        self.lag5_member23 = sai_thrift_create_lag_member(
-            self.client, lag_id=self.lag5, port_id=self.port23)
-
-        # create vlan 10 with port0, port1 and lag1
-        self.vlan10 = sai_thrift_create_vlan(self.client, vlan_id=10)
-        self.assertTrue(self.vlan10 != 0)
-        self.vlan10_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan10,
-            bridge_port_id=self.port0_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan10_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan10,
-            bridge_port_id=self.port1_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
-        self.vlan10_member2 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan10,
-            bridge_port_id=self.lag1_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-
-        # create vlan 20 with port2, port3 and lag2
-        self.vlan20 = sai_thrift_create_vlan(self.client, vlan_id=20)
-        self.assertTrue(self.vlan20 != 0)
-        self.vlan20_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan20,
-            bridge_port_id=self.port2_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan20_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan20,
-            bridge_port_id=self.port3_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
-        self.vlan20_member2 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan20,
-            bridge_port_id=self.lag2_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
-
-        # create vlan 30 with port20, port21 and lag5
-        self.vlan30 = sai_thrift_create_vlan(self.client, vlan_id=30)
-        self.assertTrue(self.vlan30 != 0)
-        self.vlan30_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan30,
-            bridge_port_id=self.port20_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan30_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan30,
-            bridge_port_id=self.port21_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
-        self.vlan30_member2 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan30,
-            bridge_port_id=self.lag5_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
-
-        # setup untagged ports
-        sai_thrift_set_port_attribute(self.client, self.port0, port_vlan_id=10)
-        sai_thrift_set_lag_attribute(self.client, self.lag1, port_vlan_id=10)
-        sai_thrift_set_port_attribute(self.client, self.port2, port_vlan_id=20)
-        sai_thrift_set_port_attribute(
-            self.client, self.port20, port_vlan_id=30)
-
-        # create L3 configuration
-        self.vlan30_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
-            virtual_router_id=self.default_vrf,
-            vlan_id=self.vlan30)
-        self.assertTrue(self.vlan30_rif != 0)
-
-        self.lag3_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-            virtual_router_id=self.default_vrf,
-            port_id=self.lag3)
-        self.assertTrue(self.lag3_rif != 0)
-
-        self.lag4_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-            virtual_router_id=self.default_vrf,
-            port_id=self.lag4)
-        self.assertTrue(self.lag4_rif != 0)
-
-        self.port10_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-            virtual_router_id=self.default_vrf,
-            port_id=self.port10)
-        self.assertTrue(self.port10_rif != 0)
-
-        self.port11_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-            virtual_router_id=self.default_vrf,
-            port_id=self.port11)
-        self.assertTrue(self.port11_rif != 0)
-
-        self.port12_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-            virtual_router_id=self.default_vrf,
-            port_id=self.port12)
-        self.assertTrue(self.port12_rif != 0)
-
-        self.port13_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-            virtual_router_id=self.default_vrf,
-            port_id=self.port13)
-        self.assertTrue(self.port13_rif != 0)
+        # create bridge ports, LAGs and vlans 10, 20 and 30,
+        # responses are read at once
+        with SaiPipeline(self.client) as pipeline:
+            for port in [self.port0, self.port1, self.port2, self.port3,
+                         self.port20, self.port21]:
+                sai_thrift_create_bridge_port(
+                    pipeline,
+                    bridge_id=self.default_1q_bridge,
+                    port_id=port,
+                    type=SAI_BRIDGE_PORT_TYPE_PORT,
+                    admin_state=True)
+            # lag3 and lag4 are used as L3 lags
+            for _ in range(0, 5):
+                sai_thrift_create_lag(pipeline)
+            for vlan_id in [10, 20, 30]:
+                sai_thrift_create_vlan(pipeline, vlan_id=vlan_id)
+        (self.port0_bp, self.port1_bp, self.port2_bp, self.port3_bp,
+         self.port20_bp, self.port21_bp,
+         self.lag1, self.lag2, self.lag3, self.lag4, self.lag5,
+         self.vlan10, self.vlan20, self.vlan30) = pipeline.results
+        self.assertNotIn(SAI_NULL_OBJECT_ID, pipeline.results)
+        self.addUndo(sai_thrift_remove_bridge_port,
+                     'port0_bp', 'port1_bp', 'port2_bp', 'port3_bp',
+                     'port20_bp', 'port21_bp')
+        self.addUndo(sai_thrift_remove_lag,
+                     'lag1', 'lag2', 'lag3', 'lag4', 'lag5')
+
+        # create LAG bridge ports and members
+        lags = [self.lag1, self.lag2, self.lag3, self.lag4, self.lag5]
+        lag_members = [
+            (self.lag1, self.port4), (self.lag1, self.port5),
+            (self.lag1, self.port6),
+            (self.lag2, self.port7), (self.lag2, self.port8),
+            (self.lag2, self.port9),
+            (self.lag3, self.port14), (self.lag3, self.port15),
+            (self.lag3, self.port16),
+            (self.lag4, self.port17), (self.lag4, self.port18),
+            (self.lag4, self.port19),
+            (self.lag5, self.port22), (self.lag5, self.port23)]
+        with SaiPipeline(self.client) as pipeline:
+            for lag in lags:
+                sai_thrift_create_bridge_port(
+                    pipeline,
+                    bridge_id=self.default_1q_bridge,
+                    port_id=lag,
+                    type=SAI_BRIDGE_PORT_TYPE_PORT,
+                    admin_state=True)
+            for lag, port in lag_members:
+                sai_thrift_create_lag_member(
+                    pipeline, lag_id=lag, port_id=port)
+        (self.lag1_bp, self.lag2_bp, self.lag3_bp, self.lag4_bp, self.lag5_bp,
+         self.lag1_member4, self.lag1_member5, self.lag1_member6,
+         self.lag2_member7, self.lag2_member8, self.lag2_member9,
+         self.lag3_member14, self.lag3_member15, self.lag3_member16,
+         self.lag4_member17, self.lag4_member18, self.lag4_member19,
+         self.lag5_member22, self.lag5_member23) = pipeline.results
+        self.assertNotIn(SAI_NULL_OBJECT_ID, pipeline.results[:len(lags)])
+        self.addUndo(sai_thrift_remove_bridge_port,
+                     'lag1_bp', 'lag2_bp', 'lag3_bp', 'lag4_bp', 'lag5_bp')
+        self.addUndo(sai_thrift_remove_lag_member,
+                     'lag1_member4', 'lag1_member5', 'lag1_member6',
+                     'lag2_member7', 'lag2_member8', 'lag2_member9',
+                     'lag3_member14', 'lag3_member15', 'lag3_member16',
+                     'lag4_member17', 'lag4_member18', 'lag4_member19',
+                     'lag5_member22', 'lag5_member23')
+        self.addUndo(sai_thrift_remove_vlan, 'vlan10', 'vlan20', 'vlan30')
+
+        rif_specs = [
+            ('vlan30_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
+                                vlan_id=self.vlan30)),
+            ('lag3_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_PORT,
+                              port_id=self.lag3)),
+            ('lag4_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_PORT,
+                              port_id=self.lag4)),
+            ('port10_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_PORT,
+                                port_id=self.port10)),
+            ('port11_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_PORT,
+                                port_id=self.port11)),
+            ('port12_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_PORT,
+                                port_id=self.port12)),
+            ('port13_rif', dict(type=SAI_ROUTER_INTERFACE_TYPE_PORT,
+                                port_id=self.port13))]
+        with SaiPipeline(self.client) as pipeline:
+            # add port0, port1 and lag1 to vlan 10
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan10,
+                bridge_port_id=self.port0_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan10,
+                bridge_port_id=self.port1_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan10,
+                bridge_port_id=self.lag1_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
 
-    @staticmethod
-    def saiWaitFdbAge(timeout):
+            # add port2, port3 and lag2 to vlan 20
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan20,
+                bridge_port_id=self.port2_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan20,
+                bridge_port_id=self.port3_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan20,
+                bridge_port_id=self.lag2_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
+
+            # add port20, port21 and lag5 to vlan 30
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan30,
+                bridge_port_id=self.port20_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan30,
+                bridge_port_id=self.port21_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan30,
+                bridge_port_id=self.lag5_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_TAGGED)
+
+            # setup untagged ports
+            sai_thrift_set_port_attribute(
+                pipeline, self.port0, port_vlan_id=10)
+            sai_thrift_set_lag_attribute(pipeline, self.lag1, port_vlan_id=10)
+            sai_thrift_set_port_attribute(
+                pipeline, self.port2, port_vlan_id=20)
+            sai_thrift_set_port_attribute(
+                pipeline, self.port20, port_vlan_id=30)
+
+            # create L3 configuration
+            for _, rif_attrs in rif_specs:
+                sai_thrift_create_router_interface(
+                    pipeline,
+                    virtual_router_id=self.default_vrf,
+                    **rif_attrs)
+        (self.vlan10_member0, self.vlan10_member1, self.vlan10_member2,
+         self.vlan20_member0, self.vlan20_member1, self.vlan20_member2,
+         self.vlan30_member0, self.vlan30_member1,
+         self.vlan30_member2) = pipeline.results[:9]
+        rifs = pipeline.results[-len(rif_specs):]
+        self.assertNotIn(SAI_NULL_OBJECT_ID, rifs)
+        for (name, _), rif in zip(rif_specs, rifs):
+            setattr(self, name, rif)
+        self.addUndo(sai_thrift_remove_vlan_member,
+                     'vlan10_member0', 'vlan10_member1', 'vlan10_member2',
+                     'vlan20_member0', 'vlan20_member1', 'vlan20_member2',
+                     'vlan30_member0', 'vlan30_member1', 'vlan30_member2')
+        self.addUndo(sai_thrift_set_port_attribute, 'port0', port_vlan_id=0)
+        self.addUndo(sai_thrift_set_lag_attribute, 'lag1', port_vlan_id=0)
+        self.addUndo(sai_thrift_set_port_attribute, 'port2', 'port20',
+                     port_vlan_id=0)
+        self.addUndo(sai_thrift_remove_router_interface,
+                     *[name for name, _ in rif_specs])
+
+    def saiWaitFdbAge(self, timeout, fdb_entry=None):
         """ sai_wait_fdb_age() - Wait for fdb entry to ageout
 
+        Without fdb_entry the whole timeout is waited, e.g. to check that
+        an entry is not removed too early. With fdb_entry the wait ends as
+        soon as the entry is removed.
+
         Args:
             timeout (int): Timeout value in seconds
+            fdb_entry (sai_thrift_fdb_entry_t): entry expected to age out
         """
         print("Waiting for fdb entry to Age")
         aging_interval_buffer = 10
-        time.sleep(timeout + aging_interval_buffer)
+        if fdb_entry is None:
+            time.sleep(timeout + aging_interval_buffer)
+            return
 
-    def tearDown(self):
-        sai_thrift_remove_router_interface(self.client, self.vlan30_rif)
-        sai_thrift_remove_router_interface(self.client, self.port10_rif)
-        sai_thrift_remove_router_interface(self.client, self.port11_rif)
-        sai_thrift_remove_router_interface(self.client, self.port12_rif)
-        sai_thrift_remove_router_interface(self.client, self.port13_rif)
-        sai_thrift_remove_router_interface(self.client, self.lag3_rif)
-        sai_thrift_remove_router_interface(self.client, self.lag4_rif)
-
-        sai_thrift_set_port_attribute(self.client, self.port20, port_vlan_id=0)
-        sai_thrift_set_port_attribute(self.client, self.port2, port_vlan_id=0)
-        sai_thrift_set_lag_attribute(self.client, self.lag1, port_vlan_id=0)
-        sai_thrift_set_port_attribute(self.client, self.port0, port_vlan_id=0)
-
-        # remove vlan config
-        sai_thrift_remove_vlan_member(self.client, self.vlan30_member2)
-        sai_thrift_remove_vlan_member(self.client, self.vlan30_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan30_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan30)
-        sai_thrift_remove_vlan_member(self.client, self.vlan20_member2)
-        sai_thrift_remove_vlan_member(self.client, self.vlan20_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan20_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan20)
-        sai_thrift_remove_vlan_member(self.client, self.vlan10_member2)
-        sai_thrift_remove_vlan_member(self.client, self.vlan10_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan10_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan10)
-
-        # remove lag config
-        sai_thrift_remove_lag_member(self.client, self.lag5_member22)
-        sai_thrift_remove_lag_member(self.client, self.lag5_member23)
-        sai_thrift_remove_bridge_port(self.client, self.lag5_bp)
-        sai_thrift_remove_lag(self.client, self.lag5)
-        sai_thrift_remove_lag_member(self.client, self.lag4_member19)
-        sai_thrift_remove_lag_member(self.client, self.lag4_member18)
-        sai_thrift_remove_lag_member(self.client, self.lag4_member17)
-        sai_thrift_remove_bridge_port(self.client, self.lag4_bp)
-        sai_thrift_remove_lag(self.client, self.lag4)
-        sai_thrift_remove_lag_member(self.client, self.lag3_member16)
-        sai_thrift_remove_lag_member(self.client, self.lag3_member15)
-        sai_thrift_remove_lag_member(self.client, self.lag3_member14)
-        sai_thrift_remove_bridge_port(self.client, self.lag3_bp)
-        sai_thrift_remove_lag(self.client, self.lag3)
-        sai_thrift_remove_lag_member(self.client, self.lag2_member9)
-        sai_thrift_remove_lag_member(self.client, self.lag2_member8)
-        sai_thrift_remove_lag_member(self.client, self.lag2_member7)
-        sai_thrift_remove_bridge_port(self.client, self.lag2_bp)
-        sai_thrift_remove_lag(self.client, self.lag2)
-        sai_thrift_remove_lag_member(self.client, self.lag1_member6)
-        sai_thrift_remove_lag_member(self.client, self.lag1_member5)
-        sai_thrift_remove_lag_member(self.client, self.lag1_member4)
-        sai_thrift_remove_bridge_port(self.client, self.lag1_bp)
-        sai_thrift_remove_lag(self.client, self.lag1)
-
-        # remove bridge ports
-        sai_thrift_remove_bridge_port(self.client, self.port21_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port20_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port3_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port2_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port1_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port0_bp)
-
-        SaiHelperBase.tearDown(self)
+        deadline = time.monotonic() + timeout + aging_interval_buffer
+        interval = 0.25
+        while True:
+            sai_thrift_get_fdb_entry_attribute(
+                self.client, fdb_entry, type=True)
+            if self.status() == SAI_STATUS_ITEM_NOT_FOUND:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, 2.0)
 
 
 class MinimalPortVlanConfig(SaiHelperBase):
@@ -1001,58 +1049,38 @@ class MinimalPortVlanConfig(SaiHelperBase):
                              'than number of active ports ({})'.format(
                                  self.port_num, self.active_ports))
 
-        self.bridge_port = []
-        self.vlan_member = []
-
-        # create bridge ports
-        for i in range(0, self.port_num):
-            bp = sai_thrift_create_bridge_port(
-                self.client, bridge_id=self.default_1q_bridge,
-                port_id=self.port_list[i], type=SAI_BRIDGE_PORT_TYPE_PORT,
-                admin_state=True)
-
-            self.assertGreater(bp, 0)
-            self.bridge_port.append(bp)
-
-        # create vlan
-        self.vlan = sai_thrift_create_vlan(self.client, vlan_id=self.vlan_id)
-        self.assertGreater(self.vlan, 0)
-
-        # add ports to vlan
-        for i in range(0, self.port_num):
-            vm = sai_thrift_create_vlan_member(
-                self.client, vlan_id=self.vlan,
-                bridge_port_id=self.bridge_port[i],
+        ports = self.port_list[:self.port_num]
+
+        # create bridge ports and vlan
+        with SaiPipeline(self.client) as pipeline:
+            create_bp = partial(
+                sai_thrift_create_bridge_port, pipeline,
+                bridge_id=self.default_1q_bridge,
+                type=SAI_BRIDGE_PORT_TYPE_PORT, admin_state=True)
+            for port in ports:
+                create_bp(port_id=port)
+            sai_thrift_create_vlan(pipeline, vlan_id=self.vlan_id)
+        self.assertNotIn(SAI_NULL_OBJECT_ID, pipeline.results)
+        self.bridge_port = pipeline.results[:-1]
+        self.vlan = pipeline.results[-1]
+        self.addUndo(sai_thrift_remove_bridge_port, *self.bridge_port)
+        self.addUndo(sai_thrift_remove_vlan, 'vlan')
+
+        # add ports to vlan and setup untagged ports
+        with SaiPipeline(self.client) as pipeline:
+            create_vm = partial(
+                sai_thrift_create_vlan_member, pipeline, vlan_id=self.vlan,
                 vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-
-            self.assertGreater(vm, 0)
-            self.vlan_member.append(vm)
-
-        # setup untagged ports
-        for i in range(0, self.port_num):
-            status = sai_thrift_set_port_attribute(
-                self.client, self.port_list[i], port_vlan_id=self.vlan_id)
-
-            self.assertEqual(status, SAI_STATUS_SUCCESS)
-
-    def tearDown(self):
-        # revert untagged ports configuration
-        for i in range(0, self.port_num):
-            sai_thrift_set_port_attribute(
-                self.client, self.port_list[i], port_vlan_id=0)
-
-        # remove ports from vlan
-        for i in range(0, self.port_num):
-            sai_thrift_remove_vlan_member(self.client, self.vlan_member[i])
-
-        # remove vlan
-        sai_thrift_remove_vlan(self.client, self.vlan)
-
-        # remove bridge ports
-        for i in range(0, self.port_num):
-            sai_thrift_remove_bridge_port(self.client, self.bridge_port[i])
-
-        super(MinimalPortVlanConfig, self).tearDown()
+            for bp in self.bridge_port:
+                create_vm(bridge_port_id=bp)
+            for port in ports:
+                sai_thrift_set_port_attribute(
+                    pipeline, port, port_vlan_id=self.vlan_id)
+        self.vlan_member = pipeline.results[:self.port_num]
+        self.assertNotIn(SAI_NULL_OBJECT_ID, self.vlan_member)
+        self.assertEqual(set(pipeline.statuses), {SAI_STATUS_SUCCESS})
+        self.addUndo(sai_thrift_remove_vlan_member, *self.vlan_member)
+        self.addUndo(sai_thrift_set_port_attribute, *ports, port_vlan_id=0)
 
 
 class SonicTopologyT1(SaiHelperBase):
@@ -1070,17 +1098,22 @@ class SonicTopologyT1(SaiHelperBase):
         self.t2_ports = []
         self.t2_ipv4_neigh = []
         self.t2_ipv6_neigh = []
-        self.t2_neigh_mac = generate_mac_addresses(
-            self.t2_neigh_num,
-            "52:54:00:13:00:00")
+        self.t2_neigh_mac = []
 
     def setUp(self):
         super(SonicTopologyT1, self).setUp()
-
-        for port_no in range(self.t2_neigh_num):
-            self.t2_ports.append(getattr(self, "dev_port%d" % port_no))
-            self.t2_ipv4_neigh.append("10.0.0.%d" % (port_no * 2 + 1))
-            self.t2_ipv6_neigh.append("fc00::%x" % (port_no * 4 + 2))
+        ports = self._port_oids
+        dev_ports = self._dev_port_nums
+
+        t2_range = range(self.t2_neigh_num)
+        self.t2_ports = [dev_ports[port_no] for port_no in t2_range]
+        self.t2_ipv4_neigh = ["10.0.0.%d" % (port_no * 2 + 1)
+                              for port_no in t2_range]
+        self.t2_ipv6_neigh = ["fc00::%x" % (port_no * 4 + 2)
+                              for port_no in t2_range]
+        self.t2_neigh_mac = generate_mac_addresses(
+            self.t2_neigh_num,
+            "52:54:00:13:00:00")
 
         # SONiC T1 configuration
         self.t1_config["t2"] = {
@@ -1089,118 +1122,120 @@ class SonicTopologyT1(SaiHelperBase):
             "nhgs": {},
             "nhs": {},
             "nhg_mbrs": {},
+            "routes": {},
         }
 
         self.t1_config["t0"] = {
             "rifs": {},
         }
 
-        # loopback RIF
-        self.rif_lpb = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_LOOPBACK,
-            virtual_router_id=self.default_vrf,
-            mtu=9100)
+        # T2 neighbors in order of creation
+        t2_neighs = []
+        for idx in t2_range:
+            for nhg_idx, neigh in enumerate([self.t2_ipv4_neigh[idx],
+                                             self.t2_ipv6_neigh[idx]]):
+                t2_neighs.append((idx, nhg_idx, neigh))
+        neigh_ips = {neigh: sai_ipaddress(neigh) for _, _, neigh in t2_neighs}
+
+        # objects which do not depend on each other are created
+        # in a single round-trip per stage
+        with SaiPipeline(self.client) as pipeline:
+            # loopback RIF
+            sai_thrift_create_router_interface(
+                pipeline,
+                type=SAI_ROUTER_INTERFACE_TYPE_LOOPBACK,
+                virtual_router_id=self.default_vrf,
+                mtu=9100)
 
-        # IPv4 & IPv6 NHGs
-        for idx in [0, 1]:
-            self.t1_config["t2"]["nhgs"][idx] = \
+            # IPv4 & IPv6 NHGs
+            for _ in [0, 1]:
                 sai_thrift_create_next_hop_group(
-                    self.client,
+                    pipeline,
                     type=SAI_NEXT_HOP_GROUP_TYPE_DYNAMIC_UNORDERED_ECMP)
 
-        for idx in range(self.t2_neigh_num):
-            # RIFs
-            rif = sai_thrift_create_router_interface(
-                self.client,
+            # T2 RIFs
+            create_port_rif = partial(
+                sai_thrift_create_router_interface,
+                pipeline,
                 virtual_router_id=self.default_vrf,
                 src_mac_address=ROUTER_MAC,
                 type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-                port_id=getattr(self, "port%d" % idx),
                 mtu=9100)
+            for idx in t2_range:
+                create_port_rif(port_id=ports[idx])
+        self.rif_lpb = pipeline.results[0]
+        for idx, nhg in enumerate(pipeline.results[1:3]):
+            self.t1_config["t2"]["nhgs"][idx] = nhg
+        for idx, rif in enumerate(pipeline.results[3:]):
             self.t1_config["t2"]["rifs"][idx] = rif
-
-            for neigh in [self.t2_ipv4_neigh[idx], self.t2_ipv6_neigh[idx]]:
+        self.addUndo(sai_thrift_remove_router_interface, self.rif_lpb)
+        self.addUndo(sai_thrift_remove_next_hop_group,
+                     *pipeline.results[1:3])
+        self.addUndo(sai_thrift_remove_router_interface,
+                     *pipeline.results[3:])
+
+        with SaiPipeline(self.client) as pipeline:
+            for idx, _, neigh in t2_neighs:
+                rif = self.t1_config["t2"]["rifs"][idx]
                 # Neighbor
                 nbr = sai_thrift_neighbor_entry_t(
-                    rif_id=rif, ip_address=sai_ipaddress(neigh))
+                    rif_id=rif, ip_address=neigh_ips[neigh])
+                self.t1_config["t2"]["neighs"][neigh] = nbr
                 sai_thrift_create_neighbor_entry(
-                    self.client,
+                    pipeline,
                     nbr,
                     dst_mac_address=self.t2_neigh_mac[idx])
 
                 # NextHop
-                nh_id = sai_thrift_create_next_hop(
-                    self.client,
+                sai_thrift_create_next_hop(
+                    pipeline,
                     type=SAI_NEXT_HOP_TYPE_IP,
-                    ip=sai_ipaddress(neigh),
+                    ip=neigh_ips[neigh],
                     router_interface_id=rif)
-                self.t1_config["t2"]["nhs"][neigh] = nh_id
-
-                # NextHop Group member
-                nhg_idx = 0 if neigh in self.t2_ipv4_neigh else 1
-                nhg_mbr = sai_thrift_create_next_hop_group_member(
-                    self.client,
-                    next_hop_group_id=self.t1_config["t2"]["nhgs"][nhg_idx],
-                    next_hop_id=nh_id)
-                self.t1_config["t2"]["nhg_mbrs"][neigh] = nhg_mbr
-
-        # Default routes
-        for idx, route in enumerate(["0.0.0.0/0", "::/0"]):
-            t2_route = sai_thrift_route_entry_t(
-                vr_id=self.default_vrf,
-                destination=sai_ipprefix(route))
-            nh_id = self.t1_config["t2"]["nhgs"][idx]
-            sai_thrift_create_route_entry(self.client,
-                                          t2_route,
-                                          next_hop_id=nh_id)
+        for (_, _, neigh), nh_id in zip(t2_neighs, pipeline.results[1::2]):
+            self.t1_config["t2"]["nhs"][neigh] = nh_id
+            self.addUndo(sai_thrift_remove_neighbor_entry,
+                         self.t1_config["t2"]["neighs"][neigh])
+            self.addUndo(sai_thrift_remove_next_hop, nh_id)
 
         rif_first = self.t2_neigh_num
         rif_last = self.t0_neigh_num + self.t2_neigh_num
-        for idx in range(rif_first, rif_last):
+        with SaiPipeline(self.client) as pipeline:
+            # NextHop Group members
+            for _, nhg_idx, neigh in t2_neighs:
+                sai_thrift_create_next_hop_group_member(
+                    pipeline,
+                    next_hop_group_id=self.t1_config["t2"]["nhgs"][nhg_idx],
+                    next_hop_id=self.t1_config["t2"]["nhs"][neigh])
+
+            # Default routes
+            for idx, route in enumerate(["0.0.0.0/0", "::/0"]):
+                t2_route = sai_thrift_route_entry_t(
+                    vr_id=self.default_vrf,
+                    destination=sai_ipprefix(route))
+                self.t1_config["t2"]["routes"][idx] = t2_route
+                nh_id = self.t1_config["t2"]["nhgs"][idx]
+                sai_thrift_create_route_entry(pipeline,
+                                              t2_route,
+                                              next_hop_id=nh_id)
+
             # T0 RIFs
-            rif = sai_thrift_create_router_interface(
-                self.client,
+            create_port_rif = partial(
+                sai_thrift_create_router_interface,
+                pipeline,
                 virtual_router_id=self.default_vrf,
                 src_mac_address=ROUTER_MAC,
                 type=SAI_ROUTER_INTERFACE_TYPE_PORT,
-                port_id=getattr(self, "port%d" % idx),
                 mtu=9100)
+            for idx in range(rif_first, rif_last):
+                create_port_rif(port_id=ports[idx])
+        for (_, _, neigh), nhg_mbr in zip(t2_neighs, pipeline.results):
+            self.t1_config["t2"]["nhg_mbrs"][neigh] = nhg_mbr
+        t0_rifs = pipeline.results[len(t2_neighs) + 2:]
+        for idx, rif in zip(range(rif_first, rif_last), t0_rifs):
             self.t1_config["t0"]["rifs"][idx] = rif
-
-    def tearDown(self):
-        # T0 RIFs
-        for rif in self.t1_config["t0"]["rifs"].values():
-            sai_thrift_remove_router_interface(self.client, rif)
-        # Default routes
-        for route in ["0.0.0.0/0", "::/0"]:
-            t2_route = sai_thrift_route_entry_t(
-                vr_id=self.default_vrf,
-                destination=sai_ipprefix(route))
-            sai_thrift_remove_route_entry(self.client, t2_route)
-
-        # For each T2 neighbor
-        for idx in range(self.t2_neigh_num):
-            rif = self.t1_config["t2"]["rifs"][idx]
-            for neigh in [self.t2_ipv4_neigh[idx], self.t2_ipv6_neigh[idx]]:
-                # NHG members
-                nhg_mbr = self.t1_config["t2"]["nhg_mbrs"][neigh]
-                sai_thrift_remove_next_hop_group_member(self.client, nhg_mbr)
-                # NHs
-                nh = self.t1_config["t2"]["nhs"][neigh]
-                sai_thrift_remove_next_hop(self.client, nh)
-                # Neighbors
-                nbr = sai_thrift_neighbor_entry_t(
-                    rif_id=rif, ip_address=sai_ipaddress(neigh))
-                sai_thrift_remove_neighbor_entry(self.client, nbr)
-            # RIFs
-            sai_thrift_remove_router_interface(self.client, rif)
-
-        # NHGs
-        for idx in [0, 1]:
-            sai_thrift_remove_next_hop_group(
-                self.client,
-                self.t1_config["t2"]["nhgs"][idx])
-        sai_thrift_remove_router_interface(self.client, self.rif_lpb)
-
-        super(SonicTopologyT1, self).tearDown()
+        self.addUndo(sai_thrift_remove_next_hop_group_member,
+                     *pipeline.results[:len(t2_neighs)])
+        self.addUndo(sai_thrift_remove_route_entry,
+                     *self.t1_config["t2"]["routes"].values())
+        self.addUndo(sai_thrift_remove_router_interface, *t0_rifs)
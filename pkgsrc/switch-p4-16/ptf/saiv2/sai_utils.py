@@ -32,6 +32,7 @@ from ptf.packet import *
 from ptf.testutils import *
 from ptf.mask import Mask
 
+import sai_adapter
 from sai_adapter import *
 
 # pylint: disable=too-many-arguments,too-many-branches,line-too-long
@@ -328,3 +329,106 @@ def delay_wrapper(func, delay=2):
 
 
 sai_thrift_flush_fdb_entries = delay_wrapper(sai_thrift_flush_fdb_entries)  # noqa pylint: disable=invalid-name
+
+
+class SaiPipeline(object):
+    """
+    Pipelines SAI RPCs over the thrift connection of the given client.
+
+    The object is passed to sai_adapter functions in place of the client.
+    Requests are sent immediately, while responses are read only when
+    the pipeline is flushed, so N calls cost a single round-trip
+    instead of N. Only calls which results are not needed before flush
+    can be pipelined, i.e. create, remove and set calls. Results are
+    available in the order the calls were made.
+
+    Example:
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_create_lag(pipeline)
+            sai_thrift_create_lag(pipeline)
+        lag1, lag2 = pipeline.results
+
+    Set calls repeating an earlier set call of the pipeline with the same
+    arguments are not sent when dedup is enabled. This is only valid when
+    nothing in between changes the attribute, e.g. in teardown sequences.
+
+    Attributes:
+        results (list): call results, SAI_NULL_OBJECT_ID for failed calls
+        statuses (list): call statuses
+    """
+
+    # limits number of unread responses, so they fit in socket buffers
+    max_pending = 64
+
+    def __init__(self, client, dedup=False):
+        self.client = client
+        self.results = []
+        self.statuses = []
+        self._pending = []
+        self._sent_sets = set() if dedup else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # an error of a pending call must not hide the one raised
+        # in the with block
+        self.flush(raise_error=exc_type is None)
+
+    def __getattr__(self, name):
+        send = getattr(self.client, 'send_' + name)
+        recv = getattr(self.client, 'recv_' + name)
+
+        def pipelined_call(*args):
+            """
+            Sends the request and postpones reading of the response.
+
+            Args:
+                args (tuple): RPC arguments
+
+            Returns:
+                None: result is available after flush
+            """
+            if (self._sent_sets is not None
+                    and name.startswith('sai_thrift_set_')):
+                # thrift structures are not hashable, their repr lists
+                # all fields
+                key = (name, repr(args))
+                if key in self._sent_sets:
+                    self._pending.append(lambda: None)
+                    return
+                self._sent_sets.add(key)
+            if len(self._pending) >= self.max_pending:
+                self.flush()
+            send(*args)
+            self._pending.append(recv)
+
+        return pipelined_call
+
+    def flush(self, raise_error=True):
+        """
+        Reads responses of all pending calls.
+
+        Args:
+            raise_error (bool): raise the first error of the pending calls
+
+        Raises:
+            sai_thrift_exception: If any call failed, raise_error is True
+                                  and sai_adapter.CATCH_EXCEPTIONS is False.
+        """
+        pending, self._pending = self._pending, []
+        error = None
+        for recv in pending:
+            # every response has to be read, even after an error,
+            # to keep the connection usable
+            try:
+                self.results.append(recv())
+                self.statuses.append(SAI_STATUS_SUCCESS)
+            except sai_thrift_exception as e:
+                self.results.append(SAI_NULL_OBJECT_ID)
+                self.statuses.append(e.status)
+                sai_adapter.status = e.status
+                error = error or e
+        if (raise_error and error is not None
+                and not sai_adapter.CATCH_EXCEPTIONS):
+            raise error
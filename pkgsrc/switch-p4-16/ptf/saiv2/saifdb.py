@@ -3779,7 +3779,7 @@ class FdbEventTest(SaiHelper):
             self.assertEqual(fdb_attr["type"], SAI_FDB_ENTRY_TYPE_DYNAMIC)
 
             print("Waiting until aging interval is gone")
-            self.saiWaitFdbAge(age_time)
+            self.saiWaitFdbAge(age_time, fdb_entry=self.mac_entry)
 
             print("Verifying FDB attributes")
             fdb_attr = sai_thrift_get_fdb_entry_attribute(self.client,
@@ -22,8 +22,37 @@
 Thrift SAI interface NAT tests
 """
 
+from functools import lru_cache
+
 from sai_base_test import *
 
+# Thrift address structs are only read, so instances are shared
+_ipaddr = lru_cache(maxsize=64)(sai_ipaddress)
+_ipprefix = lru_cache(maxsize=64)(sai_ipprefix)
+
+# ACL table lists of the no-NAT ACL tables
+_NO_NAT_ACTION_TYPES = sai_thrift_s32_list_t(
+    count=1, int32list=[SAI_ACL_ACTION_TYPE_NO_NAT])
+_RIF_BIND_POINTS = sai_thrift_s32_list_t(
+    count=1, int32list=[SAI_ACL_BIND_POINT_TYPE_ROUTER_INTERFACE])
+_SWITCH_BIND_POINTS = sai_thrift_s32_list_t(
+    count=1, int32list=[SAI_ACL_BIND_POINT_TYPE_SWITCH])
+
+
+def ip4_host_field(ip):
+    """
+    Builds ACL field data matching exactly the given IPv4 address
+
+    Args:
+        ip (str): IPv4 address
+
+    Returns:
+        sai_thrift_acl_field_data_t: ACL field data
+    """
+    return sai_thrift_acl_field_data_t(
+        data=sai_thrift_acl_field_data_data_t(ip4=ip),
+        mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
+
 
 @group('sai-acl-rif')
 class NatTranslationTest(SaiHelper):
@@ -47,26 +76,6 @@ class NatTranslationTest(SaiHelper):
         self.port_nbor_mac = "00:11:11:11:11:11"
         self.nat_ip_to_port = "30.30.30.10"
 
-        self.nat_port_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(self.port_nbor_ip),
-            router_interface_id=self.egr_port_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
-        self.nat_port_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=self.egr_port_rif,
-            ip_address=sai_ipaddress(self.port_nbor_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.nat_port_nbor,
-                                         dst_mac_address=self.port_nbor_mac,
-                                         no_host_route=True)
-
-        self.nat_port_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.port_nbor_ip + '/32'))
-        sai_thrift_create_route_entry(
-            self.client, self.nat_port_route, next_hop_id=self.nat_port_nhop)
-
         # L3 LAGs configuration
         self.ingr_lag_rif = self.lag3_rif
         self.egr_lag_rif = self.lag4_rif
@@ -81,101 +90,7 @@ class NatTranslationTest(SaiHelper):
         self.lag_nbor_mac = "00:22:22:22:22:22"
         self.nat_ip_to_lag = "30.30.30.20"
 
-        self.nat_lag_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(self.lag_nbor_ip),
-            router_interface_id=self.egr_lag_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
-        self.nat_lag_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=self.egr_lag_rif,
-            ip_address=sai_ipaddress(self.lag_nbor_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.nat_lag_nbor,
-                                         dst_mac_address=self.lag_nbor_mac,
-                                         no_host_route=True)
-
-        self.nat_lag_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.lag_nbor_ip + '/32'))
-        sai_thrift_create_route_entry(
-            self.client, self.nat_lag_route, next_hop_id=self.nat_lag_nhop)
-
         # SVI configuration
-        self.port24_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port24,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.port25_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port25,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.vlan100 = sai_thrift_create_vlan(self.client, vlan_id=100)
-        self.vlan100_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan100,
-            bridge_port_id=self.port24_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan100_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan100,
-            bridge_port_id=self.port25_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-
-        sai_thrift_set_port_attribute(
-            self.client, self.port24, port_vlan_id=100)
-        sai_thrift_set_port_attribute(
-            self.client, self.port25, port_vlan_id=100)
-
-        self.port26_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port26,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.port27_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port27,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.vlan200 = sai_thrift_create_vlan(self.client, vlan_id=200)
-        self.vlan200_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan200,
-            bridge_port_id=self.port26_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan200_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan200,
-            bridge_port_id=self.port27_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-
-        sai_thrift_set_port_attribute(
-            self.client, self.port26, port_vlan_id=200)
-        sai_thrift_set_port_attribute(
-            self.client, self.port27, port_vlan_id=200)
-
-        self.ingr_svi_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
-            virtual_router_id=self.default_vrf,
-            vlan_id=self.vlan100)
-
-        self.egr_svi_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
-            virtual_router_id=self.default_vrf,
-            vlan_id=self.vlan200)
-
         self.ingr_svi = [self.port24, self.port25]
         self.egr_svi = [self.port26, self.port27]
 
@@ -186,174 +101,232 @@ class NatTranslationTest(SaiHelper):
         self.svi_nbor_mac = "00:33:33:33:33:33"
         self.nat_ip_to_svi = "30.30.30.30"
 
-        self.nat_svi_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(self.svi_nbor_ip),
-            router_interface_id=self.egr_svi_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
+        # ACL actions disabling and enabling back NAT translation
+        self.no_nat_action = sai_thrift_acl_action_data_t(
+            enable=True,
+            parameter=sai_thrift_acl_action_parameter_t(booldata=True))
+        self.nat_action = sai_thrift_acl_action_data_t(
+            enable=True,
+            parameter=sai_thrift_acl_action_parameter_t(booldata=False))
 
-        self.nat_svi_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=self.egr_svi_rif,
-            ip_address=sai_ipaddress(self.svi_nbor_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.nat_svi_nbor,
-                                         dst_mac_address=self.svi_nbor_mac,
-                                         no_host_route=True)
+        # no-NAT route configuration
+        no_nat_rif = self.port12_rif
+        self.no_nat_eport = self.dev_port12
+
+        no_nat_ip = "30.30.30.0"
+        self.no_nat_nbor_mac = "00:33:33:33:33:33"
+
+        self.no_nat_nbor = sai_thrift_neighbor_entry_t(
+            rif_id=no_nat_rif,
+            ip_address=_ipaddr(no_nat_ip))
+
+        self.no_nat_route = sai_thrift_route_entry_t(
+            vr_id=self.default_vrf,
+            destination=_ipprefix(no_nat_ip + '/24'))
+
+        # objects are created in stages, each stage uses only objects
+        # created by the previous ones and costs a single round-trip
+        with SaiPipeline(self.client) as pipeline:
+            for port in [self.port24, self.port25, self.port26, self.port27]:
+                sai_thrift_create_bridge_port(
+                    pipeline,
+                    bridge_id=self.default_1q_bridge,
+                    port_id=port,
+                    type=SAI_BRIDGE_PORT_TYPE_PORT,
+                    admin_state=True)
+            sai_thrift_create_vlan(pipeline, vlan_id=100)
+            sai_thrift_create_vlan(pipeline, vlan_id=200)
+
+            # src and dst NAT entries match disjoint addresses, so they
+            # share one table and differ only by their counters
+            sai_thrift_create_acl_table(
+                pipeline,
+                acl_stage=SAI_ACL_STAGE_INGRESS,
+                acl_bind_point_type_list=_RIF_BIND_POINTS,
+                acl_action_type_list=_NO_NAT_ACTION_TYPES,
+                field_dst_ip=True)
+
+            sai_thrift_create_next_hop(
+                pipeline,
+                ip=_ipaddr(no_nat_ip),
+                router_interface_id=no_nat_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+            sai_thrift_create_neighbor_entry(
+                pipeline,
+                self.no_nat_nbor,
+                dst_mac_address=self.no_nat_nbor_mac,
+                no_host_route=True)
+        (self.port24_bp, self.port25_bp, self.port26_bp, self.port27_bp,
+         self.vlan100, self.vlan200,
+         self.no_nat_acl_table, self.no_nat_nhop, _) = pipeline.results
+        self.addUndo(sai_thrift_remove_bridge_port,
+                     'port24_bp', 'port25_bp', 'port26_bp', 'port27_bp')
+        self.addUndo(sai_thrift_remove_vlan, 'vlan100', 'vlan200')
+        self.addUndo(sai_thrift_remove_acl_table, 'no_nat_acl_table')
+        self.addUndo(sai_thrift_remove_next_hop, 'no_nat_nhop')
+        self.addUndo(sai_thrift_remove_neighbor_entry, 'no_nat_nbor')
 
         self.nat_svi_fdb = sai_thrift_fdb_entry_t(
             switch_id=self.switch_id,
             mac_address=self.svi_nbor_mac,
             bv_id=self.vlan200)
-        sai_thrift_create_fdb_entry(self.client,
-                                    self.nat_svi_fdb,
-                                    type=SAI_FDB_ENTRY_TYPE_STATIC,
-                                    bridge_port_id=self.port26_bp)
-
-        self.nat_svi_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.svi_nbor_ip + '/32'))
-        sai_thrift_create_route_entry(
-            self.client, self.nat_svi_route, next_hop_id=self.nat_svi_nhop)
-
-        # no-NAT ACL configuration
-        action_types = [SAI_ACL_ACTION_TYPE_NO_NAT]
-        action_types_list = sai_thrift_s32_list_t(count=len(action_types),
-                                                  int32list=action_types)
-
-        acl_action = sai_thrift_acl_action_data_t(
-            enable=True,
-            parameter=sai_thrift_acl_action_parameter_t(booldata=True))
 
-        bind_points = [SAI_ACL_BIND_POINT_TYPE_ROUTER_INTERFACE]
-        bind_points_list = sai_thrift_s32_list_t(count=len(bind_points),
-                                                 int32list=bind_points)
-
-        self.ingr_acl_table = sai_thrift_create_acl_table(
-            self.client,
-            acl_stage=SAI_ACL_STAGE_INGRESS,
-            acl_bind_point_type_list=bind_points_list,
-            acl_action_type_list=action_types_list,
-            field_dst_ip=True)
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_create_route_entry(
+                pipeline, self.no_nat_route, next_hop_id=self.no_nat_nhop)
+
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan100,
+                bridge_port_id=self.port24_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan100,
+                bridge_port_id=self.port25_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+
+            sai_thrift_set_port_attribute(
+                pipeline, self.port24, port_vlan_id=100)
+            sai_thrift_set_port_attribute(
+                pipeline, self.port25, port_vlan_id=100)
+
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan200,
+                bridge_port_id=self.port26_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan200,
+                bridge_port_id=self.port27_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+
+            sai_thrift_set_port_attribute(
+                pipeline, self.port26, port_vlan_id=200)
+            sai_thrift_set_port_attribute(
+                pipeline, self.port27, port_vlan_id=200)
+
+            sai_thrift_create_router_interface(
+                pipeline,
+                type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
+                virtual_router_id=self.default_vrf,
+                vlan_id=self.vlan100)
+            sai_thrift_create_router_interface(
+                pipeline,
+                type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
+                virtual_router_id=self.default_vrf,
+                vlan_id=self.vlan200)
+
+            sai_thrift_create_acl_counter(
+                pipeline,
+                self.no_nat_acl_table,
+                enable_packet_count=True)
+            sai_thrift_create_acl_counter(
+                pipeline,
+                self.no_nat_acl_table,
+                enable_packet_count=True)
 
-        self.ingr_acl_counter = sai_thrift_create_acl_counter(
-            self.client,
-            self.ingr_acl_table,
-            enable_packet_count=True)
+            sai_thrift_create_fdb_entry(pipeline,
+                                        self.nat_svi_fdb,
+                                        type=SAI_FDB_ENTRY_TYPE_STATIC,
+                                        bridge_port_id=self.port26_bp)
+        (_,
+         self.vlan100_member0, self.vlan100_member1, _, _,
+         self.vlan200_member0, self.vlan200_member1, _, _,
+         self.ingr_svi_rif, self.egr_svi_rif,
+         self.ingr_acl_counter, self.egr_acl_counter, _) = pipeline.results
+        self.addUndo(sai_thrift_remove_route_entry, 'no_nat_route')
+        self.addUndo(sai_thrift_remove_vlan_member,
+                     'vlan100_member0', 'vlan100_member1')
+        self.addUndo(sai_thrift_set_port_attribute, 'port24', 'port25',
+                     port_vlan_id=0)
+        self.addUndo(sai_thrift_remove_vlan_member,
+                     'vlan200_member0', 'vlan200_member1')
+        self.addUndo(sai_thrift_set_port_attribute, 'port26', 'port27',
+                     port_vlan_id=0)
+        self.addUndo(sai_thrift_remove_router_interface,
+                     'ingr_svi_rif', 'egr_svi_rif')
+        self.addUndo(sai_thrift_remove_acl_counter,
+                     'ingr_acl_counter', 'egr_acl_counter')
+        self.addUndo(sai_thrift_remove_fdb_entry, 'nat_svi_fdb')
+
+        # NAT neighbors of regular L3 port, L3 LAG and SVI
+        nat_nbors = [
+            ('port', self.egr_port_rif, self.port_nbor_ip,
+             self.port_nbor_mac, self.nat_ip_to_port),
+            ('lag', self.egr_lag_rif, self.lag_nbor_ip,
+             self.lag_nbor_mac, self.nat_ip_to_lag),
+            ('svi', self.egr_svi_rif, self.svi_nbor_ip,
+             self.svi_nbor_mac, self.nat_ip_to_svi)]
 
         ingr_acl_cnt_action = sai_thrift_acl_action_data_t(
             enable=True,
             parameter=sai_thrift_acl_action_parameter_t(
                 oid=self.ingr_acl_counter))
 
-        port_nbor_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.port_nbor_ip),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.ingr_acl_port_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.ingr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=ingr_acl_cnt_action,
-            field_dst_ip=port_nbor_ip_addr)
-
-        lag_nbor_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.lag_nbor_ip),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.ingr_acl_lag_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.ingr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=ingr_acl_cnt_action,
-            field_dst_ip=lag_nbor_ip_addr)
-
-        svi_nbor_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.svi_nbor_ip),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.ingr_acl_svi_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.ingr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=ingr_acl_cnt_action,
-            field_dst_ip=svi_nbor_ip_addr)
-
-        self.egr_acl_table = sai_thrift_create_acl_table(
-            self.client,
-            acl_stage=SAI_ACL_STAGE_INGRESS,
-            acl_bind_point_type_list=bind_points_list,
-            acl_action_type_list=action_types_list,
-            field_dst_ip=True)
-
-        self.egr_acl_counter = sai_thrift_create_acl_counter(
-            self.client,
-            self.egr_acl_table,
-            enable_packet_count=True)
-
         egr_acl_cnt_action = sai_thrift_acl_action_data_t(
             enable=True,
             parameter=sai_thrift_acl_action_parameter_t(
                 oid=self.egr_acl_counter))
 
-        to_port_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.nat_ip_to_port),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.egr_acl_port_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.egr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=egr_acl_cnt_action,
-            field_dst_ip=to_port_ip_addr)
-
-        to_lag_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.nat_ip_to_lag),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.egr_acl_lag_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.egr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=egr_acl_cnt_action,
-            field_dst_ip=to_lag_ip_addr)
-
-        to_svi_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.nat_ip_to_svi),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.egr_acl_svi_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.egr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=egr_acl_cnt_action,
-            field_dst_ip=to_svi_ip_addr)
-
-        # no-NAT route configuration
-        no_nat_rif = self.port12_rif
-        self.no_nat_eport = self.dev_port12
-
-        no_nat_ip = "30.30.30.0"
-        self.no_nat_nbor_mac = "00:33:33:33:33:33"
-
-        self.no_nat_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(no_nat_ip),
-            router_interface_id=no_nat_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
-        self.no_nat_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=no_nat_rif,
-            ip_address=sai_ipaddress(no_nat_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.no_nat_nbor,
-                                         dst_mac_address=self.no_nat_nbor_mac,
-                                         no_host_route=True)
-
-        self.no_nat_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(no_nat_ip + '/24'))
-        sai_thrift_create_route_entry(
-            self.client, self.no_nat_route, next_hop_id=self.no_nat_nhop)
+        with SaiPipeline(self.client) as pipeline:
+            for name, rif, nbor_ip, nbor_mac, _ in nat_nbors:
+                sai_thrift_create_next_hop(
+                    pipeline,
+                    ip=_ipaddr(nbor_ip),
+                    router_interface_id=rif,
+                    type=SAI_NEXT_HOP_TYPE_IP)
+
+                nbor = sai_thrift_neighbor_entry_t(
+                    rif_id=rif, ip_address=_ipaddr(nbor_ip))
+                setattr(self, 'nat_%s_nbor' % name, nbor)
+                sai_thrift_create_neighbor_entry(pipeline,
+                                                 nbor,
+                                                 dst_mac_address=nbor_mac,
+                                                 no_host_route=True)
+
+            for _, _, nbor_ip, _, _ in nat_nbors:
+                sai_thrift_create_acl_entry(
+                    pipeline,
+                    table_id=self.no_nat_acl_table,
+                    action_no_nat=self.no_nat_action,
+                    action_counter=ingr_acl_cnt_action,
+                    field_dst_ip=ip4_host_field(nbor_ip))
+
+            for _, _, _, _, nat_ip in nat_nbors:
+                sai_thrift_create_acl_entry(
+                    pipeline,
+                    table_id=self.no_nat_acl_table,
+                    action_no_nat=self.no_nat_action,
+                    action_counter=egr_acl_cnt_action,
+                    field_dst_ip=ip4_host_field(nat_ip))
+        (self.nat_port_nhop, _, self.nat_lag_nhop, _, self.nat_svi_nhop, _,
+         self.ingr_acl_port_entry, self.ingr_acl_lag_entry,
+         self.ingr_acl_svi_entry,
+         self.egr_acl_port_entry, self.egr_acl_lag_entry,
+         self.egr_acl_svi_entry) = pipeline.results
+        for name, _, _, _, _ in nat_nbors:
+            self.addUndo(sai_thrift_remove_next_hop, 'nat_%s_nhop' % name)
+            self.addUndo(sai_thrift_remove_neighbor_entry,
+                         'nat_%s_nbor' % name)
+        self.addUndo(sai_thrift_remove_acl_entry,
+                     'ingr_acl_port_entry', 'ingr_acl_lag_entry',
+                     'ingr_acl_svi_entry',
+                     'egr_acl_port_entry', 'egr_acl_lag_entry',
+                     'egr_acl_svi_entry')
+
+        with SaiPipeline(self.client) as pipeline:
+            for name, _, nbor_ip, _, _ in nat_nbors:
+                route = sai_thrift_route_entry_t(
+                    vr_id=self.default_vrf,
+                    destination=_ipprefix(nbor_ip + '/32'))
+                setattr(self, 'nat_%s_route' % name, route)
+                sai_thrift_create_route_entry(
+                    pipeline, route,
+                    next_hop_id=getattr(self, 'nat_%s_nhop' % name))
+                self.addUndo(sai_thrift_remove_route_entry,
+                             'nat_%s_route' % name)
 
     def runTest(self):
         try:
@@ -363,60 +336,14 @@ class NatTranslationTest(SaiHelper):
         finally:
             pass
 
-    def tearDown(self):
-        sai_thrift_remove_route_entry(self.client, self.no_nat_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.no_nat_nbor)
-        sai_thrift_remove_next_hop(self.client, self.no_nat_nhop)
-
-        sai_thrift_remove_acl_entry(self.client, self.egr_acl_svi_entry)
-        sai_thrift_remove_acl_entry(self.client, self.egr_acl_lag_entry)
-        sai_thrift_remove_acl_entry(self.client, self.egr_acl_port_entry)
-        sai_thrift_remove_acl_counter(self.client, self.egr_acl_counter)
-        sai_thrift_remove_acl_table(self.client, self.egr_acl_table)
-        sai_thrift_remove_acl_entry(self.client, self.ingr_acl_svi_entry)
-        sai_thrift_remove_acl_entry(self.client, self.ingr_acl_lag_entry)
-        sai_thrift_remove_acl_entry(self.client, self.ingr_acl_port_entry)
-        sai_thrift_remove_acl_counter(self.client, self.ingr_acl_counter)
-        sai_thrift_remove_acl_table(self.client, self.ingr_acl_table)
-
-        sai_thrift_remove_fdb_entry(self.client, self.nat_svi_fdb)
-        sai_thrift_remove_route_entry(self.client, self.nat_svi_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.nat_svi_nbor)
-        sai_thrift_remove_next_hop(self.client, self.nat_svi_nhop)
-        sai_thrift_remove_router_interface(self.client, self.egr_svi_rif)
-        sai_thrift_remove_router_interface(self.client, self.ingr_svi_rif)
-        sai_thrift_set_port_attribute(self.client, self.port26, port_vlan_id=0)
-        sai_thrift_set_port_attribute(self.client, self.port27, port_vlan_id=0)
-        sai_thrift_remove_vlan_member(self.client, self.vlan200_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan200_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan200)
-        sai_thrift_remove_bridge_port(self.client, self.port27_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port26_bp)
-        sai_thrift_set_port_attribute(self.client, self.port25, port_vlan_id=0)
-        sai_thrift_set_port_attribute(self.client, self.port24, port_vlan_id=0)
-        sai_thrift_remove_vlan_member(self.client, self.vlan100_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan100_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan100)
-        sai_thrift_remove_bridge_port(self.client, self.port25_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port24_bp)
-
-        sai_thrift_remove_route_entry(self.client, self.nat_lag_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.nat_lag_nbor)
-        sai_thrift_remove_next_hop(self.client, self.nat_lag_nhop)
-
-        sai_thrift_remove_route_entry(self.client, self.nat_port_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.nat_port_nbor)
-        sai_thrift_remove_next_hop(self.client, self.nat_port_nhop)
-
-        super(NatTranslationTest, self).tearDown()
-
-    def _verifyAclCounter(self, acl_counter, prev_value):
+    def _verifyAclCounter(self, acl_counter, prev_value, count=1):
         '''
         Helper function for verifying if given ACL counter was incremented.
 
         Args:
             acl_counter (oid): object ID of ACL counter to be read
             prev_value (int): przevious counter value
+            count (int): expected increment
 
         Return:
             bool: True if counter was incremented; False otherwise
@@ -425,19 +352,19 @@ class NatTranslationTest(SaiHelper):
             self.client, acl_counter, packets=True)
         counter = counter['packets']
 
-        if counter == prev_value + 1:
-            print("ACL hit")
-            return True
+        return counter == prev_value + count
 
-        return False
-
-    def _verifyNatHit(self, nat_entry):
+    def _verifyNatHit(self, nat_entry, prev_value=0, count=1):
         '''
         Helper function for verifying if given NAT entry was hit.
+        The counter is not cleared, so callers track the number of hits
+        and reset it once they are done with the entry.
 
         Args:
             nat_entry (oid): object ID of NAT entry for which counter is
                              to be read
+            prev_value (int): previous NAT entry counter value
+            count (int): expected number of hits
 
         Return:
             bool: True if NAT was hit; False otherwise
@@ -446,14 +373,70 @@ class NatTranslationTest(SaiHelper):
             self.client, nat_entry, packet_count=True)
         counter = counter['packet_count']
 
-        if counter != 1:
-            return False
+        return counter == prev_value + count
+
+    def _step(self, msg, src_port_dev, pkts, dst_port_dev,
+              nat_entry=None, acl_counter=None, prev_value=0):
+        '''
+        Helper function sending packets and verifying they were forwarded
+        as expected and hit given NAT entry or ACL counter. The counter
+        is read once, after all the packets were verified.
+
+        Args:
+            msg (str): step description
+            src_port_dev (int): ingress device port number
+            pkts (list): (packet to be sent, expected packet) pairs
+            dst_port_dev (int or list): egress device port number or list
+                                        of egress LAG member port numbers
+            nat_entry (oid): NAT entry expected to be hit
+            acl_counter (oid): ACL counter expected to be incremented
+            prev_value (int): previous NAT entry or ACL counter value
+
+        Return:
+            int: NAT entry or ACL counter value after the step
+        '''
+        if isinstance(dst_port_dev, list):
+            # verify_packet_any_port checks that no other packet arrived,
+            # so each packet has to be verified before the next one is sent
+            for pkt, exp_pkt in pkts:
+                send_packet(self, src_port_dev, pkt)
+                verify_packet_any_port(self, exp_pkt, dst_port_dev)
+        else:
+            for pkt, _ in pkts:
+                send_packet(self, src_port_dev, pkt)
+            for _, exp_pkt in pkts:
+                verify_packet(self, exp_pkt, dst_port_dev)
+
+        if nat_entry is not None:
+            self.assertTrue(
+                self._verifyNatHit(nat_entry, prev_value, len(pkts)),
+                "%s: NAT entry not hit" % msg)
+        else:
+            self.assertTrue(
+                self._verifyAclCounter(acl_counter, prev_value, len(pkts)),
+                "%s: ACL counter not incremented" % msg)
+        # a single line per step, reported once it passed
+        print("%s\tOK" % msg)
+
+        return prev_value + len(pkts)
+
+    def _restoreRifs(self, pipeline, zone_rifs):
+        '''
+        Helper function restoring the default ingress ACL of the ingress
+        RIFs and the default NAT zone of the RIFs moved to another zone.
+        RIFs left in the default zone are not written.
 
-        print("NAT hit")
-        sai_thrift_set_nat_entry_attribute(
-            self.client, nat_entry, packet_count=0)
+        Args:
+            pipeline (SaiPipeline): pipeline the requests are queued in
+            zone_rifs (list): RIFs whose NAT zone was changed
+        '''
+        for rif in [self.ingr_svi_rif, self.ingr_lag_rif, self.ingr_port_rif]:
+            sai_thrift_set_router_interface_attribute(
+                pipeline, rif, ingress_acl=0)
 
-        return True
+        for rif in zone_rifs:
+            sai_thrift_set_router_interface_attribute(
+                pipeline, rif, nat_zone_id=0)
 
     def srcNatAclTranslationDisableTest(self):
         '''
@@ -468,347 +451,134 @@ class NatTranslationTest(SaiHelper):
         src_ip = "20.20.20.1"
         nat_src_ip = "150.10.10.10"
 
-        def verify_translation(src_rif, src_port_dev):
+        def build_pkts(nbor_ip, nbor_mac):
             '''
-            Additional helper function for translation verification.
-            Verifies if translation doesn't occur when ACL is configured
-            to disable it.
+            Additional helper function building the TCP and UDP packets
+            sent and expected (with and without translation) for given
+            egress neighbor.
 
             Args:
-                src_rif (oid): object ID of source RIF
-                src_port_dev (int): source device port number
-            '''
-            acl_counter = sai_thrift_get_acl_counter_attribute(
-                self.client, self.ingr_acl_counter, packets=True)['packets']
+                nbor_ip (str): egress neighbor IP address
+                nbor_mac (str): egress neighbor MAC address
 
-            # use route to L3 port
-            print("   -> Egress L3 port")
+            Returns:
+                tuple: (sent, translated) and (sent, not translated)
+                       packet pairs for TCP and UDP
+            '''
             tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
                                         ip_src=src_ip,
-                                        ip_dst=self.port_nbor_ip,
+                                        ip_dst=nbor_ip,
                                         ip_ttl=64,
                                         pktlen=100,
                                         with_tcp_chksum=True)
-            nat_tcp_pkt = simple_tcp_packet(eth_dst=self.port_nbor_mac,
+            nat_tcp_pkt = simple_tcp_packet(eth_dst=nbor_mac,
                                             eth_src=ROUTER_MAC,
                                             ip_src=nat_src_ip,
-                                            ip_dst=self.port_nbor_ip,
+                                            ip_dst=nbor_ip,
                                             ip_ttl=63,
                                             pktlen=100,
                                             with_tcp_chksum=True)
-            no_nat_tcp_pkt = simple_tcp_packet(eth_dst=self.port_nbor_mac,
+            no_nat_tcp_pkt = simple_tcp_packet(eth_dst=nbor_mac,
                                                eth_src=ROUTER_MAC,
                                                ip_src=src_ip,
-                                               ip_dst=self.port_nbor_ip,
+                                               ip_dst=nbor_ip,
                                                ip_ttl=63,
                                                pktlen=100,
                                                with_tcp_chksum=True)
 
             udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
                                         ip_src=src_ip,
-                                        ip_dst=self.port_nbor_ip,
+                                        ip_dst=nbor_ip,
                                         ip_ttl=64,
                                         pktlen=100)
-            nat_udp_pkt = simple_udp_packet(eth_dst=self.port_nbor_mac,
+            nat_udp_pkt = simple_udp_packet(eth_dst=nbor_mac,
                                             eth_src=ROUTER_MAC,
                                             ip_src=nat_src_ip,
-                                            ip_dst=self.port_nbor_ip,
+                                            ip_dst=nbor_ip,
                                             ip_ttl=63,
                                             pktlen=100)
-            no_nat_udp_pkt = simple_udp_packet(eth_dst=self.port_nbor_mac,
+            no_nat_udp_pkt = simple_udp_packet(eth_dst=nbor_mac,
                                                eth_src=ROUTER_MAC,
                                                ip_src=src_ip,
-                                               ip_dst=self.port_nbor_ip,
+                                               ip_dst=nbor_ip,
                                                ip_ttl=63,
                                                pktlen=100)
 
-            print("Sending TCP packet with NAT enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, nat_tcp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
+            # sent packets are serialized once, expected ones are kept as
+            # scapy packets for readable verification failures
+            tcp_pkt = bytes(tcp_pkt)
+            udp_pkt = bytes(udp_pkt)
 
-            print("Sending UDP packet with NAT enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, nat_udp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
+            return ([(tcp_pkt, nat_tcp_pkt), (udp_pkt, nat_udp_pkt)],
+                    [(tcp_pkt, no_nat_tcp_pkt), (udp_pkt, no_nat_udp_pkt)])
 
-            print("Disabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, src_rif, ingress_acl=self.ingr_acl_table)
-
-            print("Sending TCP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=False))
+        # packets are never modified, so they are built once per egress
+        # neighbor and reused for every ingress port
+        egress_targets = [
+            ("L3 port", build_pkts(self.port_nbor_ip, self.port_nbor_mac),
+             self.egr_port_dev, self.ingr_acl_port_entry),
+            ("L3 LAG", build_pkts(self.lag_nbor_ip, self.lag_nbor_mac),
+             self.egr_lag_dev, self.ingr_acl_lag_entry),
+            ("SVI", build_pkts(self.svi_nbor_ip, self.svi_nbor_mac),
+             self.dev_port26, self.ingr_acl_svi_entry)]
 
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                self.ingr_acl_port_entry,
-                action_no_nat=acl_action)
-
-            print("Sending TCP packet with NAT acl entry enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, nat_tcp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, nat_udp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=True))
+        def verify_translation(src_rif, src_port_dev):
+            '''
+            Additional helper function for translation verification.
+            Verifies if translation doesn't occur when ACL is configured
+            to disable it.
 
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                self.ingr_acl_port_entry,
-                action_no_nat=acl_action)
-            acl_counter = 0
-
-            print("Sending TCP packet with NAT acl entry disabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry disabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, src_rif, ingress_acl=0)
-            acl_counter = 0
-
-            # use route to L3 LAG
-            print("   -> Egress L3 LAG")
-            tcp_pkt[IP].dst = self.lag_nbor_ip
-
-            nat_tcp_pkt[Ether].dst = self.lag_nbor_mac
-            nat_tcp_pkt[IP].dst = self.lag_nbor_ip
-            no_nat_tcp_pkt[Ether].dst = self.lag_nbor_mac
-            no_nat_tcp_pkt[IP].dst = self.lag_nbor_ip
-
-            udp_pkt[IP].dst = self.lag_nbor_ip
-            nat_udp_pkt[Ether].dst = self.lag_nbor_mac
-            nat_udp_pkt[IP].dst = self.lag_nbor_ip
-            no_nat_udp_pkt[Ether].dst = self.lag_nbor_mac
-            no_nat_udp_pkt[IP].dst = self.lag_nbor_ip
-
-            print("Sending TCP packet with NAT enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet_any_port(self, nat_tcp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet_any_port(self, nat_udp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, src_rif, ingress_acl=self.ingr_acl_table)
-
-            print("Sending TCP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet_any_port(self, no_nat_tcp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet_any_port(self, no_nat_udp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=False))
+            Args:
+                src_rif (oid): object ID of source RIF
+                src_port_dev (int): source device port number
+            '''
+            acl_counter = sai_thrift_get_acl_counter_attribute(
+                self.client, self.ingr_acl_counter, packets=True)['packets']
+            nat_hits = 0
 
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                self.ingr_acl_lag_entry,
-                action_no_nat=acl_action)
-
-            print("Sending TCP packet with NAT acl entry enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet_any_port(self, nat_tcp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet_any_port(self, nat_udp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=True))
+            for name, pkts, dst_port_dev, acl_entry in egress_targets:
+                nat_pkts, no_nat_pkts = pkts
+                print("   -> Egress %s" % name)
+                nat_hits = self._step(
+                    "Sending TCP and UDP packets with NAT enabled",
+                    src_port_dev, nat_pkts, dst_port_dev,
+                    nat_entry=snat, prev_value=nat_hits)
 
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                self.ingr_acl_lag_entry,
-                action_no_nat=acl_action)
-            acl_counter = 0
-
-            print("Sending TCP packet with NAT acl entry disabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet_any_port(self, no_nat_tcp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry disabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet_any_port(self, no_nat_udp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, src_rif, ingress_acl=0)
-            acl_counter = 0
-
-            # use route to SVI
-            print("   -> Egress SVI")
-            tcp_pkt[IP].dst = self.svi_nbor_ip
-
-            nat_tcp_pkt[Ether].dst = self.svi_nbor_mac
-            nat_tcp_pkt[IP].dst = self.svi_nbor_ip
-            no_nat_tcp_pkt[Ether].dst = self.svi_nbor_mac
-            no_nat_tcp_pkt[IP].dst = self.svi_nbor_ip
-
-            udp_pkt[IP].dst = self.svi_nbor_ip
-            nat_udp_pkt[Ether].dst = self.svi_nbor_mac
-            nat_udp_pkt[IP].dst = self.svi_nbor_ip
-            no_nat_udp_pkt[Ether].dst = self.svi_nbor_mac
-            no_nat_udp_pkt[IP].dst = self.svi_nbor_ip
-
-            print("Sending TCP packet with NAT enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, nat_tcp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, nat_udp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, src_rif, ingress_acl=self.ingr_acl_table)
-
-            print("Sending TCP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=False))
+                print("Disabling NAT on src RIF")
+                sai_thrift_set_router_interface_attribute(
+                    self.client, src_rif, ingress_acl=self.no_nat_acl_table)
 
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                self.ingr_acl_svi_entry,
-                action_no_nat=acl_action)
-
-            print("Sending TCP packet with NAT acl entry enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, nat_tcp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, nat_udp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=True))
+                acl_counter = self._step(
+                    "Sending TCP and UDP packets with NAT disabled by ACL",
+                    src_port_dev, no_nat_pkts, dst_port_dev,
+                    acl_counter=self.ingr_acl_counter, prev_value=acl_counter)
 
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                self.ingr_acl_svi_entry,
-                action_no_nat=acl_action)
-            acl_counter = 0
-
-            print("Sending TCP packet with NAT acl entry disabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry disabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, src_rif, ingress_acl=0)
-            acl_counter = 0
+                print("Enabling NAT on src RIF acl entry")
+                sai_thrift_set_acl_entry_attribute(
+                    self.client, acl_entry, action_no_nat=self.nat_action)
+
+                nat_hits = self._step(
+                    "Sending TCP and UDP packets with NAT acl entry enabled",
+                    src_port_dev, nat_pkts, dst_port_dev,
+                    nat_entry=snat, prev_value=nat_hits)
+
+                print("Disabling NAT on src RIF acl entry")
+                sai_thrift_set_acl_entry_attribute(
+                    self.client, acl_entry, action_no_nat=self.no_nat_action)
+                acl_counter = 0
+
+                acl_counter = self._step(
+                    "Sending TCP and UDP packets with NAT acl entry disabled",
+                    src_port_dev, no_nat_pkts, dst_port_dev,
+                    acl_counter=self.ingr_acl_counter, prev_value=acl_counter)
+
+                print("Enabling NAT on src RIF")
+                sai_thrift_set_router_interface_attribute(
+                    self.client, src_rif, ingress_acl=0)
+                acl_counter = 0
+
+            sai_thrift_set_nat_entry_attribute(
+                self.client, snat, packet_count=0)
 
         try:
             nat_data = sai_thrift_nat_entry_data_t(
@@ -826,20 +596,14 @@ class NatTranslationTest(SaiHelper):
                                         nat_type=SAI_NAT_TYPE_SOURCE_NAT,
                                         enable_packet_count=True)
 
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=1)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=1)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=1)
+            # ingress RIFs stay in the default NAT zone 0
+            with SaiPipeline(self.client) as pipeline:
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.egr_port_rif, nat_zone_id=1)
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.egr_lag_rif, nat_zone_id=1)
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.egr_svi_rif, nat_zone_id=1)
 
             print("\n***Ingress L3 port***")
             verify_translation(self.ingr_port_rif, self.ingr_port_dev)
@@ -853,29 +617,12 @@ class NatTranslationTest(SaiHelper):
                 verify_translation(self.ingr_svi_rif, svi_port)
 
         finally:
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, ingress_acl=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, ingress_acl=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, ingress_acl=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
+            with SaiPipeline(self.client) as pipeline:
+                self._restoreRifs(
+                    pipeline,
+                    [self.egr_port_rif, self.egr_lag_rif, self.egr_svi_rif])
 
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_remove_nat_entry(self.client, snat)
+                sai_thrift_remove_nat_entry(pipeline, snat)
 
     def dstNatAclTranslationDisableTest(self):
         '''
@@ -887,44 +634,23 @@ class NatTranslationTest(SaiHelper):
         '''
         print("\ndstNatAclTranslationDisableTest()")
 
-        def verify_translation(dst_rif):
-            '''
-            Additional helper function for translation verification.
-            Verifies if translation doesn't occur when ACL is configured
-            to disable it.
+        src_ip = "20.20.20.1"
 
-            Args:
-                dst_rif (oid): object ID of destination RIF
+        def build_pkts(dst_ip, nat_dst_ip, dst_mac):
             '''
-            acl_counter = sai_thrift_get_acl_counter_attribute(
-                self.client, self.egr_acl_counter, packets=True)['packets']
-
-            src_ip = "20.20.20.1"
+            Additional helper function building the TCP and UDP packets
+            sent and expected (with and without translation) for given
+            NAT address.
 
-            verify_fn = verify_packet
-            dst_port_dev = self.egr_port_dev
-            dst_ip = self.nat_ip_to_port
-            dst_mac = self.port_nbor_mac
-            nat_dst_ip = self.port_nbor_ip
-            dnat = port_dnat
-            egr_acl_entry = self.egr_acl_port_entry
-            if dst_rif == self.egr_lag_rif:
-                verify_fn = verify_packet_any_port
-                dst_port_dev = self.egr_lag_dev
-                dst_ip = self.nat_ip_to_lag
-                dst_mac = self.lag_nbor_mac
-                nat_dst_ip = self.lag_nbor_ip
-                dnat = lag_dnat
-                egr_acl_entry = self.egr_acl_lag_entry
-            elif dst_rif == self.egr_svi_rif:
-                verify_fn = verify_packet
-                dst_port_dev = self.dev_port26
-                dst_ip = self.nat_ip_to_svi
-                dst_mac = self.svi_nbor_mac
-                nat_dst_ip = self.svi_nbor_ip
-                dnat = svi_dnat
-                egr_acl_entry = self.egr_acl_svi_entry
+            Args:
+                dst_ip (str): NAT destination IP address
+                nat_dst_ip (str): translated destination IP address
+                dst_mac (str): translated destination neighbor MAC address
 
+            Returns:
+                tuple: (sent, translated) and (sent, not translated)
+                       packet pairs for TCP and UDP
+            '''
             tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
                                         ip_src=src_ip,
                                         ip_dst=dst_ip,
@@ -964,276 +690,102 @@ class NatTranslationTest(SaiHelper):
                                                ip_ttl=63,
                                                pktlen=100)
 
-            print("  -> Inress L3 port")
-            print("Sending TCP packet with NAT enabled on L3 Port")
-            send_packet(self, self.ingr_port_dev, tcp_pkt)
-            verify_fn(self, nat_tcp_pkt, dst_port_dev)
-            self.assertTrue(self._verifyNatHit(dnat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled on L3 Port")
-            send_packet(self, self.ingr_port_dev, udp_pkt)
-            verify_fn(self, nat_udp_pkt, dst_port_dev)
-            self.assertTrue(self._verifyNatHit(dnat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client,
-                self.ingr_port_rif,
-                ingress_acl=self.egr_acl_table)
-
-            print("Sending TCP packet with NAT disabled by ACL on L3 Port")
-            send_packet(self, self.ingr_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-            self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL on L3 Port")
-            send_packet(self, self.ingr_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-            self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=False))
-
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                egr_acl_entry,
-                action_no_nat=acl_action)
-
-            print("Sending TCP packet with NAT acl entry enabled")
-            send_packet(self, self.ingr_port_dev, tcp_pkt)
-            verify_fn(self, nat_tcp_pkt, dst_port_dev)
-            self.assertTrue(self._verifyNatHit(dnat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry enabled")
-            send_packet(self, self.ingr_port_dev, udp_pkt)
-            verify_fn(self, nat_udp_pkt, dst_port_dev)
-            self.assertTrue(self._verifyNatHit(dnat))
-            print("\tOK")
-
-            print("Disabling NAT on src RIF acl entry")
-            acl_action = sai_thrift_acl_action_data_t(
-                enable=True,
-                parameter=sai_thrift_acl_action_parameter_t(booldata=True))
-
-            sai_thrift_set_acl_entry_attribute(
-                self.client,
-                egr_acl_entry,
-                action_no_nat=acl_action)
-            acl_counter = 0
-
-            print("Sending TCP packet with NAT acl entry disabled")
-            send_packet(self, self.ingr_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-            self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT acl entry disabled")
-            send_packet(self, self.ingr_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-            self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Enabling NAT on src RIF")
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, ingress_acl=0)
-            acl_counter = 0
-
-            print("  -> Inress L3 LAG")
-            for src_port in self.ingr_lag_dev:
-                print("Sending TCP packet with NAT enabled on L3 LAG")
-                send_packet(self, src_port, tcp_pkt)
-                verify_fn(self, nat_tcp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Sending UDP packet with NAT enabled on L3 LAG")
-                send_packet(self, src_port, udp_pkt)
-                verify_fn(self, nat_udp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Disabling NAT on src RIF")
-                sai_thrift_set_router_interface_attribute(
-                    self.client,
-                    self.ingr_lag_rif,
-                    ingress_acl=self.egr_acl_table)
-
-                print("Sending TCP packet with NAT disabled by ACL on L3 LAG")
-                send_packet(self, src_port, tcp_pkt)
-                verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Sending UDP packet with NAT disabled by ACL on L3 LAG")
-                send_packet(self, src_port, udp_pkt)
-                verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Enabling NAT on src RIF acl entry")
-                acl_action = sai_thrift_acl_action_data_t(
-                    enable=True,
-                    parameter=sai_thrift_acl_action_parameter_t(
-                        booldata=False))
-
-                sai_thrift_set_acl_entry_attribute(
-                    self.client,
-                    egr_acl_entry,
-                    action_no_nat=acl_action)
-
-                print("Sending TCP packet with NAT acl entry enabled")
-                send_packet(self, src_port, tcp_pkt)
-                verify_fn(self, nat_tcp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Sending UDP packet with NAT acl entry enabled")
-                send_packet(self, src_port, udp_pkt)
-                verify_fn(self, nat_udp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Disabling NAT on src RIF acl entry")
-                acl_action = sai_thrift_acl_action_data_t(
-                    enable=True,
-                    parameter=sai_thrift_acl_action_parameter_t(booldata=True))
-
-                sai_thrift_set_acl_entry_attribute(
-                    self.client,
-                    egr_acl_entry,
-                    action_no_nat=acl_action)
-                acl_counter = 0
-
-                print("Sending TCP packet with NAT acl entry disabled")
-                send_packet(self, src_port, tcp_pkt)
-                verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Sending UDP packet with NAT acl entry disabled")
-                send_packet(self, src_port, udp_pkt)
-                verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Enabling NAT on src RIF")
-                sai_thrift_set_router_interface_attribute(
-                    self.client, self.ingr_lag_rif, ingress_acl=0)
-                acl_counter = 0
-
-            print("  -> Inress SVI")
-            for src_port in self.ingr_svi_dev:
-                print("Sending TCP packet with NAT enabled on SVI")
-                send_packet(self, src_port, tcp_pkt)
-                verify_fn(self, nat_tcp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Sending UDP packet with NAT enabled on SVI")
-                send_packet(self, src_port, udp_pkt)
-                verify_fn(self, nat_udp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Disabling NAT on src RIF")
-                sai_thrift_set_router_interface_attribute(
-                    self.client,
-                    self.ingr_svi_rif,
-                    ingress_acl=self.egr_acl_table)
-
-                print("Sending TCP packet with NAT disabled by ACL on SVI")
-                send_packet(self, src_port, tcp_pkt)
-                verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Sending UDP packet with NAT disabled by ACL on SVI")
-                send_packet(self, src_port, udp_pkt)
-                verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Enabling NAT on src RIF acl entry")
-                acl_action = sai_thrift_acl_action_data_t(
-                    enable=True,
-                    parameter=sai_thrift_acl_action_parameter_t(
-                        booldata=False))
-
-                sai_thrift_set_acl_entry_attribute(
-                    self.client,
-                    egr_acl_entry,
-                    action_no_nat=acl_action)
-
-                print("Sending TCP packet with NAT acl entry enabled")
-                send_packet(self, src_port, tcp_pkt)
-                verify_fn(self, nat_tcp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Sending UDP packet with NAT acl entry enabled")
-                send_packet(self, src_port, udp_pkt)
-                verify_fn(self, nat_udp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Disabling NAT on src RIF acl entry")
-                acl_action = sai_thrift_acl_action_data_t(
-                    enable=True,
-                    parameter=sai_thrift_acl_action_parameter_t(booldata=True))
-
-                sai_thrift_set_acl_entry_attribute(
-                    self.client,
-                    egr_acl_entry,
-                    action_no_nat=acl_action)
-                acl_counter = 0
-
-                print("Sending TCP packet with NAT acl entry disabled")
-                send_packet(self, src_port, tcp_pkt)
-                verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Sending UDP packet with NAT acl entry disabled")
-                send_packet(self, src_port, udp_pkt)
-                verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
+            # sent packets are serialized once, expected ones are kept as
+            # scapy packets for readable verification failures
+            tcp_pkt = bytes(tcp_pkt)
+            udp_pkt = bytes(udp_pkt)
+
+            return ([(tcp_pkt, nat_tcp_pkt), (udp_pkt, nat_udp_pkt)],
+                    [(tcp_pkt, no_nat_tcp_pkt), (udp_pkt, no_nat_udp_pkt)])
+
+        # packets are built once per egress neighbor, before any of them
+        # is verified
+        port_pkts = build_pkts(self.nat_ip_to_port, self.port_nbor_ip,
+                               self.port_nbor_mac)
+        lag_pkts = build_pkts(self.nat_ip_to_lag, self.lag_nbor_ip,
+                              self.lag_nbor_mac)
+        svi_pkts = build_pkts(self.nat_ip_to_svi, self.svi_nbor_ip,
+                              self.svi_nbor_mac)
+
+        ingress_cases = [
+            ("L3 Port", self.ingr_port_rif, [self.ingr_port_dev]),
+            ("L3 LAG", self.ingr_lag_rif, self.ingr_lag_dev),
+            ("SVI", self.ingr_svi_rif, self.ingr_svi_dev)]
+
+        def verify_translation(pkts, dst_port_dev, dnat, egr_acl_entry):
+            '''
+            Additional helper function for translation verification.
+            Verifies if translation doesn't occur when ACL is configured
+            to disable it.
 
-                print("Enabling NAT on src RIF")
-                sai_thrift_set_router_interface_attribute(
-                    self.client, self.ingr_svi_rif, ingress_acl=0)
-                acl_counter = 0
+            Args:
+                pkts (list): packets built by build_pkts
+                dst_port_dev (int or list): destination device port number
+                                            or list of LAG member ports
+                dnat (sai_thrift_nat_entry_t): destination NAT entry
+                egr_acl_entry (oid): ACL entry disabling the translation
+            '''
+            acl_counter = sai_thrift_get_acl_counter_attribute(
+                self.client, self.egr_acl_counter, packets=True)['packets']
+            nat_hits = 0
+
+            nat_pkts, no_nat_pkts = pkts
+
+            for name, src_rif, src_ports in ingress_cases:
+                print("  -> Inress %s" % name)
+                for src_port in src_ports:
+                    nat_hits = self._step(
+                        "Sending TCP and UDP packets with NAT enabled on %s"
+                        % name,
+                        src_port, nat_pkts, dst_port_dev,
+                        nat_entry=dnat, prev_value=nat_hits)
+
+                    print("Disabling NAT on src RIF")
+                    sai_thrift_set_router_interface_attribute(
+                        self.client,
+                        src_rif,
+                        ingress_acl=self.no_nat_acl_table)
+
+                    acl_counter = self._step(
+                        "Sending TCP and UDP packets with NAT disabled by ACL"
+                        " on %s" % name,
+                        src_port, no_nat_pkts, self.no_nat_eport,
+                        acl_counter=self.egr_acl_counter,
+                        prev_value=acl_counter)
+
+                    print("Enabling NAT on src RIF acl entry")
+                    sai_thrift_set_acl_entry_attribute(
+                        self.client,
+                        egr_acl_entry,
+                        action_no_nat=self.nat_action)
+
+                    nat_hits = self._step(
+                        "Sending TCP and UDP packets with NAT acl entry"
+                        " enabled",
+                        src_port, nat_pkts, dst_port_dev,
+                        nat_entry=dnat, prev_value=nat_hits)
+
+                    print("Disabling NAT on src RIF acl entry")
+                    sai_thrift_set_acl_entry_attribute(
+                        self.client,
+                        egr_acl_entry,
+                        action_no_nat=self.no_nat_action)
+                    acl_counter = 0
+
+                    acl_counter = self._step(
+                        "Sending TCP and UDP packets with NAT acl entry"
+                        " disabled",
+                        src_port, no_nat_pkts, self.no_nat_eport,
+                        acl_counter=self.egr_acl_counter,
+                        prev_value=acl_counter)
+
+                    print("Enabling NAT on src RIF")
+                    sai_thrift_set_router_interface_attribute(
+                        self.client, src_rif, ingress_acl=0)
+                    acl_counter = 0
+
+            sai_thrift_set_nat_entry_attribute(
+                self.client, dnat, packet_count=0)
 
         try:
             # NAT configuration
@@ -1300,59 +852,39 @@ class NatTranslationTest(SaiHelper):
                 self.client, svi_dnat_pool, dst_ip=self.svi_nbor_ip,
                 nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
 
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
+            # egress RIFs stay in the default NAT zone 0
+            with SaiPipeline(self.client) as pipeline:
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.ingr_port_rif, nat_zone_id=1)
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.ingr_lag_rif, nat_zone_id=1)
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.ingr_svi_rif, nat_zone_id=1)
 
             print("\n***Egress L3 port <-***")
-            verify_translation(self.egr_port_rif)
+            verify_translation(port_pkts, self.egr_port_dev, port_dnat,
+                               self.egr_acl_port_entry)
             print("\n***Egress L3 LAG <-***")
-            verify_translation(self.egr_lag_rif)
+            verify_translation(lag_pkts, self.egr_lag_dev, lag_dnat,
+                               self.egr_acl_lag_entry)
             print("\n***Egress SVI <-***")
-            verify_translation(self.egr_svi_rif)
+            verify_translation(svi_pkts, self.dev_port26, svi_dnat,
+                               self.egr_acl_svi_entry)
 
         finally:
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, ingress_acl=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, ingress_acl=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, ingress_acl=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
+            with SaiPipeline(self.client) as pipeline:
+                self._restoreRifs(
+                    pipeline,
+                    [self.ingr_port_rif, self.ingr_lag_rif, self.ingr_svi_rif])
 
-            sai_thrift_remove_nat_entry(self.client, svi_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, svi_dnat)
+                sai_thrift_remove_nat_entry(pipeline, svi_dnat_pool)
+                sai_thrift_remove_nat_entry(pipeline, svi_dnat)
 
-            sai_thrift_remove_nat_entry(self.client, lag_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, lag_dnat)
+                sai_thrift_remove_nat_entry(pipeline, lag_dnat_pool)
+                sai_thrift_remove_nat_entry(pipeline, lag_dnat)
 
-            sai_thrift_remove_nat_entry(self.client, port_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, port_dnat)
+                sai_thrift_remove_nat_entry(pipeline, port_dnat_pool)
+                sai_thrift_remove_nat_entry(pipeline, port_dnat)
 
     def noCpuPacketTranslationTest(self):
         '''
@@ -1394,12 +926,12 @@ class NatTranslationTest(SaiHelper):
             send_packet(self, self.cpu_port0, inner_pkt)
             verify_packets(self, inner_pkt, [self.egr_port_dev])
             self.assertFalse(self._verifyNatHit(snat))
-            print("\tOK")
 
         finally:
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-            sai_thrift_remove_nat_entry(self.client, snat)
+            with SaiPipeline(self.client) as pipeline:
+                sai_thrift_set_router_interface_attribute(
+                    pipeline, self.egr_port_rif, nat_zone_id=0)
+                sai_thrift_remove_nat_entry(pipeline, snat)
 
 
 class NatTranslationNoBdTest(SaiHelper):
@@ -1423,29 +955,9 @@ class NatTranslationNoBdTest(SaiHelper):
         self.port_nbor_mac = "00:11:11:11:11:11"
         self.nat_ip_to_port = "30.30.30.10"
 
-        self.nat_port_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(self.port_nbor_ip),
-            router_interface_id=self.egr_port_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
-        self.nat_port_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=self.egr_port_rif,
-            ip_address=sai_ipaddress(self.port_nbor_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.nat_port_nbor,
-                                         dst_mac_address=self.port_nbor_mac,
-                                         no_host_route=True)
-
-        self.nat_port_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.port_nbor_ip + '/32'))
-        sai_thrift_create_route_entry(
-            self.client, self.nat_port_route, next_hop_id=self.nat_port_nhop)
-
-        # L3 LAGs configuration
-        self.ingr_lag_rif = self.lag3_rif
-        self.egr_lag_rif = self.lag4_rif
+        # L3 LAGs configuration
+        self.ingr_lag_rif = self.lag3_rif
+        self.egr_lag_rif = self.lag4_rif
 
         self.ingr_lag = [self.port14, self.port15, self.port16]
         self.egr_lag = [self.port17, self.port18, self.port19]
@@ -1457,101 +969,7 @@ class NatTranslationNoBdTest(SaiHelper):
         self.lag_nbor_mac = "00:22:22:22:22:22"
         self.nat_ip_to_lag = "30.30.30.20"
 
-        self.nat_lag_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(self.lag_nbor_ip),
-            router_interface_id=self.egr_lag_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
-        self.nat_lag_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=self.egr_lag_rif,
-            ip_address=sai_ipaddress(self.lag_nbor_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.nat_lag_nbor,
-                                         dst_mac_address=self.lag_nbor_mac,
-                                         no_host_route=True)
-
-        self.nat_lag_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.lag_nbor_ip + '/32'))
-        sai_thrift_create_route_entry(
-            self.client, self.nat_lag_route, next_hop_id=self.nat_lag_nhop)
-
         # SVI configuration
-        self.port24_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port24,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.port25_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port25,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.vlan100 = sai_thrift_create_vlan(self.client, vlan_id=100)
-        self.vlan100_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan100,
-            bridge_port_id=self.port24_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan100_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan100,
-            bridge_port_id=self.port25_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-
-        sai_thrift_set_port_attribute(
-            self.client, self.port24, port_vlan_id=100)
-        sai_thrift_set_port_attribute(
-            self.client, self.port25, port_vlan_id=100)
-
-        self.port26_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port26,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.port27_bp = sai_thrift_create_bridge_port(
-            self.client,
-            bridge_id=self.default_1q_bridge,
-            port_id=self.port27,
-            type=SAI_BRIDGE_PORT_TYPE_PORT,
-            admin_state=True)
-
-        self.vlan200 = sai_thrift_create_vlan(self.client, vlan_id=200)
-        self.vlan200_member0 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan200,
-            bridge_port_id=self.port26_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-        self.vlan200_member1 = sai_thrift_create_vlan_member(
-            self.client,
-            vlan_id=self.vlan200,
-            bridge_port_id=self.port27_bp,
-            vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
-
-        sai_thrift_set_port_attribute(
-            self.client, self.port26, port_vlan_id=200)
-        sai_thrift_set_port_attribute(
-            self.client, self.port27, port_vlan_id=200)
-
-        self.ingr_svi_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
-            virtual_router_id=self.default_vrf,
-            vlan_id=self.vlan100)
-
-        self.egr_svi_rif = sai_thrift_create_router_interface(
-            self.client,
-            type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
-            virtual_router_id=self.default_vrf,
-            vlan_id=self.vlan200)
-
         self.ingr_svi = [self.port24, self.port25]
         self.egr_svi = [self.port26, self.port27]
 
@@ -1562,72 +980,17 @@ class NatTranslationNoBdTest(SaiHelper):
         self.svi_nbor_mac = "00:33:33:33:33:33"
         self.nat_ip_to_svi = "30.30.30.30"
 
-        self.nat_svi_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(self.svi_nbor_ip),
-            router_interface_id=self.egr_svi_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
-        self.nat_svi_nbor = sai_thrift_neighbor_entry_t(
-            rif_id=self.egr_svi_rif,
-            ip_address=sai_ipaddress(self.svi_nbor_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.nat_svi_nbor,
-                                         dst_mac_address=self.svi_nbor_mac,
-                                         no_host_route=True)
-
-        self.nat_svi_fdb = sai_thrift_fdb_entry_t(
-            switch_id=self.switch_id,
-            mac_address=self.svi_nbor_mac,
-            bv_id=self.vlan200)
-        sai_thrift_create_fdb_entry(self.client,
-                                    self.nat_svi_fdb,
-                                    type=SAI_FDB_ENTRY_TYPE_STATIC,
-                                    bridge_port_id=self.port26_bp)
-
-        self.nat_svi_route = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.svi_nbor_ip + '/32'))
-        sai_thrift_create_route_entry(
-            self.client, self.nat_svi_route, next_hop_id=self.nat_svi_nhop)
+        # source host and its source NAT address
+        self.src_ip = "20.20.20.1"
+        self.nat_src_ip = "150.10.10.10"
 
-        # no-NAT ACL configuration
-        action_types = [SAI_ACL_ACTION_TYPE_NO_NAT]
-        action_types_list = sai_thrift_s32_list_t(count=len(action_types),
-                                                  int32list=action_types)
-
-        bind_points = [SAI_ACL_BIND_POINT_TYPE_SWITCH]
-        bind_points_list = sai_thrift_s32_list_t(count=len(bind_points),
-                                                 int32list=bind_points)
-
-        self.ingr_acl_table = sai_thrift_create_acl_table(
-            self.client,
-            acl_stage=SAI_ACL_STAGE_INGRESS,
-            acl_bind_point_type_list=bind_points_list,
-            acl_action_type_list=action_types_list,
-            field_dst_ip=True)
-
-        self.ingr_acl_counter = sai_thrift_create_acl_counter(
-            self.client,
-            self.ingr_acl_table,
-            enable_packet_count=True)
-
-        self.egr_acl_table = sai_thrift_create_acl_table(
-            self.client,
-            acl_stage=SAI_ACL_STAGE_INGRESS,
-            acl_bind_point_type_list=bind_points_list,
-            acl_action_type_list=action_types_list,
-            field_dst_ip=True)
-
-        self.egr_acl_counter = sai_thrift_create_acl_counter(
-            self.client,
-            self.egr_acl_table,
-            enable_packet_count=True)
-
-        sai_thrift_set_switch_attribute(self.client,
-                                        ingress_acl=self.ingr_acl_table)
-        sai_thrift_set_switch_attribute(self.client,
-                                        egress_acl=self.egr_acl_table)
+        # ACL actions disabling and enabling back NAT translation
+        self.no_nat_action = sai_thrift_acl_action_data_t(
+            enable=True,
+            parameter=sai_thrift_acl_action_parameter_t(booldata=True))
+        self.nat_action = sai_thrift_acl_action_data_t(
+            enable=True,
+            parameter=sai_thrift_acl_action_parameter_t(booldata=False))
 
         # no-NAT route configuration
         no_nat_rif = self.port12_rif
@@ -1636,25 +999,260 @@ class NatTranslationNoBdTest(SaiHelper):
         no_nat_ip = "30.30.30.0"
         self.no_nat_nbor_mac = "00:33:33:33:33:33"
 
-        self.no_nat_nhop = sai_thrift_create_next_hop(
-            self.client,
-            ip=sai_ipaddress(no_nat_ip),
-            router_interface_id=no_nat_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-
+        self.nat_port_nbor = sai_thrift_neighbor_entry_t(
+            rif_id=self.egr_port_rif,
+            ip_address=_ipaddr(self.port_nbor_ip))
+        self.nat_lag_nbor = sai_thrift_neighbor_entry_t(
+            rif_id=self.egr_lag_rif,
+            ip_address=_ipaddr(self.lag_nbor_ip))
         self.no_nat_nbor = sai_thrift_neighbor_entry_t(
             rif_id=no_nat_rif,
-            ip_address=sai_ipaddress(no_nat_ip))
-        sai_thrift_create_neighbor_entry(self.client,
-                                         self.no_nat_nbor,
-                                         dst_mac_address=self.no_nat_nbor_mac,
-                                         no_host_route=True)
+            ip_address=_ipaddr(no_nat_ip))
+
+        # objects are created in stages, each stage uses only objects
+        # created by the previous ones and costs a single round-trip
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_create_next_hop(
+                pipeline,
+                ip=_ipaddr(self.port_nbor_ip),
+                router_interface_id=self.egr_port_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+            sai_thrift_create_neighbor_entry(
+                pipeline,
+                self.nat_port_nbor,
+                dst_mac_address=self.port_nbor_mac,
+                no_host_route=True)
+
+            sai_thrift_create_next_hop(
+                pipeline,
+                ip=_ipaddr(self.lag_nbor_ip),
+                router_interface_id=self.egr_lag_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+            sai_thrift_create_neighbor_entry(
+                pipeline,
+                self.nat_lag_nbor,
+                dst_mac_address=self.lag_nbor_mac,
+                no_host_route=True)
+
+            for port in [self.port24, self.port25, self.port26, self.port27]:
+                sai_thrift_create_bridge_port(
+                    pipeline,
+                    bridge_id=self.default_1q_bridge,
+                    port_id=port,
+                    type=SAI_BRIDGE_PORT_TYPE_PORT,
+                    admin_state=True)
+            sai_thrift_create_vlan(pipeline, vlan_id=100)
+            sai_thrift_create_vlan(pipeline, vlan_id=200)
+
+            sai_thrift_create_acl_table(
+                pipeline,
+                acl_stage=SAI_ACL_STAGE_INGRESS,
+                acl_bind_point_type_list=_SWITCH_BIND_POINTS,
+                acl_action_type_list=_NO_NAT_ACTION_TYPES,
+                field_dst_ip=True)
+            sai_thrift_create_acl_table(
+                pipeline,
+                acl_stage=SAI_ACL_STAGE_INGRESS,
+                acl_bind_point_type_list=_SWITCH_BIND_POINTS,
+                acl_action_type_list=_NO_NAT_ACTION_TYPES,
+                field_dst_ip=True)
+
+            sai_thrift_create_next_hop(
+                pipeline,
+                ip=_ipaddr(no_nat_ip),
+                router_interface_id=no_nat_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+            sai_thrift_create_neighbor_entry(
+                pipeline,
+                self.no_nat_nbor,
+                dst_mac_address=self.no_nat_nbor_mac,
+                no_host_route=True)
+        (self.nat_port_nhop, _, self.nat_lag_nhop, _,
+         self.port24_bp, self.port25_bp, self.port26_bp, self.port27_bp,
+         self.vlan100, self.vlan200,
+         self.ingr_acl_table, self.egr_acl_table,
+         self.no_nat_nhop, _) = pipeline.results
+        self.addUndo(sai_thrift_remove_next_hop, 'nat_port_nhop')
+        self.addUndo(sai_thrift_remove_neighbor_entry, 'nat_port_nbor')
+        self.addUndo(sai_thrift_remove_next_hop, 'nat_lag_nhop')
+        self.addUndo(sai_thrift_remove_neighbor_entry, 'nat_lag_nbor')
+        self.addUndo(sai_thrift_remove_bridge_port,
+                     'port24_bp', 'port25_bp', 'port26_bp', 'port27_bp')
+        self.addUndo(sai_thrift_remove_vlan, 'vlan100', 'vlan200')
+        self.addUndo(sai_thrift_remove_acl_table,
+                     'ingr_acl_table', 'egr_acl_table')
+        self.addUndo(sai_thrift_remove_next_hop, 'no_nat_nhop')
+        self.addUndo(sai_thrift_remove_neighbor_entry, 'no_nat_nbor')
 
+        self.nat_port_route = sai_thrift_route_entry_t(
+            vr_id=self.default_vrf,
+            destination=_ipprefix(self.port_nbor_ip + '/32'))
+        self.nat_lag_route = sai_thrift_route_entry_t(
+            vr_id=self.default_vrf,
+            destination=_ipprefix(self.lag_nbor_ip + '/32'))
         self.no_nat_route = sai_thrift_route_entry_t(
             vr_id=self.default_vrf,
-            destination=sai_ipprefix(no_nat_ip + '/24'))
+            destination=_ipprefix(no_nat_ip + '/24'))
+
+        self.nat_svi_fdb = sai_thrift_fdb_entry_t(
+            switch_id=self.switch_id,
+            mac_address=self.svi_nbor_mac,
+            bv_id=self.vlan200)
+
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_create_route_entry(
+                pipeline, self.nat_port_route, next_hop_id=self.nat_port_nhop)
+            sai_thrift_create_route_entry(
+                pipeline, self.nat_lag_route, next_hop_id=self.nat_lag_nhop)
+
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan100,
+                bridge_port_id=self.port24_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan100,
+                bridge_port_id=self.port25_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+
+            sai_thrift_set_port_attribute(
+                pipeline, self.port24, port_vlan_id=100)
+            sai_thrift_set_port_attribute(
+                pipeline, self.port25, port_vlan_id=100)
+
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan200,
+                bridge_port_id=self.port26_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+            sai_thrift_create_vlan_member(
+                pipeline,
+                vlan_id=self.vlan200,
+                bridge_port_id=self.port27_bp,
+                vlan_tagging_mode=SAI_VLAN_TAGGING_MODE_UNTAGGED)
+
+            sai_thrift_set_port_attribute(
+                pipeline, self.port26, port_vlan_id=200)
+            sai_thrift_set_port_attribute(
+                pipeline, self.port27, port_vlan_id=200)
+
+            sai_thrift_create_router_interface(
+                pipeline,
+                type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
+                virtual_router_id=self.default_vrf,
+                vlan_id=self.vlan100)
+            sai_thrift_create_router_interface(
+                pipeline,
+                type=SAI_ROUTER_INTERFACE_TYPE_VLAN,
+                virtual_router_id=self.default_vrf,
+                vlan_id=self.vlan200)
+
+            sai_thrift_create_fdb_entry(pipeline,
+                                        self.nat_svi_fdb,
+                                        type=SAI_FDB_ENTRY_TYPE_STATIC,
+                                        bridge_port_id=self.port26_bp)
+
+            sai_thrift_create_acl_counter(
+                pipeline,
+                self.ingr_acl_table,
+                enable_packet_count=True)
+            sai_thrift_create_acl_counter(
+                pipeline,
+                self.egr_acl_table,
+                enable_packet_count=True)
+
+            sai_thrift_set_switch_attribute(pipeline,
+                                            ingress_acl=self.ingr_acl_table)
+            sai_thrift_set_switch_attribute(pipeline,
+                                            egress_acl=self.egr_acl_table)
+
+            sai_thrift_create_route_entry(
+                pipeline, self.no_nat_route, next_hop_id=self.no_nat_nhop)
+        (_, _,
+         self.vlan100_member0, self.vlan100_member1, _, _,
+         self.vlan200_member0, self.vlan200_member1, _, _,
+         self.ingr_svi_rif, self.egr_svi_rif, _,
+         self.ingr_acl_counter, self.egr_acl_counter,
+         _, _, _) = pipeline.results
+        self.addUndo(sai_thrift_remove_route_entry,
+                     'nat_port_route', 'nat_lag_route')
+        self.addUndo(sai_thrift_remove_vlan_member,
+                     'vlan100_member0', 'vlan100_member1')
+        self.addUndo(sai_thrift_set_port_attribute, 'port24', 'port25',
+                     port_vlan_id=0)
+        self.addUndo(sai_thrift_remove_vlan_member,
+                     'vlan200_member0', 'vlan200_member1')
+        self.addUndo(sai_thrift_set_port_attribute, 'port26', 'port27',
+                     port_vlan_id=0)
+        self.addUndo(sai_thrift_remove_router_interface,
+                     'ingr_svi_rif', 'egr_svi_rif')
+        self.addUndo(sai_thrift_remove_fdb_entry, 'nat_svi_fdb')
+        self.addUndo(sai_thrift_remove_acl_counter,
+                     'ingr_acl_counter', 'egr_acl_counter')
+        self.addUndo(sai_thrift_remove_route_entry, 'no_nat_route')
+
+        self.nat_svi_nbor = sai_thrift_neighbor_entry_t(
+            rif_id=self.egr_svi_rif,
+            ip_address=_ipaddr(self.svi_nbor_ip))
+
+        # ACL entries are shared by the tests; they disable NAT translation
+        # and the enable tests switch their action for the test duration.
+        # A single ingress entry covers the port, LAG and SVI neighbor
+        # addresses and a single egress entry covers their NAT addresses.
+        ingr_acl_cnt_action = sai_thrift_acl_action_data_t(
+            enable=True,
+            parameter=sai_thrift_acl_action_parameter_t(
+                oid=self.ingr_acl_counter))
+        nbor_ip_addr = sai_thrift_acl_field_data_t(
+            data=sai_thrift_acl_field_data_data_t(ip4="10.10.0.0"),
+            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.0.0"))
+
+        egr_acl_cnt_action = sai_thrift_acl_action_data_t(
+            enable=True,
+            parameter=sai_thrift_acl_action_parameter_t(
+                oid=self.egr_acl_counter))
+        nat_ip_addr = sai_thrift_acl_field_data_t(
+            data=sai_thrift_acl_field_data_data_t(ip4="30.30.30.0"),
+            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.0"))
+
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_create_next_hop(
+                pipeline,
+                ip=_ipaddr(self.svi_nbor_ip),
+                router_interface_id=self.egr_svi_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+            sai_thrift_create_neighbor_entry(
+                pipeline,
+                self.nat_svi_nbor,
+                dst_mac_address=self.svi_nbor_mac,
+                no_host_route=True)
+
+            sai_thrift_create_acl_entry(
+                pipeline,
+                table_id=self.ingr_acl_table,
+                action_no_nat=self.no_nat_action,
+                action_counter=ingr_acl_cnt_action,
+                field_dst_ip=nbor_ip_addr)
+            sai_thrift_create_acl_entry(
+                pipeline,
+                table_id=self.egr_acl_table,
+                action_no_nat=self.no_nat_action,
+                action_counter=egr_acl_cnt_action,
+                field_dst_ip=nat_ip_addr)
+        (self.nat_svi_nhop, _,
+         self.ingr_acl_entry, self.egr_acl_entry) = pipeline.results
+        self.addUndo(sai_thrift_remove_next_hop, 'nat_svi_nhop')
+        self.addUndo(sai_thrift_remove_neighbor_entry, 'nat_svi_nbor')
+        self.addUndo(sai_thrift_remove_acl_entry,
+                     'ingr_acl_entry', 'egr_acl_entry')
+
+        self.nat_svi_route = sai_thrift_route_entry_t(
+            vr_id=self.default_vrf,
+            destination=_ipprefix(self.svi_nbor_ip + '/32'))
         sai_thrift_create_route_entry(
-            self.client, self.no_nat_route, next_hop_id=self.no_nat_nhop)
+            self.client, self.nat_svi_route, next_hop_id=self.nat_svi_nhop)
+        self.addUndo(sai_thrift_remove_route_entry, 'nat_svi_route')
 
     def runTest(self):
         try:
@@ -1667,58 +1265,21 @@ class NatTranslationNoBdTest(SaiHelper):
             pass
 
     def tearDown(self):
-        sai_thrift_remove_route_entry(self.client, self.no_nat_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.no_nat_nbor)
-        sai_thrift_remove_next_hop(self.client, self.no_nat_nhop)
-        sai_thrift_set_switch_attribute(self.client,
-                                        ingress_acl=0)
-        sai_thrift_set_switch_attribute(self.client,
-                                        egress_acl=0)
-
-        sai_thrift_remove_acl_counter(self.client, self.egr_acl_counter)
-        sai_thrift_remove_acl_table(self.client, self.egr_acl_table)
-
-        sai_thrift_remove_acl_counter(self.client, self.ingr_acl_counter)
-        sai_thrift_remove_acl_table(self.client, self.ingr_acl_table)
-
-        sai_thrift_remove_fdb_entry(self.client, self.nat_svi_fdb)
-        sai_thrift_remove_route_entry(self.client, self.nat_svi_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.nat_svi_nbor)
-        sai_thrift_remove_next_hop(self.client, self.nat_svi_nhop)
-        sai_thrift_remove_router_interface(self.client, self.egr_svi_rif)
-        sai_thrift_remove_router_interface(self.client, self.ingr_svi_rif)
-        sai_thrift_set_port_attribute(self.client, self.port26, port_vlan_id=0)
-        sai_thrift_set_port_attribute(self.client, self.port27, port_vlan_id=0)
-        sai_thrift_remove_vlan_member(self.client, self.vlan200_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan200_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan200)
-        sai_thrift_remove_bridge_port(self.client, self.port27_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port26_bp)
-        sai_thrift_set_port_attribute(self.client, self.port25, port_vlan_id=0)
-        sai_thrift_set_port_attribute(self.client, self.port24, port_vlan_id=0)
-        sai_thrift_remove_vlan_member(self.client, self.vlan100_member1)
-        sai_thrift_remove_vlan_member(self.client, self.vlan100_member0)
-        sai_thrift_remove_vlan(self.client, self.vlan100)
-        sai_thrift_remove_bridge_port(self.client, self.port25_bp)
-        sai_thrift_remove_bridge_port(self.client, self.port24_bp)
-
-        sai_thrift_remove_route_entry(self.client, self.nat_lag_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.nat_lag_nbor)
-        sai_thrift_remove_next_hop(self.client, self.nat_lag_nhop)
-
-        sai_thrift_remove_route_entry(self.client, self.nat_port_route)
-        sai_thrift_remove_neighbor_entry(self.client, self.nat_port_nbor)
-        sai_thrift_remove_next_hop(self.client, self.nat_port_nhop)
+        # ACL tables are unbound before the undo log removes them
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_set_switch_attribute(pipeline, ingress_acl=0)
+            sai_thrift_set_switch_attribute(pipeline, egress_acl=0)
 
         super(NatTranslationNoBdTest, self).tearDown()
 
-    def _verifyAclCounter(self, acl_counter, prev_value):
+    def _verifyAclCounter(self, acl_counter, prev_value, count=1):
         '''
         Helper function for verifying if given ACL counter was incremented.
 
         Args:
             acl_counter (oid): object ID of ACL counter to be read
             prev_value (int): przevious counter value
+            count (int): expected increment
 
         Return:
             bool: True if counter was incremented; False otherwise
@@ -1727,19 +1288,19 @@ class NatTranslationNoBdTest(SaiHelper):
             self.client, acl_counter, packets=True)
         counter = counter['packets']
 
-        if counter == prev_value + 1:
-            print("ACL hit")
-            return True
+        return counter == prev_value + count
 
-        return False
-
-    def _verifyNatHit(self, nat_entry):
+    def _verifyNatHit(self, nat_entry, prev_value=0, count=1):
         '''
         Helper function for verifying if given NAT entry was hit.
+        The counter is not cleared, so callers track the number of hits
+        and reset it once they are done with the entry.
 
         Args:
             nat_entry (oid): object ID of NAT entry for which counter is
                              to be read
+            prev_value (int): previous NAT entry counter value
+            count (int): expected number of hits
 
         Return:
             bool: True if NAT was hit; False otherwise
@@ -1748,14 +1309,7 @@ class NatTranslationNoBdTest(SaiHelper):
             self.client, nat_entry, packet_count=True)
         counter = counter['packet_count']
 
-        if counter != 1:
-            return False
-
-        print("NAT hit")
-        sai_thrift_set_nat_entry_attribute(
-            self.client, nat_entry, packet_count=0)
-
-        return True
+        return counter == prev_value + count
 
     def srcNatAclTranslationDisableTest(self):
         '''
@@ -1767,10 +1321,35 @@ class NatTranslationNoBdTest(SaiHelper):
         '''
         print("\nsrcNatAclTranslationDisableTest()")
 
-        src_ip = "20.20.20.1"
-        nat_src_ip = "150.10.10.10"
+        # egress neighbors the packets are routed to
+        egress_targets = [
+            ("L3 port", self.port_nbor_ip, self.port_nbor_mac,
+             self.egr_port_dev),
+            ("L3 LAG", self.lag_nbor_ip, self.lag_nbor_mac, self.egr_lag_dev),
+            ("SVI", self.svi_nbor_ip, self.svi_nbor_mac, self.dev_port26)]
 
-        def verify_translation(src_port_dev):
+        # destination addresses are set for each egress neighbor
+        tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100,
+                                    with_tcp_chksum=True)
+        no_nat_tcp_pkt = simple_tcp_packet(eth_src=ROUTER_MAC,
+                                           ip_src=self.src_ip,
+                                           ip_ttl=63,
+                                           pktlen=100,
+                                           with_tcp_chksum=True)
+
+        udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100)
+        no_nat_udp_pkt = simple_udp_packet(eth_src=ROUTER_MAC,
+                                           ip_src=self.src_ip,
+                                           ip_ttl=63,
+                                           pktlen=100)
+
+        def verify_translation(src_port_dev, acl_counter):
             '''
             Additional helper function for translation verification.
             Verifies if translation doesn't occur when ACL is configured
@@ -1778,176 +1357,67 @@ class NatTranslationNoBdTest(SaiHelper):
 
             Args:
                 src_port_dev (int): source device port number
+                acl_counter (int): ingress ACL counter value
+
+            Return:
+                int: ingress ACL counter value after the packets were sent
             '''
-            acl_counter = sai_thrift_get_acl_counter_attribute(
-                self.client, self.ingr_acl_counter, packets=True)['packets']
 
-            # use route to L3 port
-            print("   -> Egress L3 port")
-            tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=self.port_nbor_ip,
-                                        ip_ttl=64,
-                                        pktlen=100,
-                                        with_tcp_chksum=True)
-            no_nat_tcp_pkt = simple_tcp_packet(eth_dst=self.port_nbor_mac,
-                                               eth_src=ROUTER_MAC,
-                                               ip_src=src_ip,
-                                               ip_dst=self.port_nbor_ip,
-                                               ip_ttl=63,
-                                               pktlen=100,
-                                               with_tcp_chksum=True)
+            for name, nbor_ip, nbor_mac, dst_port_dev in egress_targets:
+                print("   -> Egress %s" % name)
+                tcp_pkt[IP].dst = nbor_ip
+                no_nat_tcp_pkt[Ether].dst = nbor_mac
+                no_nat_tcp_pkt[IP].dst = nbor_ip
 
-            udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=self.port_nbor_ip,
-                                        ip_ttl=64,
-                                        pktlen=100)
-            no_nat_udp_pkt = simple_udp_packet(eth_dst=self.port_nbor_mac,
-                                               eth_src=ROUTER_MAC,
-                                               ip_src=src_ip,
-                                               ip_dst=self.port_nbor_ip,
-                                               ip_ttl=63,
-                                               pktlen=100)
+                udp_pkt[IP].dst = nbor_ip
+                no_nat_udp_pkt[Ether].dst = nbor_mac
+                no_nat_udp_pkt[IP].dst = nbor_ip
 
-            print("Disable NAT on src RIF")
-            print("Sending TCP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            # use route to L3 LAG
-            print("   -> Egress L3 LAG")
-            tcp_pkt[IP].dst = self.lag_nbor_ip
-
-            no_nat_tcp_pkt[Ether].dst = self.lag_nbor_mac
-            no_nat_tcp_pkt[IP].dst = self.lag_nbor_ip
-
-            udp_pkt[IP].dst = self.lag_nbor_ip
-            no_nat_udp_pkt[Ether].dst = self.lag_nbor_mac
-            no_nat_udp_pkt[IP].dst = self.lag_nbor_ip
-
-            print("Disable NAT on src RIF")
-            print("Sending TCP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet_any_port(self, no_nat_tcp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet_any_port(self, no_nat_udp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            # use route to SVI
-            print("   -> Egress SVI")
-            tcp_pkt[IP].dst = self.svi_nbor_ip
-
-            no_nat_tcp_pkt[Ether].dst = self.svi_nbor_mac
-            no_nat_tcp_pkt[IP].dst = self.svi_nbor_ip
-
-            udp_pkt[IP].dst = self.svi_nbor_ip
-            no_nat_udp_pkt[Ether].dst = self.svi_nbor_mac
-            no_nat_udp_pkt[IP].dst = self.svi_nbor_ip
-
-            print("Disable NAT on src RIF")
-            print("Sending TCP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyAclCounter(self.ingr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
+                print("Disable NAT on src RIF")
+                print("Sending TCP and UDP packets with NAT disabled by ACL")
+                if isinstance(dst_port_dev, list):
+                    # verify_packet_any_port fails on any other queued
+                    # packet, so packets sent to a LAG are verified one
+                    # by one
+                    send_packet(self, src_port_dev, tcp_pkt)
+                    verify_packet_any_port(self, no_nat_tcp_pkt, dst_port_dev)
+                    send_packet(self, src_port_dev, udp_pkt)
+                    verify_packet_any_port(self, no_nat_udp_pkt, dst_port_dev)
+                else:
+                    send_packet(self, src_port_dev, tcp_pkt)
+                    send_packet(self, src_port_dev, udp_pkt)
+                    verify_packet(self, no_nat_tcp_pkt, dst_port_dev)
+                    verify_packet(self, no_nat_udp_pkt, dst_port_dev)
+                # the counter is read once for both packets
+                self.assertTrue(self._verifyAclCounter(
+                    self.ingr_acl_counter, acl_counter, count=2))
+                acl_counter += 2
+
+            return acl_counter
 
         try:
-            self._ingrNatAclConfiguration(True)
-            nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    src_ip=src_ip),
-                mask=sai_thrift_nat_entry_mask_t(
-                    src_ip='255.255.255.255'))
+            with SaiPipeline(self.client) as pipeline:
+                nat_entries = self._natAclConfiguration(
+                    pipeline, 'src', nat_enable=False)
 
-            snat = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                          data=nat_data,
-                                          nat_type=SAI_NAT_TYPE_SOURCE_NAT)
-            sai_thrift_create_nat_entry(self.client,
-                                        snat,
-                                        src_ip=nat_src_ip,
-                                        nat_type=SAI_NAT_TYPE_SOURCE_NAT,
-                                        enable_packet_count=True)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=1)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=1)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=1)
+            # the counter is read once, the helper tracks the increments
+            acl_counter = sai_thrift_get_acl_counter_attribute(
+                self.client, self.ingr_acl_counter, packets=True)['packets']
 
             print("\n***Ingress L3 port***")
-            verify_translation(self.ingr_port_dev)
+            acl_counter = verify_translation(self.ingr_port_dev, acl_counter)
 
             print("\n***Ingress L3 LAG***")
             for lag_port in self.ingr_lag_dev:
-                verify_translation(lag_port)
+                acl_counter = verify_translation(lag_port, acl_counter)
 
             print("\n***Ingress SVI***")
             for svi_port in self.ingr_svi_dev:
-                verify_translation(svi_port)
+                acl_counter = verify_translation(svi_port, acl_counter)
 
         finally:
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_remove_nat_entry(self.client, snat)
-
-            sai_thrift_remove_acl_entry(self.client, self.ingr_acl_svi_entry)
-            sai_thrift_remove_acl_entry(self.client, self.ingr_acl_lag_entry)
-            sai_thrift_remove_acl_entry(self.client, self.ingr_acl_port_entry)
+            with SaiPipeline(self.client) as pipeline:
+                self._natAclCleanup(pipeline, 'src', nat_entries)
 
     def dstNatAclTranslationDisableTest(self):
         '''
@@ -1959,6 +1429,35 @@ class NatTranslationNoBdTest(SaiHelper):
         '''
         print("\ndstNatAclTranslationDisableTest()")
 
+        # ingress ports the packets are sent from
+        ingress_sources = [
+            ("L3 port", [self.ingr_port_dev]),
+            ("L3 LAG", self.ingr_lag_dev),
+            ("SVI", self.ingr_svi_dev)]
+
+        # destination address is set for each destination RIF
+        tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100,
+                                    with_tcp_chksum=True)
+        no_nat_tcp_pkt = simple_tcp_packet(eth_dst=self.no_nat_nbor_mac,
+                                           eth_src=ROUTER_MAC,
+                                           ip_src=self.src_ip,
+                                           ip_ttl=63,
+                                           pktlen=100,
+                                           with_tcp_chksum=True)
+
+        udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100)
+        no_nat_udp_pkt = simple_udp_packet(eth_dst=self.no_nat_nbor_mac,
+                                           eth_src=ROUTER_MAC,
+                                           ip_src=self.src_ip,
+                                           ip_ttl=63,
+                                           pktlen=100)
+
         def verify_translation(dst_rif):
             '''
             Additional helper function for translation verification.
@@ -1971,178 +1470,46 @@ class NatTranslationNoBdTest(SaiHelper):
             acl_counter = sai_thrift_get_acl_counter_attribute(
                 self.client, self.egr_acl_counter, packets=True)['packets']
 
-            src_ip = "20.20.20.1"
-
             dst_ip = self.nat_ip_to_port
             if dst_rif == self.egr_lag_rif:
                 dst_ip = self.nat_ip_to_lag
             elif dst_rif == self.egr_svi_rif:
                 dst_ip = self.nat_ip_to_svi
 
-            tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=dst_ip,
-                                        ip_ttl=64,
-                                        pktlen=100,
-                                        with_tcp_chksum=True)
-            no_nat_tcp_pkt = simple_tcp_packet(eth_dst=self.no_nat_nbor_mac,
-                                               eth_src=ROUTER_MAC,
-                                               ip_src=src_ip,
-                                               ip_dst=dst_ip,
-                                               ip_ttl=63,
-                                               pktlen=100,
-                                               with_tcp_chksum=True)
-
-            udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=dst_ip,
-                                        ip_ttl=64,
-                                        pktlen=100)
-            no_nat_udp_pkt = simple_udp_packet(eth_dst=self.no_nat_nbor_mac,
-                                               eth_src=ROUTER_MAC,
-                                               ip_src=src_ip,
-                                               ip_dst=dst_ip,
-                                               ip_ttl=63,
-                                               pktlen=100)
-
-            print("   Inress L3 port")
-            print("Disable NAT on src RIF")
-            print("Sending TCP packet with NAT disabled by ACL on L3 Port")
-            send_packet(self, self.ingr_port_dev, tcp_pkt)
-            verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-            self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("Sending UDP packet with NAT disabled by ACL on L3 Port")
-            send_packet(self, self.ingr_port_dev, udp_pkt)
-            verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-            self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                   acl_counter))
-            acl_counter += 1
-            print("\tOK")
-
-            print("   Inress L3 LAG")
-            for src_port in self.ingr_lag_dev:
+            tcp_pkt[IP].dst = dst_ip
+            no_nat_tcp_pkt[IP].dst = dst_ip
+            udp_pkt[IP].dst = dst_ip
+            no_nat_udp_pkt[IP].dst = dst_ip
 
-                print("Disable NAT on src RIF")
-                print("Sending TCP packet with NAT disabled by ACL on L3 LAG")
-                send_packet(self, src_port, tcp_pkt)
-                verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Sending UDP packet with NAT disabled by ACL on L3 LAG")
-                send_packet(self, src_port, udp_pkt)
-                verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-            print("   Inress SVI")
-            for src_port in self.ingr_svi_dev:
+            # the packets are sent from every ingress port, so they are
+            # serialized only once
+            tcp_raw = bytes(tcp_pkt)
+            udp_raw = bytes(udp_pkt)
 
+            for name, src_ports in ingress_sources:
+                print("   Ingress %s" % name)
                 print("Disable NAT on src RIF")
-                print("Sending TCP packet with NAT disabled by ACL on SVI")
-                send_packet(self, src_port, tcp_pkt)
-                verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
-
-                print("Sending UDP packet with NAT disabled by ACL on SVI")
-                send_packet(self, src_port, udp_pkt)
-                verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
-                self.assertTrue(self._verifyAclCounter(self.egr_acl_counter,
-                                                       acl_counter))
-                acl_counter += 1
-                print("\tOK")
+                print("Sending TCP and UDP packets with NAT disabled by ACL"
+                      " on %s" % name)
+                # packets from different ingress ports may egress in any
+                # order and verify_packet() drops the ones it doesn't
+                # match, so each ingress port is verified before the next
+                # one sends
+                for src_port in src_ports:
+                    send_packet(self, src_port, tcp_raw)
+                    send_packet(self, src_port, udp_raw)
+                    verify_packet(self, no_nat_tcp_pkt, self.no_nat_eport)
+                    verify_packet(self, no_nat_udp_pkt, self.no_nat_eport)
+                # the counter is read once for all the ingress ports
+                count = 2 * len(src_ports)
+                self.assertTrue(self._verifyAclCounter(
+                    self.egr_acl_counter, acl_counter, count=count))
+                acl_counter += count
 
         try:
-            self._egrNatAclConfiguration(True)
-            # NAT configuration
-            port_nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    dst_ip=self.nat_ip_to_port),
-                mask=sai_thrift_nat_entry_mask_t(
-                    dst_ip='255.255.255.255'))
-
-            port_dnat = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=port_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
-            sai_thrift_create_nat_entry(
-                self.client, port_dnat, dst_ip=self.port_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
-                enable_packet_count=True)
-
-            port_dnat_pool = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=port_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-            sai_thrift_create_nat_entry(
-                self.client, port_dnat_pool, dst_ip=self.port_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-
-            lag_nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    dst_ip=self.nat_ip_to_lag),
-                mask=sai_thrift_nat_entry_mask_t(
-                    dst_ip='255.255.255.255'))
-
-            lag_dnat = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=lag_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
-            sai_thrift_create_nat_entry(
-                self.client, lag_dnat, dst_ip=self.lag_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
-                enable_packet_count=True)
-
-            lag_dnat_pool = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=lag_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-            sai_thrift_create_nat_entry(
-                self.client, lag_dnat_pool, dst_ip=self.lag_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-
-            svi_nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    dst_ip=self.nat_ip_to_svi),
-                mask=sai_thrift_nat_entry_mask_t(
-                    dst_ip='255.255.255.255'))
-
-            svi_dnat = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=svi_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
-            sai_thrift_create_nat_entry(
-                self.client, svi_dnat, dst_ip=self.svi_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
-                enable_packet_count=True)
-
-            svi_dnat_pool = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=svi_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-            sai_thrift_create_nat_entry(
-                self.client, svi_dnat_pool, dst_ip=self.svi_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
+            with SaiPipeline(self.client) as pipeline:
+                nat_entries = self._natAclConfiguration(
+                    pipeline, 'dst', nat_enable=False)
 
             print("\n***Egress L3 port <-***")
             verify_translation(self.egr_port_rif)
@@ -2152,126 +1519,113 @@ class NatTranslationNoBdTest(SaiHelper):
             verify_translation(self.egr_svi_rif)
 
         finally:
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
+            with SaiPipeline(self.client) as pipeline:
+                self._natAclCleanup(pipeline, 'dst', nat_entries)
 
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
+    def _natZoneRifs(self, direction):
+        '''
+        Helper function returning RIFs on the NAT side of given direction.
 
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
+        Args:
+            direction (str): 'src' for source or 'dst' for destination NAT
 
-            sai_thrift_remove_nat_entry(self.client, svi_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, svi_dnat)
+        Return:
+            list: egress RIFs for source NAT, ingress RIFs for destination NAT
+        '''
+        if direction == 'src':
+            return [self.egr_port_rif, self.egr_lag_rif, self.egr_svi_rif]
+        return [self.ingr_port_rif, self.ingr_lag_rif, self.ingr_svi_rif]
 
-            sai_thrift_remove_nat_entry(self.client, lag_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, lag_dnat)
+    def _natAclConfiguration(self, pipeline, direction, nat_enable):
+        '''
+        Helper function configuring a NAT ACL translation test.
+        Creates NAT entries of given direction, moves the RIFs on their NAT
+        side to NAT zone 1 and sets the action of the ACL entry matching
+        the test packets.
 
-            sai_thrift_remove_nat_entry(self.client, port_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, port_dnat)
+        Args:
+            pipeline (SaiPipeline): pipeline the configuration is sent in
+            direction (str): 'src' for source or 'dst' for destination NAT
+            nat_enable (bool): True if ACL entry should enable translation
 
-            sai_thrift_remove_acl_entry(self.client, self.egr_acl_svi_entry)
-            sai_thrift_remove_acl_entry(self.client, self.egr_acl_lag_entry)
-            sai_thrift_remove_acl_entry(self.client, self.egr_acl_port_entry)
+        Return:
+            list: NAT entries to be passed to _natAclCleanup; the source
+                  NAT entry or each destination NAT entry followed by its
+                  pool entry for L3 port, L3 LAG and SVI
+        '''
+        nat_entries = []
+        if direction == 'src':
+            nat_data = sai_thrift_nat_entry_data_t(
+                key=sai_thrift_nat_entry_key_t(src_ip=self.src_ip),
+                mask=sai_thrift_nat_entry_mask_t(src_ip='255.255.255.255'))
 
-    # it is intentional to define following objects inside the function below
-    # noqa pylint: disable=attribute-defined-outside-init
-    def _ingrNatAclConfiguration(self, nat_disable):
-        print(" ingress Nat Acl Configuration")
-        acl_action = sai_thrift_acl_action_data_t(
-            enable=True,
-            parameter=sai_thrift_acl_action_parameter_t(booldata=nat_disable))
+            snat = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
+                                          data=nat_data,
+                                          nat_type=SAI_NAT_TYPE_SOURCE_NAT)
+            sai_thrift_create_nat_entry(pipeline,
+                                        snat,
+                                        src_ip=self.nat_src_ip,
+                                        nat_type=SAI_NAT_TYPE_SOURCE_NAT,
+                                        enable_packet_count=True)
+            nat_entries.append(snat)
+            acl_entry = self.ingr_acl_entry
+        else:
+            for nat_ip, nbor_ip in [(self.nat_ip_to_port, self.port_nbor_ip),
+                                    (self.nat_ip_to_lag, self.lag_nbor_ip),
+                                    (self.nat_ip_to_svi, self.svi_nbor_ip)]:
+                nat_data = sai_thrift_nat_entry_data_t(
+                    key=sai_thrift_nat_entry_key_t(dst_ip=nat_ip),
+                    mask=sai_thrift_nat_entry_mask_t(
+                        dst_ip='255.255.255.255'))
+
+                dnat = sai_thrift_nat_entry_t(
+                    vr_id=self.default_vrf, data=nat_data,
+                    nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
+                sai_thrift_create_nat_entry(
+                    pipeline, dnat, dst_ip=nbor_ip,
+                    nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
+                    enable_packet_count=True)
+
+                dnat_pool = sai_thrift_nat_entry_t(
+                    vr_id=self.default_vrf, data=nat_data,
+                    nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
+                sai_thrift_create_nat_entry(
+                    pipeline, dnat_pool, dst_ip=nbor_ip,
+                    nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
+
+                nat_entries += [dnat, dnat_pool]
+            acl_entry = self.egr_acl_entry
+
+        for rif in self._natZoneRifs(direction):
+            sai_thrift_set_router_interface_attribute(
+                pipeline, rif, nat_zone_id=1)
+
+        if nat_enable:
+            sai_thrift_set_acl_entry_attribute(
+                pipeline, acl_entry, action_no_nat=self.nat_action)
 
-        ingr_acl_cnt_action = sai_thrift_acl_action_data_t(
-            enable=True,
-            parameter=sai_thrift_acl_action_parameter_t(
-                oid=self.ingr_acl_counter))
+        return nat_entries
 
-        port_nbor_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.port_nbor_ip),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.ingr_acl_port_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.ingr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=ingr_acl_cnt_action,
-            field_dst_ip=port_nbor_ip_addr)
-
-        lag_nbor_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.lag_nbor_ip),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.ingr_acl_lag_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.ingr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=ingr_acl_cnt_action,
-            field_dst_ip=lag_nbor_ip_addr)
-
-        svi_nbor_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.svi_nbor_ip),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.ingr_acl_svi_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.ingr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=ingr_acl_cnt_action,
-            field_dst_ip=svi_nbor_ip_addr)
-
-    # it is intentional to define following objects inside the function below
-    # noqa pylint: disable=attribute-defined-outside-init
-    def _egrNatAclConfiguration(self, nat_disable):
-        print("egress Nat Acl Configuration")
-
-        acl_action = sai_thrift_acl_action_data_t(
-            enable=True,
-            parameter=sai_thrift_acl_action_parameter_t(booldata=nat_disable))
+    def _natAclCleanup(self, pipeline, direction, nat_entries):
+        '''
+        Helper function reverting _natAclConfiguration.
 
-        egr_acl_cnt_action = sai_thrift_acl_action_data_t(
-            enable=True,
-            parameter=sai_thrift_acl_action_parameter_t(
-                oid=self.egr_acl_counter))
+        Args:
+            pipeline (SaiPipeline): pipeline the configuration is sent in
+            direction (str): 'src' for source or 'dst' for destination NAT
+            nat_entries (list): NAT entries returned by _natAclConfiguration
+        '''
+        for rif in reversed(self._natZoneRifs(direction)):
+            sai_thrift_set_router_interface_attribute(
+                pipeline, rif, nat_zone_id=0)
 
-        to_port_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.nat_ip_to_port),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.egr_acl_port_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.egr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=egr_acl_cnt_action,
-            field_dst_ip=to_port_ip_addr)
-
-        to_lag_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.nat_ip_to_lag),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.egr_acl_lag_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.egr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=egr_acl_cnt_action,
-            field_dst_ip=to_lag_ip_addr)
-
-        to_svi_ip_addr = sai_thrift_acl_field_data_t(
-            data=sai_thrift_acl_field_data_data_t(ip4=self.nat_ip_to_svi),
-            mask=sai_thrift_acl_field_data_mask_t(ip4="255.255.255.255"))
-
-        self.egr_acl_svi_entry = sai_thrift_create_acl_entry(
-            self.client,
-            table_id=self.egr_acl_table,
-            action_no_nat=acl_action,
-            action_counter=egr_acl_cnt_action,
-            field_dst_ip=to_svi_ip_addr)
+        for nat_entry in reversed(nat_entries):
+            sai_thrift_remove_nat_entry(pipeline, nat_entry)
+
+        acl_entry = (self.ingr_acl_entry if direction == 'src'
+                     else self.egr_acl_entry)
+        sai_thrift_set_acl_entry_attribute(
+            pipeline, acl_entry, action_no_nat=self.no_nat_action)
 
     def srcNatAclTranslationEnableTest(self):
         '''
@@ -2283,10 +1637,35 @@ class NatTranslationNoBdTest(SaiHelper):
         '''
         print("\nsrcNatAclTranslationEnableTest()")
 
-        src_ip = "20.20.20.1"
-        nat_src_ip = "150.10.10.10"
+        # egress neighbors the packets are routed to
+        egress_targets = [
+            ("L3 port", self.port_nbor_ip, self.port_nbor_mac,
+             self.egr_port_dev),
+            ("L3 LAG", self.lag_nbor_ip, self.lag_nbor_mac, self.egr_lag_dev),
+            ("SVI", self.svi_nbor_ip, self.svi_nbor_mac, self.dev_port26)]
 
-        def verify_translation(src_port_dev):
+        # destination addresses are set for each egress neighbor
+        tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100,
+                                    with_tcp_chksum=True)
+        nat_tcp_pkt = simple_tcp_packet(eth_src=ROUTER_MAC,
+                                        ip_src=self.nat_src_ip,
+                                        ip_ttl=63,
+                                        pktlen=100,
+                                        with_tcp_chksum=True)
+
+        udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100)
+        nat_udp_pkt = simple_udp_packet(eth_src=ROUTER_MAC,
+                                        ip_src=self.nat_src_ip,
+                                        ip_ttl=63,
+                                        pktlen=100)
+
+        def verify_translation(src_port_dev, nat_hits):
             '''
             Additional helper function for translation verification.
             Verifies if translation doesn't occur when ACL is configured
@@ -2294,157 +1673,62 @@ class NatTranslationNoBdTest(SaiHelper):
 
             Args:
                 src_port_dev (int): source device port number
-            '''
+                nat_hits (int): source NAT entry counter value
 
-            # use route to L3 port
-            print("   -> Egress L3 port")
-            tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=self.port_nbor_ip,
-                                        ip_ttl=64,
-                                        pktlen=100,
-                                        with_tcp_chksum=True)
-            nat_tcp_pkt = simple_tcp_packet(eth_dst=self.port_nbor_mac,
-                                            eth_src=ROUTER_MAC,
-                                            ip_src=nat_src_ip,
-                                            ip_dst=self.port_nbor_ip,
-                                            ip_ttl=63,
-                                            pktlen=100,
-                                            with_tcp_chksum=True)
-
-            udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=self.port_nbor_ip,
-                                        ip_ttl=64,
-                                        pktlen=100)
-            nat_udp_pkt = simple_udp_packet(eth_dst=self.port_nbor_mac,
-                                            eth_src=ROUTER_MAC,
-                                            ip_src=nat_src_ip,
-                                            ip_dst=self.port_nbor_ip,
-                                            ip_ttl=63,
-                                            pktlen=100)
+            Return:
+                int: source NAT entry counter value after the packets
+                     were sent
+            '''
 
-            print("Sending TCP packet with NAT enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, nat_tcp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, nat_udp_pkt, self.egr_port_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            # use route to L3 LAG
-            print("   -> Egress L3 LAG")
-            tcp_pkt[IP].dst = self.lag_nbor_ip
-
-            nat_tcp_pkt[Ether].dst = self.lag_nbor_mac
-            nat_tcp_pkt[IP].dst = self.lag_nbor_ip
-
-            udp_pkt[IP].dst = self.lag_nbor_ip
-            nat_udp_pkt[Ether].dst = self.lag_nbor_mac
-            nat_udp_pkt[IP].dst = self.lag_nbor_ip
-
-            print("Sending TCP packet with NAT enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet_any_port(self, nat_tcp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet_any_port(self, nat_udp_pkt, self.egr_lag_dev)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            # use route to SVI
-            print("   -> Egress SVI")
-            tcp_pkt[IP].dst = self.svi_nbor_ip
-
-            nat_tcp_pkt[Ether].dst = self.svi_nbor_mac
-            nat_tcp_pkt[IP].dst = self.svi_nbor_ip
-
-            udp_pkt[IP].dst = self.svi_nbor_ip
-            nat_udp_pkt[Ether].dst = self.svi_nbor_mac
-            nat_udp_pkt[IP].dst = self.svi_nbor_ip
-
-            print("Sending TCP packet with NAT enabled")
-            send_packet(self, src_port_dev, tcp_pkt)
-            verify_packet(self, nat_tcp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled")
-            send_packet(self, src_port_dev, udp_pkt)
-            verify_packet(self, nat_udp_pkt, self.dev_port26)
-            self.assertTrue(self._verifyNatHit(snat))
-            print("\tOK")
+            for name, nbor_ip, nbor_mac, dst_port_dev in egress_targets:
+                print("   -> Egress %s" % name)
+                tcp_pkt[IP].dst = nbor_ip
+                nat_tcp_pkt[Ether].dst = nbor_mac
+                nat_tcp_pkt[IP].dst = nbor_ip
+
+                udp_pkt[IP].dst = nbor_ip
+                nat_udp_pkt[Ether].dst = nbor_mac
+                nat_udp_pkt[IP].dst = nbor_ip
+
+                print("Sending TCP and UDP packets with NAT enabled")
+                if isinstance(dst_port_dev, list):
+                    # verify_packet_any_port fails on any other queued
+                    # packet, so packets sent to a LAG are verified one
+                    # by one
+                    send_packet(self, src_port_dev, tcp_pkt)
+                    verify_packet_any_port(self, nat_tcp_pkt, dst_port_dev)
+                    send_packet(self, src_port_dev, udp_pkt)
+                    verify_packet_any_port(self, nat_udp_pkt, dst_port_dev)
+                else:
+                    send_packet(self, src_port_dev, tcp_pkt)
+                    send_packet(self, src_port_dev, udp_pkt)
+                    verify_packet(self, nat_tcp_pkt, dst_port_dev)
+                    verify_packet(self, nat_udp_pkt, dst_port_dev)
+                self.assertTrue(self._verifyNatHit(snat, nat_hits, 2))
+                nat_hits += 2
+
+            return nat_hits
 
         try:
-            self._ingrNatAclConfiguration(False)
-            nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    src_ip=src_ip),
-                mask=sai_thrift_nat_entry_mask_t(
-                    src_ip='255.255.255.255'))
-
-            snat = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                          data=nat_data,
-                                          nat_type=SAI_NAT_TYPE_SOURCE_NAT)
-            sai_thrift_create_nat_entry(self.client,
-                                        snat,
-                                        src_ip=nat_src_ip,
-                                        nat_type=SAI_NAT_TYPE_SOURCE_NAT,
-                                        enable_packet_count=True)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=1)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=1)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=1)
+            with SaiPipeline(self.client) as pipeline:
+                nat_entries = self._natAclConfiguration(
+                    pipeline, 'src', nat_enable=True)
+            snat = nat_entries[0]
 
+            # the entry is new, so its counter starts from 0
             print("\n***Ingress L3 port***")
-            verify_translation(self.ingr_port_dev)
+            nat_hits = verify_translation(self.ingr_port_dev, 0)
             print("\n***Ingress L3 LAG***")
             for lag_port in self.ingr_lag_dev:
-                verify_translation(lag_port)
+                nat_hits = verify_translation(lag_port, nat_hits)
 
             print("\n***Ingress SVI***")
             for svi_port in self.ingr_svi_dev:
-                verify_translation(svi_port)
+                nat_hits = verify_translation(svi_port, nat_hits)
 
         finally:
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_remove_nat_entry(self.client, snat)
-
-            sai_thrift_remove_acl_entry(self.client, self.ingr_acl_svi_entry)
-            sai_thrift_remove_acl_entry(self.client, self.ingr_acl_lag_entry)
-            sai_thrift_remove_acl_entry(self.client, self.ingr_acl_port_entry)
+            with SaiPipeline(self.client) as pipeline:
+                self._natAclCleanup(pipeline, 'src', nat_entries)
 
     def dstNatAclTranslationEnableTest(self):
         '''
@@ -2456,6 +1740,33 @@ class NatTranslationNoBdTest(SaiHelper):
         '''
         print("\n dstNatAclTranslationEnableTest()")
 
+        # ingress ports the packets are sent from
+        ingress_sources = [
+            ("L3 port", [self.ingr_port_dev]),
+            ("L3 LAG", self.ingr_lag_dev),
+            ("SVI", self.ingr_svi_dev)]
+
+        # destination addresses are set for each destination RIF
+        tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100,
+                                    with_tcp_chksum=True)
+        nat_tcp_pkt = simple_tcp_packet(eth_src=ROUTER_MAC,
+                                        ip_src=self.src_ip,
+                                        ip_ttl=63,
+                                        pktlen=100,
+                                        with_tcp_chksum=True)
+
+        udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
+                                    ip_src=self.src_ip,
+                                    ip_ttl=64,
+                                    pktlen=100)
+        nat_udp_pkt = simple_udp_packet(eth_src=ROUTER_MAC,
+                                        ip_src=self.src_ip,
+                                        ip_ttl=63,
+                                        pktlen=100)
+
         def verify_translation(dst_rif):
             '''
             Additional helper function for translation verification.
@@ -2465,177 +1776,72 @@ class NatTranslationNoBdTest(SaiHelper):
             Args:
                 dst_rif (oid): object ID of destination RIF
             '''
-
-            src_ip = "20.20.20.1"
-
-            verify_fn = verify_packet
-            dst_port_dev = self.egr_port_dev
-            dst_ip = self.nat_ip_to_port
-            dst_mac = self.port_nbor_mac
-            nat_dst_ip = self.port_nbor_ip
-            dnat = port_dnat
-            if dst_rif == self.egr_lag_rif:
-                verify_fn = verify_packet_any_port
-                dst_port_dev = self.egr_lag_dev
-                dst_ip = self.nat_ip_to_lag
-                dst_mac = self.lag_nbor_mac
-                nat_dst_ip = self.lag_nbor_ip
-                dnat = lag_dnat
-            elif dst_rif == self.egr_svi_rif:
-                verify_fn = verify_packet
-                dst_port_dev = self.dev_port26
-                dst_ip = self.nat_ip_to_svi
-                dst_mac = self.svi_nbor_mac
-                nat_dst_ip = self.svi_nbor_ip
-                dnat = svi_dnat
-
-            tcp_pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=dst_ip,
-                                        ip_ttl=64,
-                                        pktlen=100,
-                                        with_tcp_chksum=True)
-            nat_tcp_pkt = simple_tcp_packet(eth_dst=dst_mac,
-                                            eth_src=ROUTER_MAC,
-                                            ip_src=src_ip,
-                                            ip_dst=nat_dst_ip,
-                                            ip_ttl=63,
-                                            pktlen=100,
-                                            with_tcp_chksum=True)
-
-            udp_pkt = simple_udp_packet(eth_dst=ROUTER_MAC,
-                                        ip_src=src_ip,
-                                        ip_dst=dst_ip,
-                                        ip_ttl=64,
-                                        pktlen=100)
-            nat_udp_pkt = simple_udp_packet(eth_dst=dst_mac,
-                                            eth_src=ROUTER_MAC,
-                                            ip_src=src_ip,
-                                            ip_dst=nat_dst_ip,
-                                            ip_ttl=63,
-                                            pktlen=100)
-
-            print("   Inress L3 port")
-            print("Sending TCP packet with NAT enabled on L3 Port")
-            send_packet(self, self.ingr_port_dev, tcp_pkt)
-            verify_fn(self, nat_tcp_pkt, dst_port_dev)
-            self.assertTrue(self._verifyNatHit(dnat))
-            print("\tOK")
-
-            print("Sending UDP packet with NAT enabled on L3 Port")
-            send_packet(self, self.ingr_port_dev, udp_pkt)
-            verify_fn(self, nat_udp_pkt, dst_port_dev)
-            self.assertTrue(self._verifyNatHit(dnat))
-            print("\tOK")
-
-            print("   Inress L3 LAG")
-            for src_port in self.ingr_lag_dev:
-                print("Sending TCP packet with NAT enabled on L3 LAG")
-                send_packet(self, src_port, tcp_pkt)
-                verify_fn(self, nat_tcp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Sending UDP packet with NAT enabled on L3 LAG")
-                send_packet(self, src_port, udp_pkt)
-                verify_fn(self, nat_udp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-            print("   Inress SVI")
-            for src_port in self.ingr_svi_dev:
-                print("Sending TCP packet with NAT enabled on SVI")
-                send_packet(self, src_port, tcp_pkt)
-                verify_fn(self, nat_tcp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
-
-                print("Sending UDP packet with NAT enabled on SVI")
-                send_packet(self, src_port, udp_pkt)
-                verify_fn(self, nat_udp_pkt, dst_port_dev)
-                self.assertTrue(self._verifyNatHit(dnat))
-                print("\tOK")
+            # each NAT entry is new and verified only once
+            nat_hits = 0
+
+            (dst_port_dev, dst_ip, dst_mac, nat_dst_ip,
+             dnat) = rif_params[dst_rif]
+
+            tcp_pkt[IP].dst = dst_ip
+            nat_tcp_pkt[Ether].dst = dst_mac
+            nat_tcp_pkt[IP].dst = nat_dst_ip
+
+            udp_pkt[IP].dst = dst_ip
+            nat_udp_pkt[Ether].dst = dst_mac
+            nat_udp_pkt[IP].dst = nat_dst_ip
+
+            # the packets are sent from every ingress port, so they are
+            # serialized only once
+            tcp_raw = bytes(tcp_pkt)
+            udp_raw = bytes(udp_pkt)
+
+            for name, src_ports in ingress_sources:
+                print("   Ingress %s" % name)
+                print("Sending TCP and UDP packets with NAT enabled on %s"
+                      % name)
+                if isinstance(dst_port_dev, list):
+                    # verify_packet_any_port fails on any other queued
+                    # packet, so packets sent to a LAG are verified one
+                    # by one
+                    for src_port in src_ports:
+                        send_packet(self, src_port, tcp_raw)
+                        verify_packet_any_port(self, nat_tcp_pkt, dst_port_dev)
+                        send_packet(self, src_port, udp_raw)
+                        verify_packet_any_port(self, nat_udp_pkt, dst_port_dev)
+                else:
+                    # packets queue up on the egress port, so they are all
+                    # sent first and then verified in the sending order
+                    for src_port in src_ports:
+                        send_packet(self, src_port, tcp_raw)
+                        send_packet(self, src_port, udp_raw)
+                    for _ in src_ports:
+                        verify_packet(self, nat_tcp_pkt, dst_port_dev)
+                        verify_packet(self, nat_udp_pkt, dst_port_dev)
+                # the counter is read once for all the ingress ports
+                count = 2 * len(src_ports)
+                self.assertTrue(self._verifyNatHit(dnat, nat_hits, count))
+                nat_hits += count
 
         try:
-            self._egrNatAclConfiguration(False)
-            # NAT configuration
-            port_nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    dst_ip=self.nat_ip_to_port),
-                mask=sai_thrift_nat_entry_mask_t(
-                    dst_ip='255.255.255.255'))
-
-            port_dnat = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=port_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
-            sai_thrift_create_nat_entry(
-                self.client, port_dnat, dst_ip=self.port_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
-                enable_packet_count=True)
-
-            port_dnat_pool = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=port_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-            sai_thrift_create_nat_entry(
-                self.client, port_dnat_pool, dst_ip=self.port_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-
-            lag_nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    dst_ip=self.nat_ip_to_lag),
-                mask=sai_thrift_nat_entry_mask_t(
-                    dst_ip='255.255.255.255'))
-
-            lag_dnat = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=lag_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
-            sai_thrift_create_nat_entry(
-                self.client, lag_dnat, dst_ip=self.lag_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
-                enable_packet_count=True)
-
-            lag_dnat_pool = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=lag_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-            sai_thrift_create_nat_entry(
-                self.client, lag_dnat_pool, dst_ip=self.lag_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-
-            svi_nat_data = sai_thrift_nat_entry_data_t(
-                key=sai_thrift_nat_entry_key_t(
-                    dst_ip=self.nat_ip_to_svi),
-                mask=sai_thrift_nat_entry_mask_t(
-                    dst_ip='255.255.255.255'))
-
-            svi_dnat = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=svi_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT)
-            sai_thrift_create_nat_entry(
-                self.client, svi_dnat, dst_ip=self.svi_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT,
-                enable_packet_count=True)
-
-            svi_dnat_pool = sai_thrift_nat_entry_t(
-                vr_id=self.default_vrf, data=svi_nat_data,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-            sai_thrift_create_nat_entry(
-                self.client, svi_dnat_pool, dst_ip=self.svi_nbor_ip,
-                nat_type=SAI_NAT_TYPE_DESTINATION_NAT_POOL)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=1)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
+            with SaiPipeline(self.client) as pipeline:
+                nat_entries = self._natAclConfiguration(
+                    pipeline, 'dst', nat_enable=True)
+
+            # the pool entries follow their destination NAT entries
+            port_dnat, lag_dnat, svi_dnat = nat_entries[::2]
+
+            # egress port(s), packet destination IP, translated destination
+            # MAC and IP and the NAT entry of each destination RIF
+            rif_params = {
+                self.egr_port_rif: (
+                    self.egr_port_dev, self.nat_ip_to_port,
+                    self.port_nbor_mac, self.port_nbor_ip, port_dnat),
+                self.egr_lag_rif: (
+                    self.egr_lag_dev, self.nat_ip_to_lag,
+                    self.lag_nbor_mac, self.lag_nbor_ip, lag_dnat),
+                self.egr_svi_rif: (
+                    self.dev_port26, self.nat_ip_to_svi,
+                    self.svi_nbor_mac, self.svi_nbor_ip, svi_dnat)}
 
             print("\n***Egress L3 port <-***")
             verify_translation(self.egr_port_rif)
@@ -2645,33 +1851,8 @@ class NatTranslationNoBdTest(SaiHelper):
             verify_translation(self.egr_svi_rif)
 
         finally:
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_svi_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_svi_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_lag_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_lag_rif, nat_zone_id=0)
-
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.ingr_port_rif, nat_zone_id=0)
-            sai_thrift_set_router_interface_attribute(
-                self.client, self.egr_port_rif, nat_zone_id=0)
-
-            sai_thrift_remove_nat_entry(self.client, svi_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, svi_dnat)
-
-            sai_thrift_remove_nat_entry(self.client, lag_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, lag_dnat)
-
-            sai_thrift_remove_nat_entry(self.client, port_dnat_pool)
-            sai_thrift_remove_nat_entry(self.client, port_dnat)
-
-            sai_thrift_remove_acl_entry(self.client, self.egr_acl_svi_entry)
-            sai_thrift_remove_acl_entry(self.client, self.egr_acl_lag_entry)
-            sai_thrift_remove_acl_entry(self.client, self.egr_acl_port_entry)
+            with SaiPipeline(self.client) as pipeline:
+                self._natAclCleanup(pipeline, 'dst', nat_entries)
 
 
 @group('nat')
@@ -2694,84 +1875,99 @@ class NatTest(SaiHelper):
         self.translate_server_ip = '200.200.200.1'
         mask = '/24'
 
+        # packet templates shared by the subtests, each subtest works on
+        # its own copy and sets the addresses and L4 ports it depends on
+        self.pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
+                                     eth_src=self.dmac2,
+                                     ip_id=105,
+                                     ip_ttl=64)
+        self.exp_pkt = simple_tcp_packet(eth_src=ROUTER_MAC,
+                                         ip_id=105,
+                                         ip_ttl=63)
+
         # Route configuration
         server_port = self.port24
         wan_port = self.port25
 
-        server_rif = sai_thrift_create_router_interface(
-            client=self.client, virtual_router_id=self.default_vrf,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT, port_id=server_port,
-            nat_zone_id=0)
-        self.rifs.append(server_rif)
-        wan_rif = sai_thrift_create_router_interface(
-            client=self.client, virtual_router_id=self.default_vrf,
-            type=SAI_ROUTER_INTERFACE_TYPE_PORT, port_id=wan_port,
-            nat_zone_id=1)
-        self.rifs.append(wan_rif)
-
-        print("Creates nieghbor with %s ip address, %d router interface"
-              " id and %s destination mac" % (
-                  self.nhop_ip, wan_rif, self.dmac))
-        nbr_entry1 = sai_thrift_neighbor_entry_t(
-            rif_id=wan_rif,
-            ip_address=sai_ipaddress(self.nhop_ip))
-        sai_thrift_create_neighbor_entry(client=self.client,
-                                         neighbor_entry=nbr_entry1,
-                                         dst_mac_address=self.dmac)
-        self.nbrs.append(nbr_entry1)
-
-        print("Creates nhop with %s ip address and %d router"
-              " interface id" % (self.nhop_ip, wan_rif))
-        nhop1 = sai_thrift_create_next_hop(
-            self.client, ip=sai_ipaddress(self.nhop_ip),
-            router_interface_id=wan_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-        self.nhops.append(nhop1)
-
-        # 10.10.10.0/24 --> NHOP1(WAN)
-        route_entry1 = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.ip_addr + mask))
-        sai_thrift_create_route_entry(client=self.client,
-                                      route_entry=route_entry1,
-                                      next_hop_id=nhop1)
-        self.routes.append(route_entry1)
-
-        route_entry2 = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.nhop_ip + mask))
-        sai_thrift_create_route_entry(client=self.client,
-                                      route_entry=route_entry2,
-                                      next_hop_id=wan_rif)
-        self.routes.append(route_entry2)
-
-        # 192.168.0.1/24 --> NHOP(SERVER)
-        print("Creates nieghbor with %s ip address, %d router interface"
-              " id and %s destination mac" % (
-                  self.server_ip, server_rif, self.server_dmac))
-        nbr_entry2 = sai_thrift_neighbor_entry_t(
-            rif_id=server_rif,
-            ip_address=sai_ipaddress(self.server_ip))
-        sai_thrift_create_neighbor_entry(client=self.client,
-                                         neighbor_entry=nbr_entry2,
-                                         dst_mac_address=self.server_dmac)
-        self.nbrs.append(nbr_entry2)
-
-        print("Creates nhop with %s ip address and %d router"
-              " interface id" % (self.server_ip, server_rif))
-        nhop2 = sai_thrift_create_next_hop(
-            self.client, ip=sai_ipaddress(self.server_ip),
-            router_interface_id=server_rif,
-            type=SAI_NEXT_HOP_TYPE_IP)
-        self.nhops.append(nhop2)
-
-        route_entry3 = sai_thrift_route_entry_t(
-            vr_id=self.default_vrf,
-            destination=sai_ipprefix(self.server_ip + mask))
-        sai_thrift_create_route_entry(client=self.client,
-                                      route_entry=route_entry3,
-                                      next_hop_id=nhop2)
-        self.routes.append(route_entry3)
+        # objects are created in a pipeline per dependency level,
+        # i.e. RIFs, their neighbors and nhops, and routes via the nhops
+        with SaiPipeline(self.client) as pipeline:
+            sai_thrift_create_router_interface(
+                client=pipeline, virtual_router_id=self.default_vrf,
+                type=SAI_ROUTER_INTERFACE_TYPE_PORT, port_id=server_port,
+                nat_zone_id=0)
+            sai_thrift_create_router_interface(
+                client=pipeline, virtual_router_id=self.default_vrf,
+                type=SAI_ROUTER_INTERFACE_TYPE_PORT, port_id=wan_port,
+                nat_zone_id=1)
+        server_rif, wan_rif = pipeline.results
+        self.rifs += pipeline.results
+
+        with SaiPipeline(self.client) as pipeline:
+            print("Creates nieghbor with %s ip address, %d router interface"
+                  " id and %s destination mac" % (
+                      self.nhop_ip, wan_rif, self.dmac))
+            nbr_entry1 = sai_thrift_neighbor_entry_t(
+                rif_id=wan_rif,
+                ip_address=_ipaddr(self.nhop_ip))
+            sai_thrift_create_neighbor_entry(client=pipeline,
+                                             neighbor_entry=nbr_entry1,
+                                             dst_mac_address=self.dmac)
+            self.nbrs.append(nbr_entry1)
+
+            print("Creates nhop with %s ip address and %d router"
+                  " interface id" % (self.nhop_ip, wan_rif))
+            sai_thrift_create_next_hop(
+                pipeline, ip=_ipaddr(self.nhop_ip),
+                router_interface_id=wan_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+
+            # 192.168.0.1/24 --> NHOP(SERVER)
+            print("Creates nieghbor with %s ip address, %d router interface"
+                  " id and %s destination mac" % (
+                      self.server_ip, server_rif, self.server_dmac))
+            nbr_entry2 = sai_thrift_neighbor_entry_t(
+                rif_id=server_rif,
+                ip_address=_ipaddr(self.server_ip))
+            sai_thrift_create_neighbor_entry(client=pipeline,
+                                             neighbor_entry=nbr_entry2,
+                                             dst_mac_address=self.server_dmac)
+            self.nbrs.append(nbr_entry2)
+
+            print("Creates nhop with %s ip address and %d router"
+                  " interface id" % (self.server_ip, server_rif))
+            sai_thrift_create_next_hop(
+                pipeline, ip=_ipaddr(self.server_ip),
+                router_interface_id=server_rif,
+                type=SAI_NEXT_HOP_TYPE_IP)
+        _, nhop1, _, nhop2 = pipeline.results
+        self.nhops += [nhop1, nhop2]
+
+        with SaiPipeline(self.client) as pipeline:
+            # 10.10.10.0/24 --> NHOP1(WAN)
+            route_entry1 = sai_thrift_route_entry_t(
+                vr_id=self.default_vrf,
+                destination=_ipprefix(self.ip_addr + mask))
+            sai_thrift_create_route_entry(client=pipeline,
+                                          route_entry=route_entry1,
+                                          next_hop_id=nhop1)
+            self.routes.append(route_entry1)
+
+            route_entry2 = sai_thrift_route_entry_t(
+                vr_id=self.default_vrf,
+                destination=_ipprefix(self.nhop_ip + mask))
+            sai_thrift_create_route_entry(client=pipeline,
+                                          route_entry=route_entry2,
+                                          next_hop_id=wan_rif)
+            self.routes.append(route_entry2)
+
+            route_entry3 = sai_thrift_route_entry_t(
+                vr_id=self.default_vrf,
+                destination=_ipprefix(self.server_ip + mask))
+            sai_thrift_create_route_entry(client=pipeline,
+                                          route_entry=route_entry3,
+                                          next_hop_id=nhop2)
+            self.routes.append(route_entry3)
 
         # NAT configuration
         # Translated server IP - 20.20.20.1
@@ -2785,74 +1981,58 @@ class NatTest(SaiHelper):
         translate_sport = 500
         translate_dport = 2000
 
-        nat_type = SAI_NAT_TYPE_DESTINATION_NAT
-        nat_data = sai_thrift_nat_entry_data_t(
-            key=sai_thrift_nat_entry_key_t(
-                dst_ip=self.translate_server_ip,
-                proto=proto,
-                l4_dst_port=l4_dst_port))
-        dnat1 = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                       data=nat_data,
-                                       nat_type=nat_type)
-        sai_thrift_create_nat_entry(self.client,
-                                    nat_entry=dnat1,
-                                    nat_type=nat_type,
-                                    dst_ip=self.server_ip,
-                                    l4_dst_port=translate_dport)
-        self.nats.append(dnat1)
-
-        nat_data = sai_thrift_nat_entry_data_t(
-            key=sai_thrift_nat_entry_key_t(
-                dst_ip=self.translate_server_ip))
-        dnat2 = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                       data=nat_data,
-                                       nat_type=nat_type)
-        sai_thrift_create_nat_entry(self.client,
-                                    nat_entry=dnat2,
-                                    nat_type=nat_type,
-                                    dst_ip=self.server_ip)
-        self.nats.append(dnat2)
-
-        nat_type = SAI_NAT_TYPE_DESTINATION_NAT_POOL
-        nat_data = sai_thrift_nat_entry_data_t(
-            key=sai_thrift_nat_entry_key_t(
-                dst_ip=self.translate_server_ip))
-        dnat3 = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                       data=nat_data,
-                                       nat_type=nat_type)
-        sai_thrift_create_nat_entry(self.client,
-                                    nat_entry=dnat3,
-                                    nat_type=nat_type,
-                                    dst_ip=self.server_ip)
-        self.nats.append(dnat3)
-
-        nat_type = SAI_NAT_TYPE_SOURCE_NAT
-        nat_data = sai_thrift_nat_entry_data_t(
-            key=sai_thrift_nat_entry_key_t(
-                src_ip=self.server_ip,
-                proto=proto,
-                l4_src_port=l4_src_port))
-        snat4 = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                       data=nat_data,
-                                       nat_type=nat_type)
-        sai_thrift_create_nat_entry(self.client,
-                                    nat_entry=snat4,
-                                    nat_type=nat_type,
-                                    src_ip=self.translate_server_ip,
-                                    l4_src_port=translate_sport)
-        self.nats.append(snat4)
-
-        nat_data = sai_thrift_nat_entry_data_t(
-            key=sai_thrift_nat_entry_key_t(
-                src_ip=self.server_ip))
-        snat5 = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
-                                       data=nat_data,
-                                       nat_type=nat_type)
-        sai_thrift_create_nat_entry(self.client,
-                                    nat_entry=snat5,
-                                    nat_type=nat_type,
-                                    src_ip=self.translate_server_ip)
-        self.nats.append(snat5)
+        # all NAT entries are sent in a single round-trip
+        with SaiPipeline(self.client) as pipeline:
+            nat_type = SAI_NAT_TYPE_DESTINATION_NAT
+            dnat1 = self._natEntry(nat_type,
+                                   dst_ip=self.translate_server_ip,
+                                   proto=proto,
+                                   l4_dst_port=l4_dst_port)
+            sai_thrift_create_nat_entry(pipeline,
+                                        nat_entry=dnat1,
+                                        nat_type=nat_type,
+                                        dst_ip=self.server_ip,
+                                        l4_dst_port=translate_dport)
+            self.nats.append(dnat1)
+
+            dnat2 = self._natEntry(nat_type,
+                                   dst_ip=self.translate_server_ip)
+            sai_thrift_create_nat_entry(pipeline,
+                                        nat_entry=dnat2,
+                                        nat_type=nat_type,
+                                        dst_ip=self.server_ip)
+            self.nats.append(dnat2)
+
+            # the pool entry has the same key as dnat2, so its data
+            # is shared
+            nat_type = SAI_NAT_TYPE_DESTINATION_NAT_POOL
+            dnat3 = sai_thrift_nat_entry_t(vr_id=self.default_vrf,
+                                           data=dnat2.data,
+                                           nat_type=nat_type)
+            sai_thrift_create_nat_entry(pipeline,
+                                        nat_entry=dnat3,
+                                        nat_type=nat_type,
+                                        dst_ip=self.server_ip)
+            self.nats.append(dnat3)
+
+            nat_type = SAI_NAT_TYPE_SOURCE_NAT
+            snat4 = self._natEntry(nat_type,
+                                   src_ip=self.server_ip,
+                                   proto=proto,
+                                   l4_src_port=l4_src_port)
+            sai_thrift_create_nat_entry(pipeline,
+                                        nat_entry=snat4,
+                                        nat_type=nat_type,
+                                        src_ip=self.translate_server_ip,
+                                        l4_src_port=translate_sport)
+            self.nats.append(snat4)
+
+            snat5 = self._natEntry(nat_type, src_ip=self.server_ip)
+            sai_thrift_create_nat_entry(pipeline,
+                                        nat_entry=snat5,
+                                        nat_type=nat_type,
+                                        src_ip=self.translate_server_ip)
+            self.nats.append(snat5)
 
     def runTest(self):
         try:
@@ -2864,25 +2044,43 @@ class NatTest(SaiHelper):
             pass
 
     def tearDown(self):
-        # Routing
-        for route in list(self.routes):
-            sai_thrift_remove_route_entry(self.client, route)
-            self.routes.remove(route)
-        for nhop in list(self.nhops):
-            sai_thrift_remove_next_hop(self.client, nhop)
-            self.nhops.remove(nhop)
-        for nbr in list(self.nbrs):
-            sai_thrift_remove_neighbor_entry(self.client, nbr)
-            self.nbrs.remove(nbr)
-        for rif in list(self.rifs):
-            sai_thrift_remove_router_interface(self.client, rif)
-            self.rifs.remove(rif)
-        # NAT
-        for nat in list(self.nats):
-            sai_thrift_remove_nat_entry(self.client, nat)
-            self.nats.remove(nat)
+        # requests are handled in order, so dependent objects can be
+        # removed in a single pipeline
+        with SaiPipeline(self.client) as pipeline:
+            # Routing
+            for route in self.routes:
+                sai_thrift_remove_route_entry(pipeline, route)
+            for nhop in self.nhops:
+                sai_thrift_remove_next_hop(pipeline, nhop)
+            for nbr in self.nbrs:
+                sai_thrift_remove_neighbor_entry(pipeline, nbr)
+            for rif in self.rifs:
+                sai_thrift_remove_router_interface(pipeline, rif)
+            # NAT
+            for nat in self.nats:
+                sai_thrift_remove_nat_entry(pipeline, nat)
+        for objects in (self.routes, self.nhops, self.nbrs, self.rifs,
+                        self.nats):
+            objects.clear()
         super(NatTest, self).tearDown()
 
+    def _natEntry(self, nat_type, **key):
+        '''
+        Helper function building a NAT entry in the default VRF.
+
+        Args:
+            nat_type (int): NAT entry type
+            key (dict): sai_thrift_nat_entry_key_t fields
+
+        Return:
+            sai_thrift_nat_entry_t: NAT entry
+        '''
+        return sai_thrift_nat_entry_t(
+            vr_id=self.default_vrf,
+            data=sai_thrift_nat_entry_data_t(
+                key=sai_thrift_nat_entry_key_t(**key)),
+            nat_type=nat_type)
+
     def natTrapTest(self):
         """Verifies trap configuration"""
         print("natTrapTest")
@@ -2890,34 +2088,40 @@ class NatTest(SaiHelper):
             trap_group = sai_thrift_create_hostif_trap_group(self.client,
                                                              queue=4)
 
-            dnat_trap = sai_thrift_create_hostif_trap(
-                client=self.client,
-                trap_type=SAI_HOSTIF_TRAP_TYPE_DNAT_MISS,
-                packet_action=SAI_PACKET_ACTION_TRAP,
-                trap_group=trap_group)
-
-            snat_trap = sai_thrift_create_hostif_trap(
-                client=self.client,
-                trap_type=SAI_HOSTIF_TRAP_TYPE_SNAT_MISS,
-                packet_action=SAI_PACKET_ACTION_TRAP,
-                trap_group=trap_group)
-
-            pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                    eth_src=self.dmac2,
-                                    ip_dst=self.ip_addr,
-                                    ip_src=self.src_ip,
-                                    ip_id=105,
-                                    ip_ttl=64)
+            # the queue stats are cleared along with the trap creation,
+            # so the trapped packet is counted from 0
+            with SaiPipeline(self.client) as pipeline:
+                sai_thrift_create_hostif_trap(
+                    client=pipeline,
+                    trap_type=SAI_HOSTIF_TRAP_TYPE_DNAT_MISS,
+                    packet_action=SAI_PACKET_ACTION_TRAP,
+                    trap_group=trap_group)
+
+                sai_thrift_create_hostif_trap(
+                    client=pipeline,
+                    trap_type=SAI_HOSTIF_TRAP_TYPE_SNAT_MISS,
+                    packet_action=SAI_PACKET_ACTION_TRAP,
+                    trap_group=trap_group)
+
+                sai_thrift_clear_queue_stats(pipeline, self.cpu_queue4)
+            dnat_trap, snat_trap, _ = pipeline.results
+
+            pkt = self.pkt.copy()
+            pkt[TCP].sport = 1234
+            pkt[TCP].dport = 80
+            pkt[IP].dst = self.ip_addr
+            pkt[IP].src = self.src_ip
 
-            pre_stats = sai_thrift_get_queue_stats(
-                self.client, self.cpu_queue4)
             send_packet(self, self.dev_port24, pkt)
-            time.sleep(4)
-            post_stats = sai_thrift_get_queue_stats(
-                self.client, self.cpu_queue4)
-            self.assertEqual(
-                post_stats["SAI_QUEUE_STAT_PACKETS"],
-                pre_stats["SAI_QUEUE_STAT_PACKETS"] + 1)
+            # poll the queue stats until the trapped packet is counted,
+            # waiting about 4 seconds in total at most
+            for delay in (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0):
+                time.sleep(delay)
+                post_stats = sai_thrift_get_queue_stats(
+                    self.client, self.cpu_queue4)
+                if post_stats["SAI_QUEUE_STAT_PACKETS"]:
+                    break
+            self.assertEqual(post_stats["SAI_QUEUE_STAT_PACKETS"], 1)
 
         finally:
             sai_thrift_remove_hostif_trap(self.client, dnat_trap)
@@ -2929,100 +2133,67 @@ class NatTest(SaiHelper):
         print("natRouteTest")
 
         # send the test packet(s)
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.ip_addr,
-                                ip_src=self.src_ip,
-                                ip_id=105,
-                                ip_ttl=64)
-        exp_pkt = simple_tcp_packet(eth_dst=self.dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_dst=self.ip_addr,
-                                    ip_src=self.src_ip,
-                                    ip_id=105,
-                                    ip_ttl=63)
+        # all packets are sent first and then verified in the sending
+        # order, so the expected packet is copied before it is changed
+        pkt = self.pkt.copy()
+        exp_pkt = self.exp_pkt.copy()
+        pkt[TCP].sport = exp_pkt[TCP].sport = 1234
+        pkt[TCP].dport = exp_pkt[TCP].dport = 80
+        exp_pkts = []
+
+        pkt[IP].dst = exp_pkt[IP].dst = self.ip_addr
+        pkt[IP].src = exp_pkt[IP].src = self.src_ip
+        exp_pkt[Ether].dst = self.dmac
         send_packet(self, self.dev_port24, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port25])
-
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.nhop_ip,
-                                ip_src=self.src_ip,
-                                ip_id=105,
-                                ip_ttl=64)
-        exp_pkt = simple_tcp_packet(eth_dst=self.dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_dst=self.nhop_ip,
-                                    ip_src=self.src_ip,
-                                    ip_id=105,
-                                    ip_ttl=63)
+        exp_pkts.append(exp_pkt.copy())
+
+        pkt[IP].dst = exp_pkt[IP].dst = self.nhop_ip
         send_packet(self, self.dev_port24, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port25])
-
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.server_ip,
-                                ip_src=self.nhop_ip,
-                                ip_id=105,
-                                ip_ttl=64)
-        exp_pkt = simple_tcp_packet(eth_dst=self.server_dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_src=self.nhop_ip,
-                                    ip_dst=self.server_ip,
-                                    ip_id=105,
-                                    ip_ttl=63)
+        exp_pkts.append(exp_pkt.copy())
+
+        pkt[IP].dst = exp_pkt[IP].dst = self.server_ip
+        pkt[IP].src = exp_pkt[IP].src = self.nhop_ip
+        exp_pkt[Ether].dst = self.server_dmac
         send_packet(self, self.dev_port25, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port24])
+        exp_pkts.append(exp_pkt)
+
+        verify_each_packet_on_each_port(
+            self, exp_pkts,
+            [self.dev_port25, self.dev_port25, self.dev_port24])
 
     def natSourceTest(self):
         """Verifies SNAT"""
         print("natSourceTest")
         # Validate server to WAN
         # Translate server-ip to public ip
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.ip_addr,
-                                ip_src=self.server_ip,
-                                ip_id=105,
-                                ip_ttl=64)
-        exp_pkt = simple_tcp_packet(eth_dst=self.dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_dst=self.ip_addr,
-                                    ip_src=self.translate_server_ip,
-                                    ip_id=105,
-                                    ip_ttl=63)
+        pkt = self.pkt.copy()
+        exp_pkt = self.exp_pkt.copy()
+        pkt[TCP].sport = exp_pkt[TCP].sport = 1234
+        pkt[TCP].dport = exp_pkt[TCP].dport = 80
+
+        pkt[IP].dst = exp_pkt[IP].dst = self.ip_addr
+        pkt[IP].src = self.server_ip
+        exp_pkt[IP].src = self.translate_server_ip
+        exp_pkt[Ether].dst = self.dmac
         send_packet(self, self.dev_port24, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port25])
+        exp_ip_pkt = exp_pkt.copy()
 
         # Translate server-ip + port to public ip + port
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.ip_addr,
-                                ip_src=self.server_ip,
-                                ip_id=105,
-                                ip_ttl=64,
-                                tcp_sport=100)
-        exp_pkt = simple_tcp_packet(eth_dst=self.dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_dst=self.ip_addr,
-                                    ip_src=self.translate_server_ip,
-                                    ip_id=105,
-                                    ip_ttl=63,
-                                    tcp_sport=500)
+        pkt[TCP].sport = 100
+        exp_pkt[TCP].sport = 500
         send_packet(self, self.dev_port24, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port25])
 
-        ret_attr = sai_thrift_get_nat_entry_attribute(
-            client=self.client,
-            nat_entry=self.nats[3],
-            packet_count=True)
-        self.assertEqual(ret_attr["packet_count"], 1)
-        print("Packet count %d" % (ret_attr["packet_count"]))
+        # both packets are sent before verification, in the sending order
+        verify_each_packet_on_each_port(
+            self, [exp_ip_pkt, exp_pkt], [self.dev_port25] * 2)
 
         ret_attr = sai_thrift_get_nat_entry_attribute(
             client=self.client,
             nat_entry=self.nats[3],
+            packet_count=True,
             hit_bit=True)
+        self.assertEqual(ret_attr["packet_count"], 1)
+        print("Packet count %d" % (ret_attr["packet_count"]))
         self.assertEqual(ret_attr["hit_bit"], True)
         print("1st query - Hit bit %r" % (ret_attr["hit_bit"]))
 
@@ -3048,38 +2219,26 @@ class NatTest(SaiHelper):
         """Verifies DNAT"""
         print("natDestTest")
         # Translate public-ip to server-ip
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.translate_server_ip,
-                                ip_src=self.ip_addr,
-                                ip_id=105,
-                                ip_ttl=64)
-        exp_pkt = simple_tcp_packet(eth_dst=self.server_dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_dst=self.server_ip,
-                                    ip_src=self.ip_addr,
-                                    ip_id=105,
-                                    ip_ttl=63)
+        pkt = self.pkt.copy()
+        exp_pkt = self.exp_pkt.copy()
+        pkt[TCP].sport = exp_pkt[TCP].sport = 1234
+        pkt[TCP].dport = exp_pkt[TCP].dport = 80
+
+        pkt[IP].dst = self.translate_server_ip
+        exp_pkt[IP].dst = self.server_ip
+        pkt[IP].src = exp_pkt[IP].src = self.ip_addr
+        exp_pkt[Ether].dst = self.server_dmac
         send_packet(self, self.dev_port25, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port24])
+        exp_ip_pkt = exp_pkt.copy()
 
         # Translate public-ip + port to server-ip + port
-        pkt = simple_tcp_packet(eth_dst=ROUTER_MAC,
-                                eth_src=self.dmac2,
-                                ip_dst=self.translate_server_ip,
-                                ip_src=self.ip_addr,
-                                ip_id=105,
-                                ip_ttl=64,
-                                tcp_dport=1234)
-        exp_pkt = simple_tcp_packet(eth_dst=self.server_dmac,
-                                    eth_src=ROUTER_MAC,
-                                    ip_dst=self.server_ip,
-                                    ip_src=self.ip_addr,
-                                    ip_id=105,
-                                    ip_ttl=63,
-                                    tcp_dport=2000)
+        pkt[TCP].dport = 1234
+        exp_pkt[TCP].dport = 2000
         send_packet(self, self.dev_port25, pkt)
-        verify_packets(self, exp_pkt, [self.dev_port24])
+
+        # both packets are sent before verification, in the sending order
+        verify_each_packet_on_each_port(
+            self, [exp_ip_pkt, exp_pkt], [self.dev_port24] * 2)
 
         ret_attr = sai_thrift_get_nat_entry_attribute(
             client=self.client,
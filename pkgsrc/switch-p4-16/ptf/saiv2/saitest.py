@@ -70,37 +70,30 @@ class FrameworkTester(SaiHelper):
             switch_id=self.switch_id,
             destination=sai_ipprefix('20.20.20.1/16'),
             vr_id=self.default_vrf)
-        status = sai_thrift_create_route_entry(
-            self.client, self.route0, next_hop_id=self.nhop)
-        self.assertEqual(status, SAI_STATUS_SUCCESS)
         self.route1 = sai_thrift_route_entry_t(
             switch_id=self.switch_id,
             destination=sai_ipprefix('4441::1/64'),
             vr_id=self.default_vrf)
-        status = sai_thrift_create_route_entry(
-            self.client, self.route1, next_hop_id=self.nhop)
-        self.assertEqual(status, SAI_STATUS_SUCCESS)
         self.route2 = sai_thrift_route_entry_t(
             switch_id=self.switch_id,
             destination=sai_ipprefix('4411::1/63'),
             vr_id=self.default_vrf)
-        status = sai_thrift_create_route_entry(
-            self.client, self.route2, next_hop_id=self.nhop)
-        self.assertEqual(status, SAI_STATUS_SUCCESS)
         self.route3 = sai_thrift_route_entry_t(
             switch_id=self.switch_id,
             destination=sai_ipprefix('4423::1/65'),
             vr_id=self.default_vrf)
-        status = sai_thrift_create_route_entry(
-            self.client, self.route3, next_hop_id=self.nhop)
-        self.assertEqual(status, SAI_STATUS_SUCCESS)
         self.route4 = sai_thrift_route_entry_t(
             switch_id=self.switch_id,
             destination=sai_ipprefix('4444::1/127'),
             vr_id=self.default_vrf)
-        status = sai_thrift_create_route_entry(
-            self.client, self.route4, next_hop_id=self.nhop)
-        self.assertEqual(status, SAI_STATUS_SUCCESS)
+        self.routes = [self.route0, self.route1, self.route2,
+                       self.route3, self.route4]
+        with SaiPipeline(self.client) as pipeline:
+            for route in self.routes:
+                sai_thrift_create_route_entry(
+                    pipeline, route, next_hop_id=self.nhop)
+        self.assertEqual(pipeline.statuses,
+                         [SAI_STATUS_SUCCESS] * len(self.routes))
 
         # test qos map creation
         dscp_to_tc_1 = sai_thrift_qos_map_t(
@@ -136,21 +129,19 @@ class FrameworkTester(SaiHelper):
                     count=2, maplist=[]))
             self.assertEqual(attr['map_to_value_list'].count,
                              self.qos_map_list.count)
-            for i in range(0, self.qos_map_list.count):
-                self.assertEqual(attr['map_to_value_list'].maplist[i].key.dscp,
-                                 self.qos_map_list.maplist[i].key.dscp)
-                self.assertEqual(attr['map_to_value_list'].maplist[i].value.tc,
-                                 self.qos_map_list.maplist[i].value.tc)
+            self.assertEqual(
+                [(qos_map.key.dscp, qos_map.value.tc)
+                 for qos_map in attr['map_to_value_list'].maplist],
+                [(qos_map.key.dscp, qos_map.value.tc)
+                 for qos_map in self.qos_map_list.maplist])
         finally:
             pass
 
     def tearDown(self):
         sai_thrift_remove_qos_map(self.client, self.qos_map)
-        sai_thrift_remove_route_entry(self.client, self.route4)
-        sai_thrift_remove_route_entry(self.client, self.route3)
-        sai_thrift_remove_route_entry(self.client, self.route2)
-        sai_thrift_remove_route_entry(self.client, self.route1)
-        sai_thrift_remove_route_entry(self.client, self.route0)
+        with SaiPipeline(self.client) as pipeline:
+            for route in reversed(self.routes):
+                sai_thrift_remove_route_entry(pipeline, route)
         sai_thrift_remove_neighbor_entry(self.client, self.neigh_entry)
         sai_thrift_remove_next_hop(self.client, self.nhop1)
         sai_thrift_remove_next_hop(self.client, self.nhop)